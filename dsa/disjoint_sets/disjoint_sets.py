@@ -1,3 +1,4 @@
+import array
 from collections.abc import Hashable, Iterable
 
 
@@ -6,64 +7,87 @@ class DisjointSets:
 
     Elements of sets must be Hashable and non-None. Each disjoint set is stored as a rooted tree.
 
+    Each element is mapped (once, at construction) to a small int index, and the trees themselves are stored in flat
+    int arrays indexed by that. So walking up a tree is just a sequence of int array loads, instead of hashing an
+    arbitrary Hashable element at every step.
+
+    The storage is private, since it's keyed by index rather than by element, and path halving rewrites parents on
+    every lookup; use connect and is_connected instead.
+
     Attributes:
-        parents (dict[Hashable, Hashable]): Map from element to its parent. If an element is the root, its parent will be None
-        sizes (dict[Hashable, int]): Map from each root element to the size of that disjoint set tree
+        _indices (dict[Hashable, int]): Map from element to its index in _parents and _sizes
+        _parents (array.array): Map from element index to its parent's index. If an element is the root, its parent will be -1
+        _sizes (array.array): Map from each root element index to the size of that disjoint set tree (stale for non-roots)
     """
 
     def __init__(self, elements: Iterable[Hashable]) -> None:
-        self.parents = {element: None for element in elements}
-        if None in self.parents:
+        self._indices = {element: index for index, element in enumerate(elements)}
+        if None in self._indices:
             raise ValueError(f"None is not a valid element.")
-        if len(self.parents) != len(elements):
+        if len(self._indices) != len(elements):
             raise ValueError(f"Duplicate elements passed in; this is not allowed.")
-        self.sizes = {element: 1 for element in self.parents}
+        n = len(self._indices)
+        self._parents = array.array("i", [-1]) * n
+        self._sizes = array.array("i", [1]) * n
 
     def __len__(self) -> int:
-        return len(self.parents)
+        return len(self._indices)
 
     def _validate_element(self, e: Hashable) -> None:
         if e is None:
             raise ValueError(f"None is not a valid element.")
-        if e not in self.parents:
+        if e not in self._indices:
             raise ValueError(f"Unrecognized element {e=}")
 
-    def _find_root(self, e: Hashable) -> Hashable:
-        self._validate_element(e)
-
-        # find root
-        root = e
-        while self.parents[root] is not None:
-            root = self.parents[root]
+    def _find_root(self, i: int) -> int:
+        """Returns the index of the root of the tree containing the element with (already validated) index i."""
+        # path halving: find the root in one pass, pointing every other node on the path to its grandparent as we go.
+        # This gets the same amortized complexity as full path compression (which needs a second pass).
+        parents = self._parents
+        while parents[i] != -1:
+            grandparent = parents[parents[i]]
+            if grandparent == -1:
+                return parents[i]
+            parents[i] = grandparent
+            i = grandparent
 
-        # path compression
-        while self.parents[e] is not None:
-            parent = self.parents[e]
-            self.parents[e] = root
-            e = parent
+        return i
 
-        return root
+    def connect(self, e1: Hashable, e2: Hashable) -> bool:
+        """Connects the sets of e1 and e2. Returns True if they were disjoint (and so were merged); False if they were
+        already connected.
 
-    def connect(self, e1: Hashable, e2: Hashable) -> None:
+        The return value lets callers that need both (e.g., cycle detection) skip a separate is_connected call, which
+        would find both roots again.
+        """
         # not calling is_connected to avoid duplicate work of finding roots
         self._validate_element(e1)
         self._validate_element(e2)
-        root1 = self._find_root(e1)
-        root2 = self._find_root(e2)
+        i1 = self._indices[e1]
+        i2 = self._indices[e2]
+        if i1 == i2:
+            return False  # trivially connected; no need to find roots
+        root1 = self._find_root(i1)
+        root2 = self._find_root(i2)
         if root1 == root2:
-            return  # already connected
-        size1 = self.sizes[root1]
-        size2 = self.sizes[root2]
+            return False  # already connected
+        size1 = self._sizes[root1]
+        size2 = self._sizes[root2]
         # arbitrarily let tree 1 be the larger tree
-        if self.sizes[root2] > self.sizes[root1]:
+        if size2 > size1:
             root1, size1, root2, size2 = root2, size2, root1, size1
-        self.parents[root2] = root1
-        self.sizes[root1] = self.sizes[root1] + self.sizes[root2]
-        del self.sizes[root2]
+        self._parents[root2] = root1
+        # no need to clear sizes[root2]; sizes is only ever read for current roots
+        self._sizes[root1] = size1 + size2
+        return True
 
     def is_connected(self, e1: Hashable, e2: Hashable) -> bool:
         self._validate_element(e1)
         self._validate_element(e2)
-        root1 = self._find_root(e1)
-        root2 = self._find_root(e2)
+        i1 = self._indices[e1]
+        i2 = self._indices[e2]
+        if i1 == i2:
+            return True  # no need to find roots
+        root1 = self._find_root(i1)
+        root2 = self._find_root(i2)
         return root1 == root2
@@ -24,7 +24,7 @@ class TestDisjointSets:
                     assert not ds.is_connected(i, j)
                     assert not ds.is_connected(i, j)
 
-        ds.connect(0, 4)
+        assert ds.connect(0, 4)
         for _ in range(2):
             # run these twice to make sure calling the same is_connected sequence repeatedly doesn't cause issues
             assert ds.is_connected(0, 4)
@@ -37,8 +37,9 @@ class TestDisjointSets:
             assert not ds.is_connected(4, 3)
 
         # make sure calling the same exact connect repeatedly doesn't cause issues
-        ds.connect(2, 1)
-        ds.connect(2, 1)
+        assert ds.connect(2, 1)
+        assert not ds.connect(2, 1)
+        assert not ds.connect(3, 3)
         assert ds.is_connected(2, 1)
         assert ds.is_connected(4, 0)
         assert ds.is_connected(3, 3)
@@ -46,15 +47,15 @@ class TestDisjointSets:
         assert not ds.is_connected(3, 1)
 
         # make sure calling the same connect with order switched repeatedly doesn't cause issues
-        ds.connect(3, 1)
-        ds.connect(1, 3)
+        assert ds.connect(3, 1)
+        assert not ds.connect(1, 3)
         assert ds.is_connected(0, 4)
         assert ds.is_connected(2, 1)
         assert ds.is_connected(3, 1)
         assert not ds.is_connected(3, 4)
 
         # connect them all
-        ds.connect(3, 4)
+        assert ds.connect(3, 4)
         for i in range(5):
             for j in range(5):
                 assert ds.is_connected(j, i)
@@ -1,10 +1,11 @@
-from collections.abc import Hashable
+from collections.abc import Hashable, Iterable
 
 import numpy as np
 
 from dsa.graphs.analysis.connected_components.connected_components import is_connected
 from dsa.graphs.digraph import Digraph
 from dsa.graphs.graph import Graph
+from dsa.utils import get_key_to_index
 
 
 def get_degree_centrality(g: Graph, u: Hashable, normalized: bool = True) -> float:
@@ -15,11 +16,34 @@ def get_degree_centrality(g: Graph, u: Hashable, normalized: bool = True) -> flo
     return deg
 
 
-# TODO test this
-def get_sorted_degree_centralities(g: Graph, normalized: bool = True) -> float:
-    degs = [get_degree_centrality(g, u, normalized=normalized) for u in g]
-    degs.sort()
-    return degs
+def get_degree_centralities(g: Graph, normalized: bool = True) -> dict[Hashable, float]:
+    """Return a map from each node to its (normalized) degree centrality in graph g. If you want the centralities of
+    many nodes, this is more efficient than calling get_degree_centrality for each, since the normalization is one
+    vectorized divide instead of a division per node."""
+    nodes = g.get_nodes()
+    degs = np.fromiter(
+        (g.get_degree(u) for u in nodes), dtype=np.int64, count=len(nodes)
+    )
+    if normalized:
+        return dict(zip(nodes, (degs / (len(g) - 1)).tolist()))
+    return dict(zip(nodes, degs.tolist()))
+
+
+def get_sorted_degree_centralities(g: Graph, normalized: bool = True) -> list[float]:
+    return _get_sorted_centralities(map(g.get_degree, g), len(g), normalized)
+
+
+def _get_sorted_centralities(
+    degrees: Iterable[int], n: int, normalized: bool
+) -> list[float]:
+    """Returns the n degrees in sorted order, each divided by n - 1 if normalized."""
+    degs = np.fromiter(degrees, dtype=np.int64, count=n)
+    # sort in numpy rather than sorting a list of Python ints
+    degs = np.sort(degs)
+    if not normalized:
+        return degs.tolist()
+    # normalize with one vectorized divide instead of a division per node
+    return (degs / (n - 1)).tolist()
 
 
 # TODO test this
@@ -35,33 +59,106 @@ def get_eigvec_centrality(g: Graph, u: Hashable, normalization: str = "l1") -> f
     return eigvec_centralities[u_index]
 
 
-def get_eigvec_centralities(g: Graph, normalization: str = "l1") -> list[float]:
+def get_eigvec_centralities(
+    g: Graph, normalization: str = "l1", max_iter: int = 1000, tol: float = 1e-7
+) -> list[float]:
     """Return the normalized eigenvector centrality measures in graph g.
 
     Normalized means most central node has centrality of 1.
     NOTE: A ValueError is raised if g isn't connected, since eigenvector centrality is only well-defined for connected graphs.
+
+    The dominant eigenvector is found by power iteration on a sparse (COO) adjacency, so only O(n + m) memory is
+    needed instead of a dense n x n matrix. We iterate with A + I rather than A: it has the same eigenvectors, but
+    its dominant eigenvalue is strictly the largest in magnitude, so power iteration also converges on bipartite
+    graphs (e.g., trees), where A has both +lambda and -lambda as eigenvalues.
+
+    The iteration stops once the remaining error is estimated to be below tol per node. The change between iterates
+    alone understates the error when convergence is slow, so it's scaled by the observed convergence rate (the ratio
+    of successive changes), since the remaining error is at most about change / (1 - rate).
+
+    Power iteration converges at a rate set by the gap between the two largest eigenvalues, which is tiny on long
+    paths and similar graphs. If it hasn't converged within max_iter iterations, we fall back to a dense eigensolver,
+    trading O(n^2) memory for an exact answer.
     """
     if normalization not in ("l1", "l2"):
         raise ValueError(f"Unrecognized {normalization=}")
+    # fast paths for tiny graphs, whose centralities are known analytically; these skip the connectivity check too
+    if len(g) == 0:
+        return []
+    if len(g) == 1:
+        return [1.0]
+    if len(g) == 2 and g.get_degree(next(iter(g))) >= 1:
+        # the only (connected) graph on 2 nodes is a single edge, and both nodes are equally central
+        return [0.5, 0.5] if normalization == "l1" else [1 / np.sqrt(2)] * 2
     if not is_connected(g):
         raise ValueError(
             "g must be connected for eigenvector centrality to be well-defined."
         )
-    A = np.array(g.A)
-    eigvals, eigvecs = np.linalg.eig(A)
-    max_eigval_index = eigvals.argmax()
-    eigvec_for_max_eigval = eigvecs[:, max_eigval_index]
-    if eigvec_for_max_eigval[0] < 0:
-        # we want all positive, not all negative
-        eigvec_for_max_eigval = -eigvec_for_max_eigval
+    n = len(g)
+    # A @ x is just a weighted bincount over the nonzero entries of A
+    rows, cols = _get_coo_adjacency(g)
+    x = np.full(n, 1 / np.sqrt(n))
+    delta_prev = np.inf
+    for _ in range(max_iter):
+        x_prev = x
+        x = x + np.bincount(rows, weights=x[cols], minlength=n)
+        x = x / np.linalg.norm(x)
+        delta = np.abs(x - x_prev).sum()
+        if delta < delta_prev and delta < n * tol * (1 - delta / delta_prev):
+            break
+        delta_prev = delta
+    else:
+        x = _get_dense_dominant_eigvec(
+            rows, cols, n, symmetric=not isinstance(g, Digraph)
+        )
     if normalization == "l1":
         # don't need to do abs value since all elements are non-negative
-        eigvec_for_max_eigval = eigvec_for_max_eigval / np.sum(eigvec_for_max_eigval)
+        x = x / np.sum(x)
+    return list(x)
+
+
+def _get_coo_adjacency(g: Graph) -> tuple[np.ndarray, np.ndarray]:
+    """Returns the adjacency of g in COO format (rows, cols), with nodes indexed in the same (sorted) order as g.A.
+
+    Each undirected edge (u, v) is stored once in g, so it's mirrored here into the two entries (u, v) and (v, u). For
+    a digraph, each edge u->v is the single entry (v, u), as in g.A, so a node's centrality comes from its
+    in-neighbors. The entries are in no particular order, which is fine for a matvec.
+    """
+    try:
+        nodes = sorted(g.get_nodes())
+    except TypeError:
+        raise ValueError("Nodes not sortable")
+    node_to_index = get_key_to_index(nodes)
+    edges = g.get_edges()
+    ends = np.fromiter(
+        (node_to_index[node] for edge in edges for node in edge),
+        dtype=np.int64,
+        count=2 * len(edges),
+    ).reshape(-1, 2)
+    if isinstance(g, Digraph):
+        return ends[:, 1], ends[:, 0]
+    rows = np.concatenate((ends[:, 0], ends[:, 1]))
+    cols = np.concatenate((ends[:, 1], ends[:, 0]))
+    return rows, cols
+
+
+def _get_dense_dominant_eigvec(
+    rows: np.ndarray, cols: np.ndarray, n: int, symmetric: bool
+) -> np.ndarray:
+    """Returns the non-negative eigenvector for the largest eigenvalue of the n x n adjacency with COO entries
+    (rows, cols), which is symmetric for an undirected graph."""
+    A = np.zeros((n, n))
+    A[rows, cols] = 1
+    if symmetric:
+        # eigh returns the eigenvalues in ascending order
+        _, eigvecs = np.linalg.eigh(A)
+        x = eigvecs[:, -1]
     else:
-        eigvec_for_max_eigval = eigvec_for_max_eigval / np.linalg.norm(
-            eigvec_for_max_eigval
-        )
-    return list(eigvec_for_max_eigval)
+        # A is non-negative, so its largest eigenvalue (and that eigenvalue's eigenvector) is real
+        eigvals, eigvecs = np.linalg.eig(A)
+        x = eigvecs[:, eigvals.real.argmax()].real
+    # we want all positive, not all negative
+    return -x if x.sum() < 0 else x
 
 
 def get_in_degree_centrality(
@@ -74,11 +171,10 @@ def get_in_degree_centrality(
     return deg
 
 
-# TODO test this
-def get_sorted_in_degree_centralities(dg: Digraph, normalized: bool = True) -> float:
-    degs = [get_in_degree_centrality(dg, u, normalized=normalized) for u in dg]
-    degs.sort()
-    return degs
+def get_sorted_in_degree_centralities(
+    dg: Digraph, normalized: bool = True
+) -> list[float]:
+    return _get_sorted_centralities(map(dg.get_in_degree, dg), len(dg), normalized)
 
 
 def get_out_degree_centrality(
@@ -91,8 +187,7 @@ def get_out_degree_centrality(
     return deg
 
 
-# TODO test this
-def get_sorted_out_degree_centralities(dg: Digraph, normalized: bool = True) -> float:
-    degs = [get_out_degree_centrality(dg, u, normalized=normalized) for u in dg]
-    degs.sort()
-    return degs
+def get_sorted_out_degree_centralities(
+    dg: Digraph, normalized: bool = True
+) -> list[float]:
+    return _get_sorted_centralities(map(dg.get_out_degree, dg), len(dg), normalized)
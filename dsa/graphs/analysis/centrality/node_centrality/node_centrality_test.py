@@ -1,10 +1,15 @@
+import numpy as np
 import pytest
 
 from dsa.graphs.analysis.centrality.node_centrality.node_centrality import (
+    get_degree_centralities,
     get_degree_centrality,
     get_eigvec_centralities,
     get_in_degree_centrality,
     get_out_degree_centrality,
+    get_sorted_degree_centralities,
+    get_sorted_in_degree_centralities,
+    get_sorted_out_degree_centralities,
 )
 from dsa.graphs.digraph import Digraph
 from dsa.graphs.digraph_factory import DigraphFactory
@@ -58,6 +63,47 @@ def test_get_degree_centrality() -> None:
     assert get_degree_centrality(g, 5, normalized=True) == pytest.approx(4 / 5)
 
 
+def test_get_degree_centralities() -> None:
+    g = Graph(nodes=4, edges=((0, 1), (1, 2), (2, 3), (0, 2)))
+    assert get_degree_centralities(g, normalized=False) == {0: 2, 1: 2, 2: 3, 3: 1}
+    assert get_degree_centralities(g, normalized=True) == pytest.approx(
+        {0: 2 / 3, 1: 2 / 3, 2: 1, 3: 1 / 3}
+    )
+    # exactly the same as computing each node's centrality separately
+    for g in (
+        GraphFactory.create_complete_graph(50),
+        GraphFactory.create_b_ary_tree(3, 4),
+        GraphFactory.create_look_ahead_graph(30, 4),
+    ):
+        for normalized in (False, True):
+            centralities = get_degree_centralities(g, normalized=normalized)
+            for u in g:
+                assert centralities[u] == get_degree_centrality(g, u, normalized)
+                assert type(centralities[u]) is type(
+                    get_degree_centrality(g, u, normalized)
+                )
+
+
+def test_get_sorted_degree_centralities() -> None:
+    g = Graph(nodes=4, edges=((0, 1), (1, 2), (2, 3), (0, 2)))
+    assert get_sorted_degree_centralities(g, normalized=False) == [1, 2, 2, 3]
+    assert get_sorted_degree_centralities(g, normalized=True) == pytest.approx(
+        [1 / 3, 2 / 3, 2 / 3, 1]
+    )
+    # exactly the same as sorting each node's centrality
+    g = GraphFactory.create_look_ahead_graph(30, 4)
+    for normalized in (False, True):
+        expected = sorted(get_degree_centrality(g, u, normalized) for u in g)
+        actual = get_sorted_degree_centralities(g, normalized=normalized)
+        assert actual == expected
+        assert [type(c) for c in actual] == [type(c) for c in expected]
+
+
+def _get_dense_eigvec_centralities(g: Graph) -> np.ndarray:
+    eigvals, eigvecs = np.linalg.eigh(np.array(g.A))
+    return np.abs(eigvecs[:, eigvals.argmax()])
+
+
 def test_get_eigenvector_centralities() -> None:
     # examples from: https://www2.stat.duke.edu/~pdh10/Teaching/567/Notes/l6_centrality_paused.pdf
     # star graph
@@ -72,6 +118,62 @@ def test_get_eigenvector_centralities() -> None:
     assert centralities == pytest.approx(
         [0.2705981, 0.5, 0.6532815, 0.3535534, 0.3535534]
     )
+    # tiny graphs
+    assert get_eigvec_centralities(Graph(nodes=0)) == []
+    assert get_eigvec_centralities(Graph(nodes=1)) == [1.0]
+    g = Graph(nodes=2, edges=((0, 1),))
+    assert get_eigvec_centralities(g) == [0.5, 0.5]
+    assert get_eigvec_centralities(g, normalization="l2") == pytest.approx(
+        [2**-0.5, 2**-0.5]
+    )
+    with pytest.raises(ValueError):
+        get_eigvec_centralities(Graph(nodes=2))
+    # graphs that power iteration converges on
+    for g in (
+        Graph(nodes=5, edges=((0, 2), (1, 2), (2, 3), (2, 4))),
+        Graph(nodes=5, edges=((0, 1), (1, 2), (2, 3), (2, 4))),
+        GraphFactory.create_spindly_tree(20),
+        GraphFactory.create_b_ary_tree(2, 6),
+        GraphFactory.create_b_ary_tree(20, 1),
+        GraphFactory.create_complete_graph(50),
+        GraphFactory.create_cycle(30),
+    ):
+        expected = _get_dense_eigvec_centralities(g)
+        assert get_eigvec_centralities(g, normalization="l2") == pytest.approx(
+            expected, abs=1e-6
+        )
+        assert get_eigvec_centralities(g) == pytest.approx(
+            expected / expected.sum(), abs=1e-6
+        )
+
+
+def test_get_eigenvector_centralities_digraph() -> None:
+    # a node's centrality comes from its in-neighbors; 3 has the same single in-neighbor as 0
+    dg = Digraph(nodes=4, edges=((0, 1), (1, 2), (2, 0), (2, 3)))
+    assert get_eigvec_centralities(dg) == pytest.approx([0.25] * 4)
+    # the long cycle converges too slowly for power iteration, so it exercises the dense fallback
+    for dg in (
+        Digraph(nodes=4, edges=((0, 1), (1, 2), (2, 3), (3, 0), (0, 2))),
+        Digraph(
+            nodes=100, edges=tuple((i, (i + 1) % 100) for i in range(100)) + ((0, 50),)
+        ),
+    ):
+        eigvals, eigvecs = np.linalg.eig(np.array(dg.A))
+        expected = np.abs(eigvecs[:, eigvals.real.argmax()].real)
+        assert get_eigvec_centralities(dg, normalization="l2") == pytest.approx(
+            expected, abs=1e-6
+        )
+        assert get_eigvec_centralities(dg) == pytest.approx(
+            expected / expected.sum(), abs=1e-6
+        )
+
+
+def test_get_eigenvector_centralities_long_path() -> None:
+    # the spectral gap of a long path is too small for power iteration to converge within max_iter
+    g = GraphFactory.create_spindly_tree(100)
+    expected = _get_dense_eigvec_centralities(g)
+    assert get_eigvec_centralities(g, normalization="l2") == pytest.approx(expected)
+    assert get_eigvec_centralities(g) == pytest.approx(expected / expected.sum())
 
 
 def test_get_in_degree_centrality() -> None:
@@ -110,3 +212,26 @@ def test_get_out_degree_centrality() -> None:
     for u in range(4):
         assert get_out_degree_centrality(dg, u, normalized=False) == 3
         assert get_out_degree_centrality(dg, u, normalized=True) == pytest.approx(1)
+
+
+def test_get_sorted_in_and_out_degree_centralities() -> None:
+    dg = DigraphFactory.create_spindly_tree(5)
+    assert get_sorted_in_degree_centralities(dg, normalized=False) == [0, 1, 1, 1, 1]
+    assert get_sorted_in_degree_centralities(dg, normalized=True) == pytest.approx(
+        [0, 1 / 4, 1 / 4, 1 / 4, 1 / 4]
+    )
+    assert get_sorted_out_degree_centralities(dg, normalized=False) == [0, 1, 1, 1, 1]
+    assert get_sorted_out_degree_centralities(dg, normalized=True) == pytest.approx(
+        [0, 1 / 4, 1 / 4, 1 / 4, 1 / 4]
+    )
+    # exactly the same as sorting each node's centrality
+    dg = DigraphFactory.create_complete_digraph(7)
+    for normalized in (False, True):
+        for get_sorted_centralities, get_centrality in (
+            (get_sorted_in_degree_centralities, get_in_degree_centrality),
+            (get_sorted_out_degree_centralities, get_out_degree_centrality),
+        ):
+            expected = sorted(get_centrality(dg, u, normalized) for u in dg)
+            actual = get_sorted_centralities(dg, normalized=normalized)
+            assert actual == expected
+            assert [type(c) for c in actual] == [type(c) for c in expected]
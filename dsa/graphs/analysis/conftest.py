@@ -0,0 +1,45 @@
+"""Graphs shared by the analysis tests.
+
+These are built once per test session rather than once per (parametrized) test, so tests must not mutate them.
+"""
+
+import pytest
+
+from dsa.graphs.graph import Graph
+from dsa.graphs.graph_factory import GraphFactory
+
+
+def pytest_configure(config: pytest.Config) -> None:
+    config.addinivalue_line(
+        "markers", 'slow: large cases; deselect with -m "not slow" for a quick run'
+    )
+
+
+@pytest.fixture(scope="session")
+def g_complete() -> Graph:
+    return GraphFactory.create_complete_graph(4)
+
+
+@pytest.fixture(scope="session")
+def g_spindly_tree() -> Graph:
+    return GraphFactory.create_spindly_tree(5)
+
+
+@pytest.fixture(scope="session")
+def g_complete_complete(g_complete: Graph) -> Graph:
+    return GraphFactory.concat_int_graphs((g_complete, g_complete))
+
+
+@pytest.fixture(scope="session")
+def g_complete_spindly_tree(g_complete: Graph, g_spindly_tree: Graph) -> Graph:
+    return GraphFactory.concat_int_graphs((g_complete, g_spindly_tree))
+
+
+@pytest.fixture(scope="session")
+def g_spindly_tree_complete(g_spindly_tree: Graph, g_complete: Graph) -> Graph:
+    return GraphFactory.concat_int_graphs((g_spindly_tree, g_complete))
+
+
+@pytest.fixture(scope="session")
+def g_spindly_tree_spindly_tree(g_spindly_tree: Graph) -> Graph:
+    return GraphFactory.concat_int_graphs((g_spindly_tree, g_spindly_tree))
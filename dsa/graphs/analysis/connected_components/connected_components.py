@@ -1,4 +1,6 @@
-from collections.abc import Hashable
+from collections.abc import Callable, Hashable
+
+import numpy as np
 
 from dsa.graphs.analysis.traversal.bfs import bfs
 from dsa.graphs.analysis.traversal.dfs import dfs
@@ -6,13 +8,28 @@ from dsa.graphs.analysis.traversal.dijkstra import dijkstra
 from dsa.graphs.analysis.traversal_type import TraversalType
 from dsa.graphs.digraph import Digraph
 from dsa.graphs.graph import Graph
-from dsa.graphs.transformations.transformations import reverse
 from dsa.utils import get_key_to_index
 
+# map from traversal type to a function getting the connected components with it; the CCs are at different
+# positions in each traversal's return values
+_GET_CONNECTED_COMPONENTS: dict[
+    TraversalType, Callable[[Graph], list[list[Hashable]]]
+] = {
+    TraversalType.DFS: lambda g: dfs(g)[-3],
+    TraversalType.BFS: lambda g: bfs(g)[-2],
+    TraversalType.DIJKSTRA: lambda g: dijkstra(g)[-2],
+}
+
 
 def is_connected(g: Graph) -> bool:
-    """Returns if the graph is connected. NOTE: only for undirected graphs."""
-    return len(get_connected_components(g)) == 1
+    """Returns if the graph is connected. NOTE: only for undirected graphs.
+
+    Rather than finding every connected component, this just checks whether a single traversal reaches every node.
+    """
+    if len(g) == 0:
+        return False
+    indptr, indices = g.get_csr()
+    return _reaches_all_nodes(indptr, indices, 0)
 
 
 def get_connected_components(
@@ -29,28 +46,168 @@ def get_connected_components(
     Returns:
         list[list[Hashable]]: List of connected components (CC), where each CC is a list of nodes
     """
-    if traversal_type == TraversalType.DFS:
-        *_, ccs, _, _ = dfs(g)
-    elif traversal_type == TraversalType.BFS:
-        *_, ccs, _ = bfs(g)
-    elif traversal_type == TraversalType.DIJKSTRA:
-        *_, ccs, _ = dijkstra(g)
-    else:
+    try:
+        get_ccs = _GET_CONNECTED_COMPONENTS[traversal_type]
+    except KeyError:
         raise ValueError(f"Unrecognized {traversal_type=}")
-    return ccs
+    return get_ccs(g)
 
 
 def is_strongly_connected(dg: Digraph) -> bool:
-    return len(get_strongly_connected_components(dg)) == 1
+    """Returns if the digraph is strongly connected.
+
+    Rather than finding every strongly connected component, this uses the fact that dg is strongly connected iff some
+    node s reaches every node, and every node reaches s (i.e., s reaches every node in the reverse of dg).
+    """
+    if len(dg) == 0:
+        return False
+    indptr, indices = dg.get_csr()
+    if not _reaches_all_nodes(indptr, indices, 0):
+        return False
+    indptr, indices = dg.get_in_csr()
+    return _reaches_all_nodes(indptr, indices, 0)
+
+
+# frontiers at least this wide are expanded with numpy; narrower ones with a plain Python loop, since numpy's
+# per-call overhead dominates when there are only a few nodes to expand (e.g., every level of a path graph)
+_MIN_VECTORIZED_FRONTIER = 64
+
+
+def _reaches_all_nodes(indptr: np.ndarray, indices: np.ndarray, s: int) -> bool:
+    """Returns whether node index s reaches every node in the CSR adjacency (indptr, indices).
+
+    Since nodes are indices here, reached nodes are tracked in a bytearray rather than a set: each check or update is
+    a direct byte load/store instead of hashing the node.
+
+    The search goes a level (frontier) at a time, since the order nodes are reached in doesn't matter here. A wide
+    frontier is expanded all at once with numpy: gather all of its neighbors with one fancy index into indices, mask
+    out the reached ones, and dedupe what's left. The bytearray is shared with a numpy view so both paths update the
+    same reached flags.
+    """
+    indptr_list = indptr.tolist()
+    indices_list = indices.tolist()
+    reached = bytearray(len(indptr_list) - 1)
+    reached_view = np.frombuffer(reached, dtype=np.uint8)
+    reached[s] = 1
+    frontier = [s]
+    while frontier:
+        if len(frontier) < _MIN_VECTORIZED_FRONTIER:
+            next_frontier = []
+            for u in frontier:
+                for v in indices_list[indptr_list[u] : indptr_list[u + 1]]:
+                    if not reached[v]:
+                        reached[v] = 1
+                        next_frontier.append(v)
+        else:
+            frontier_array = np.array(frontier)
+            starts = indptr[frontier_array]
+            degrees = indptr[frontier_array + 1] - starts
+            # position of every neighbor of the frontier in indices: each node's run starts at its indptr entry
+            offsets = np.cumsum(degrees) - degrees
+            positions = np.repeat(starts - offsets, degrees) + np.arange(degrees.sum())
+            neighbors = indices[positions]
+            new_nodes = np.unique(neighbors[reached_view[neighbors] == 0])
+            reached_view[new_nodes] = 1
+            next_frontier = new_nodes.tolist()
+        frontier = next_frontier
+    return reached.count(1) == len(reached)
 
 
-def get_strongly_connected_components(dg: Digraph) -> list[list[Hashable]]:
+def get_strongly_connected_components(
+    dg: Digraph, method: str = "kosaraju"
+) -> list[list[Hashable]]:
+    """Get strongly connected components (SCCs) in a digraph.
+
+    Args:
+        dg: Digraph
+        method: "kosaraju" for Kosaraju's algorithm, or "tarjan" for Tarjan's algorithm. Both return the SCCs in
+            reverse topological order (sinks first). Tarjan's only needs one DFS pass, so it does about half the
+            work.
+
+    Returns:
+        list[list[Hashable]]: List of SCCs, where each SCC is a list of nodes
+    """
+    if method == "kosaraju":
+        return _kosaraju_strongly_connected_components(dg)
+    elif method == "tarjan":
+        return _tarjan_strongly_connected_components(dg)
+    else:
+        raise ValueError(f"Unrecognized {method=}")
+
+
+def _kosaraju_strongly_connected_components(dg: Digraph) -> list[list[Hashable]]:
     """Get strongly connected components in a digraph using Kosaraju's algorithm."""
-    _, _, _, postorder, *_ = dfs(reverse(dg))
+    # traverse the reverse of dg via in-neighbors, rather than constructing it
+    _, _, _, postorder, *_ = dfs(dg, get_neighbors=dg.get_in_neighbors)
     sink_to_src_order = postorder[::-1]
     # now I need to call DFS, with seed order and neighbor order determiend by sink_to_src_order
     node_to_index = get_key_to_index(sink_to_src_order)
+    # pass the dict's bound __getitem__ as the sort key, rather than a lambda wrapping it, to save a Python-level
+    # call per neighbor
     *_, ccs, _, _ = dfs(
-        dg, seed_order=sink_to_src_order, neighbor_order=lambda u: node_to_index[u]
+        dg, seed_order=sink_to_src_order, neighbor_order=node_to_index.__getitem__
     )
     return ccs
+
+
+def _tarjan_strongly_connected_components(dg: Digraph) -> list[list[Hashable]]:
+    """Iterative Tarjan's algorithm.
+
+    Each node gets an index, in DFS preorder, and a lowlink: the smallest index of any node on the stack that's
+    reachable from the node's DFS subtree (via at most one non-tree edge). Nodes stay on the stack until their SCC is
+    complete. When a node's lowlink is its own index after exploring all its neighbors, nothing in its subtree reaches
+    back above it, so it's the root of an SCC: the SCC is it plus everything above it on the stack.
+
+    Instead of recursing, the DFS keeps an explicit stack of frames (node, iterator over its remaining neighbors), so
+    exploring a node can be paused when descending into a neighbor, and resumed afterwards.
+
+    This runs on dg's CSR adjacency, where nodes are ints (their indices in dg.get_nodes()), so index and lowlink are
+    lists and on_stack is a bytearray, rather than being keyed by hashing nodes.
+    """
+    nodes = dg.get_nodes()
+    indptr, indices = dg.get_csr()
+    indptr = indptr.tolist()
+    indices = indices.tolist()
+    index = [-1] * len(nodes)  # -1 means not yet visited
+    lowlink = [-1] * len(nodes)
+    next_index = 0
+    stack = []
+    on_stack = bytearray(len(nodes))
+    sccs = []
+    for s in range(len(nodes)):
+        if index[s] != -1:
+            continue
+        index[s] = lowlink[s] = next_index
+        next_index += 1
+        stack.append(s)
+        on_stack[s] = 1
+        frames = [(s, iter(indices[indptr[s] : indptr[s + 1]]))]
+        while frames:
+            u, neighbors = frames[-1]
+            for v in neighbors:
+                if index[v] == -1:
+                    # descend into v; u's exploration resumes from its iterator once v's is done
+                    index[v] = lowlink[v] = next_index
+                    next_index += 1
+                    stack.append(v)
+                    on_stack[v] = 1
+                    frames.append((v, iter(indices[indptr[v] : indptr[v + 1]])))
+                    break
+                elif on_stack[v]:
+                    lowlink[u] = min(lowlink[u], index[v])
+            else:
+                # done exploring u
+                frames.pop()
+                if frames:
+                    parent = frames[-1][0]
+                    lowlink[parent] = min(lowlink[parent], lowlink[u])
+                if lowlink[u] == index[u]:
+                    scc = []
+                    while True:
+                        w = stack.pop()
+                        on_stack[w] = 0
+                        scc.append(nodes[w])
+                        if w == u:
+                            break
+                    sccs.append(scc[::-1])
+    return sccs
@@ -3,47 +3,52 @@ import pytest
 from dsa.graphs.analysis.connected_components.connected_components import (
     get_connected_components,
     get_strongly_connected_components,
+    is_connected,
+    is_strongly_connected,
 )
 from dsa.graphs.analysis.traversal_type import TraversalType
 from dsa.graphs.digraph import Digraph
+from dsa.graphs.digraph_factory import DigraphFactory
+from dsa.graphs.graph import Graph
 from dsa.graphs.graph_factory import GraphFactory
 
 
 @pytest.mark.parametrize(
     "traversal_type", (TraversalType.DFS, TraversalType.BFS, TraversalType.DIJKSTRA)
 )
-def test_get_connected_components(traversal_type: TraversalType) -> None:
-    g_complete = GraphFactory.create_complete_graph(4)
+def test_get_connected_components(
+    traversal_type: TraversalType,
+    g_complete: Graph,
+    g_spindly_tree: Graph,
+    g_complete_complete: Graph,
+    g_complete_spindly_tree: Graph,
+    g_spindly_tree_complete: Graph,
+    g_spindly_tree_spindly_tree: Graph,
+) -> None:
     ccs = get_connected_components(g_complete, traversal_type=traversal_type)
     assert ccs == [list(range(4))]
 
-    g_spindly_tree = GraphFactory.create_spindly_tree(5)
     ccs = get_connected_components(g_spindly_tree, traversal_type=traversal_type)
     assert ccs == [list(range(5))]
 
-    ccs = get_connected_components(
-        GraphFactory.concat_int_graphs((g_complete, g_complete)),
-        traversal_type=traversal_type,
-    )
+    ccs = get_connected_components(g_complete_complete, traversal_type=traversal_type)
     assert ccs == [list(range(4)), list(range(4, 8))]
     ccs = get_connected_components(
-        GraphFactory.concat_int_graphs((g_complete, g_spindly_tree)),
-        traversal_type=traversal_type,
+        g_complete_spindly_tree, traversal_type=traversal_type
     )
     assert ccs == [list(range(4)), list(range(4, 9))]
     ccs = get_connected_components(
-        GraphFactory.concat_int_graphs((g_spindly_tree, g_complete)),
-        traversal_type=traversal_type,
+        g_spindly_tree_complete, traversal_type=traversal_type
     )
     assert ccs == [list(range(5)), list(range(5, 9))]
     ccs = get_connected_components(
-        GraphFactory.concat_int_graphs((g_spindly_tree, g_spindly_tree)),
-        traversal_type=traversal_type,
+        g_spindly_tree_spindly_tree, traversal_type=traversal_type
     )
     assert ccs == [list(range(5)), list(range(5, 10))]
 
 
-def test_get_strongly_connected_components() -> None:
+@pytest.mark.parametrize("method", ("kosaraju", "tarjan"))
+def test_get_strongly_connected_components(method: str) -> None:
     dg = Digraph(
         nodes="ABCDEFGHIJKL",
         edges=(
@@ -66,7 +71,8 @@ def test_get_strongly_connected_components() -> None:
             ("L", "J"),
         ),
     )
-    sccs = get_strongly_connected_components(dg)
+    sccs = get_strongly_connected_components(dg, method=method)
+    assert len(sccs) == 5
     sccs = set(tuple(scc) for scc in sccs)
     exp_sccs = [
         set(("G", "H", "I", "J", "K", "L")),
@@ -77,3 +83,35 @@ def test_get_strongly_connected_components() -> None:
     ]
     for scc in sccs:
         assert set(scc) in exp_sccs
+
+
+def test_get_strongly_connected_components_invalid_method() -> None:
+    with pytest.raises(ValueError):
+        get_strongly_connected_components(Digraph(nodes=1), method="blah")
+
+
+def test_is_connected(
+    g_complete: Graph, g_spindly_tree: Graph, g_spindly_tree_spindly_tree: Graph
+) -> None:
+    assert not is_connected(GraphFactory.create_complete_graph(0))
+    assert is_connected(GraphFactory.create_complete_graph(1))
+    assert is_connected(g_complete)
+    assert is_connected(g_spindly_tree)
+    assert not is_connected(g_spindly_tree_spindly_tree)
+    # wide enough frontiers to be expanded with numpy
+    g_wide = GraphFactory.create_complete_graph(100)
+    assert is_connected(g_wide)
+    assert not is_connected(GraphFactory.concat_int_graphs((g_wide, g_wide)))
+
+
+def test_is_strongly_connected() -> None:
+    assert not is_strongly_connected(Digraph())
+    assert is_strongly_connected(Digraph(nodes=1))
+    # every node is reachable from 0, but 0 isn't reachable from any other node
+    assert not is_strongly_connected(DigraphFactory.create_spindly_tree(5))
+    # cycle 0 -> 1 -> 2 -> 0
+    assert is_strongly_connected(Digraph(nodes=3, edges=((0, 1), (1, 2), (2, 0))))
+    # 0 reaches every node, but 3 doesn't reach 0
+    assert not is_strongly_connected(
+        Digraph(nodes=4, edges=((0, 1), (1, 2), (2, 0), (2, 3)))
+    )
@@ -1,3 +1,5 @@
+from collections.abc import Callable
+
 from dsa.disjoint_sets.disjoint_sets import DisjointSets
 from dsa.graphs.analysis.traversal.bfs import bfs
 from dsa.graphs.analysis.traversal.dfs import dfs
@@ -5,6 +7,14 @@ from dsa.graphs.analysis.traversal.dijkstra import dijkstra
 from dsa.graphs.analysis.traversal_type import TraversalType
 from dsa.graphs.graph import Graph
 
+# map from traversal type to a function returning whether a traversal of that type found a cycle; the (undirected)
+# cycle flag is at different positions in each traversal's return values
+_TRAVERSE_CONTAINS_CYCLE: dict[TraversalType, Callable[[Graph], bool]] = {
+    TraversalType.DFS: lambda g: dfs(g)[-2],
+    TraversalType.BFS: lambda g: bfs(g)[-1],
+    TraversalType.DIJKSTRA: lambda g: dijkstra(g)[-1],
+}
+
 
 def contains_cycle(
     g: Graph, traversal_type: TraversalType | None = TraversalType.DFS
@@ -23,21 +33,17 @@ def contains_cycle(
 def _contains_cycle_using_graph_traversal(
     g: Graph, traversal_type: TraversalType
 ) -> bool:
-    if traversal_type == TraversalType.DFS:
-        *_, contains_cycle, _ = dfs(g)
-    elif traversal_type == TraversalType.BFS:
-        *_, contains_cycle = bfs(g)
-    elif traversal_type == TraversalType.DIJKSTRA:
-        *_, contains_cycle = dijkstra(g)
-    else:
+    try:
+        traverse_contains_cycle = _TRAVERSE_CONTAINS_CYCLE[traversal_type]
+    except KeyError:
         raise ValueError(f"Unrecognized {traversal_type=}.")
-    return contains_cycle
+    return traverse_contains_cycle(g)
 
 
 def _contains_cycle_using_disjoint_sets(g: Graph) -> bool:
     ds = DisjointSets(g.get_nodes())
     for u, v in g.get_edges():
-        if ds.is_connected(u, v):
+        # connect reports whether u and v were already connected, so each edge only needs one pair of root finds
+        if not ds.connect(u, v):
             return True
-        ds.connect(u, v)
     return False
@@ -3,33 +3,28 @@ import pytest
 from dsa.graphs.analysis.cycles.cycles import contains_cycle
 from dsa.graphs.analysis.traversal_type import TraversalType
 from dsa.graphs.graph import Graph
-from dsa.graphs.graph_factory import GraphFactory
 
 
 @pytest.mark.parametrize(
     "traversal_type",
     (TraversalType.DFS, TraversalType.BFS, TraversalType.DIJKSTRA, None),
 )
-def test_contains_cycle(traversal_type: TraversalType) -> None:
-    g_complete = GraphFactory.create_complete_graph(4)
+def test_contains_cycle(
+    traversal_type: TraversalType,
+    g_complete: Graph,
+    g_spindly_tree: Graph,
+    g_complete_complete: Graph,
+    g_complete_spindly_tree: Graph,
+    g_spindly_tree_complete: Graph,
+    g_spindly_tree_spindly_tree: Graph,
+) -> None:
     assert contains_cycle(g_complete, traversal_type=traversal_type)
 
-    g_spindly_tree = GraphFactory.create_spindly_tree(5)
     assert not contains_cycle(g_spindly_tree, traversal_type=traversal_type)
 
-    assert contains_cycle(
-        GraphFactory.concat_int_graphs((g_complete, g_complete)),
-        traversal_type=traversal_type,
-    )
-    assert contains_cycle(
-        GraphFactory.concat_int_graphs((g_complete, g_spindly_tree)),
-        traversal_type=traversal_type,
-    )
-    assert contains_cycle(
-        GraphFactory.concat_int_graphs((g_spindly_tree, g_complete)),
-        traversal_type=traversal_type,
-    )
+    assert contains_cycle(g_complete_complete, traversal_type=traversal_type)
+    assert contains_cycle(g_complete_spindly_tree, traversal_type=traversal_type)
+    assert contains_cycle(g_spindly_tree_complete, traversal_type=traversal_type)
     assert not contains_cycle(
-        GraphFactory.concat_int_graphs((g_spindly_tree, g_spindly_tree)),
-        traversal_type=traversal_type,
+        g_spindly_tree_spindly_tree, traversal_type=traversal_type
     )
@@ -1,4 +1,7 @@
-from collections.abc import Hashable
+from collections import deque
+from collections.abc import Callable, Hashable
+
+import numpy as np
 
 from dsa.graphs.analysis.traversal.dfs import dfs
 from dsa.graphs.analysis.traversal_type import TraversalType
@@ -12,36 +15,52 @@ def topological_sort(
 
     NOTE: only traversal types DFS and BFS are allowed!
     """
-    if traversal_type == TraversalType.DFS:
-        func = _dfs_topological_sort
-    elif traversal_type == TraversalType.BFS:
-        # can't use the typical BFS algorithm natively (AFIAK) to get the topological order
-        # have to use Kahn's algorithm instead, which is still "BFS" in its node processing order
-        func = _kahn_topological_sort
-    else:
+    try:
+        func = _TOPOLOGICAL_SORTS[traversal_type]
+    except KeyError:
         raise ValueError(f"{traversal_type=} must be DFS or BFS")
     return func(dg)
 
 
 def _dfs_topological_sort(dg: Digraph) -> list[Hashable]:
-    _, _, _, postorder, _, _, directed_is_cyclic = dfs(dg, recursive=True)
+    # iterative DFS, so long chains in dg can't hit the recursion limit
+    _, _, _, postorder, _, _, directed_is_cyclic = dfs(dg)
     if directed_is_cyclic:
         raise ValueError("Given digraph is cyclic; cannot topologically sort it.")
     return postorder[::-1]
 
 
 def _kahn_topological_sort(dg: Digraph) -> list[Hashable]:
-    remaining_in_degrees = {u: dg.get_in_degree(u) for u in dg}
-    queue = [u for u, deg in remaining_in_degrees.items() if deg == 0]
-    sorted_nodes = []
+    """Kahn's algorithm, over an int-indexed CSR (indptr, indices) copy of dg's out-adjacency.
+
+    The in-degrees are counted with one np.bincount over indices. But the main loop then works on plain lists indexed
+    by node index: most nodes have only a few out-neighbors, so a few list updates per node are cheaper than the fixed
+    overhead of several numpy calls per node, and they avoid hashing nodes like a dict keyed by node would.
+    """
+    nodes = dg.get_nodes()
+    indptr, indices = dg.get_csr()
+    remaining_in_degrees = np.bincount(indices, minlength=len(nodes)).tolist()
+    indptr = indptr.tolist()
+    indices = indices.tolist()
+    # deque, since popping from the front of a list is O(n)
+    queue = deque(u for u, deg in enumerate(remaining_in_degrees) if deg == 0)
+    sorted_indices = []
     while queue:
-        u = queue.pop(0)
-        sorted_nodes.append(u)
-        for v in dg[u]:
+        u = queue.popleft()
+        sorted_indices.append(u)
+        for v in indices[indptr[u] : indptr[u + 1]]:
             remaining_in_degrees[v] -= 1
             if remaining_in_degrees[v] == 0:
                 queue.append(v)
-    if len(sorted_nodes) == len(dg):
-        return sorted_nodes
+    if len(sorted_indices) == len(nodes):
+        return [nodes[i] for i in sorted_indices]
     else:
         raise ValueError("Given digraph is cyclic; cannot topologically sort it.")
+
+
+_TOPOLOGICAL_SORTS: dict[TraversalType, Callable[[Digraph], list[Hashable]]] = {
+    TraversalType.DFS: _dfs_topological_sort,
+    # can't use the typical BFS algorithm natively (AFIAK) to get the topological order
+    # have to use Kahn's algorithm instead, which is still "BFS" in its node processing order
+    TraversalType.BFS: _kahn_topological_sort,
+}
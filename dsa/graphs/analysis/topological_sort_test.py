@@ -3,6 +3,7 @@ import pytest
 from dsa.graphs.analysis.topological_sort import topological_sort
 from dsa.graphs.analysis.traversal_type import TraversalType
 from dsa.graphs.digraph import Digraph
+from dsa.graphs.digraph_factory import DigraphFactory
 from dsa.utils import get_key_to_index
 
 
@@ -49,3 +50,8 @@ def test_topological_sort(traversal_type: TraversalType) -> None:
     dg.add_edges((("I", "G"), ("G", "I")))
     with pytest.raises(ValueError):
         topological_sort(dg, traversal_type=traversal_type)
+
+    # long chain; deeper than the default recursion limit
+    n = 5000
+    dg = DigraphFactory.create_spindly_tree(n)
+    assert topological_sort(dg, traversal_type=traversal_type) == list(range(n))
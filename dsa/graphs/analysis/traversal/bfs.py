@@ -1,8 +1,11 @@
-from collections.abc import Hashable, Sequence
+from collections import deque
+from collections.abc import Callable, Hashable, Sequence
+
+import numpy as np
 
 from dsa.graphs.analysis.traversal.order import Order
 from dsa.graphs.analysis.traversal.utils import (
-    get_ordered_neighbors,
+    get_ordered_neighbors_getter,
     get_ordered_seed_nodes,
 )
 from dsa.graphs.graph import Graph
@@ -45,7 +48,9 @@ def bfs(
         bool: if the graph is undirected, True if graph contains cycle; False otherwise
     """
     seed_nodes = get_ordered_seed_nodes(g, seed_order)
+    _bfs_from = _get_bfs_from(use_approach_1)
 
+    # every call to _bfs_from adds to these in place, rather than building its own and then merging them in here
     parents = {}
     dists = {}
     reached = set()
@@ -54,16 +59,10 @@ def bfs(
     undirected_contains_cycle = False
     for u in seed_nodes:
         if u not in reached:
-            (
-                parents_from_u,
-                dists_from_u,
-                levelorder_from_u,
-                undirected_contains_cycle_from_u,
-            ) = bfs_from(g, u, neighbor_order, reached, use_approach_1=use_approach_1)
-            parents.update(parents_from_u)
-            dists.update(dists_from_u)
-            levelorder.extend(levelorder_from_u)
-            ccs.append(levelorder_from_u)
+            cc, undirected_contains_cycle_from_u = _bfs_from(
+                g, u, neighbor_order, parents, dists, levelorder, reached
+            )
+            ccs.append(cc)
             undirected_contains_cycle = (
                 undirected_contains_cycle or undirected_contains_cycle_from_u
             )
@@ -78,22 +77,32 @@ def bfs_from(
     reached: set | None = None,
     use_approach_1: bool = True,
 ) -> tuple[dict[Hashable, Hashable], dict[Hashable, float], list[Hashable], bool]:
-    _bfs_from: Callable = (
-        _bfs_from_approach_1 if use_approach_1 else _bfs_from_approach_2
-    )
+    parents = {}
+    dists = {}
+    levelorder = []
     if reached is None:
         reached = set()
-    return _bfs_from(g, u, neighbor_order, reached)
+    _, undirected_contains_cycle = _get_bfs_from(use_approach_1)(
+        g, u, neighbor_order, parents, dists, levelorder, reached
+    )
+    return parents, dists, levelorder, undirected_contains_cycle
+
+
+def _get_bfs_from(use_approach_1: bool) -> Callable:
+    return _bfs_from_approach_1 if use_approach_1 else _bfs_from_approach_2
 
 
 def _bfs_from_approach_1(
     g: Graph,
     u: Hashable,
     neighbor_order: Order | None,
+    parents: dict[Hashable, Hashable],
+    dists: dict[Hashable, float],
+    levelorder: list[Hashable],
     reached: set,
-) -> tuple[list[Hashable], dict[Hashable, float], list[Hashable], bool]:
+) -> tuple[list[Hashable], bool]:
     """Same as the iterative DFS implementation without the "hack" added to get the postorder, except
-    use a queue instead of a stack (well, use a list in both cases, but do pop(0) instead of pop(-1) here),
+    use a queue instead of a stack (a deque, since popping from the front of a list is O(n)),
     AND only update parents if a node isn't already in it.
 
     In this approach (approach 1), we replace the "if v not in reached" with "if v not in parents" to achieve
@@ -107,57 +116,197 @@ def _bfs_from_approach_1(
     understand, and also generalizes better to Dijkstra. But then again, the downside of this scheme is that
     it doesn't vibe well with reached. I.e., a node is not reached and yet at that point it's enqueued, its
     parent is set!
+
+    Rather than a queue, this processes the BFS a level (frontier) at a time. A FIFO queue only ever holds the rest
+    of one level followed by the start of the next, so going through each frontier in order and collecting the
+    next frontier in a list visits nodes in exactly the same order. But it lets levelorder be extended a whole level
+    at a time, and every node in a level has the same distance, so that doesn't need to be looked up per node.
+
+    Like approach 2, this adds to the given parents, dists, and levelorder in place, and returns the nodes it
+    reached (the new tail of levelorder) as a connected component, along with whether it found a cycle.
     """
-    parents = {u: None}
-    dists = {u: 0}
-    to_explore = [u]
-    levelorder = []
+    cc_start = len(levelorder)
+    parents[u] = None
+    dists[u] = 0
+    frontier = [u]
     undirected_contains_cycle = False
-    while to_explore:
-        u = to_explore.pop(0)
-        # don't need to do "continue if u in reached" since a node never gets added twice to the queue
-        reached.add(u)
-        levelorder.append(u)
-        for v in get_ordered_neighbors(g, u, neighbor_order):
-            if v not in parents:
-                parents[v] = u
-                dists[v] = dists[u] + 1
-                to_explore.append(v)
-            else:
-                undirected_contains_cycle = undirected_contains_cycle or v != parents[u]
-    return parents, dists, levelorder, undirected_contains_cycle
+    get_ordered_neighbors = get_ordered_neighbors_getter(g, neighbor_order)
+    dist_v = 1  # distance of the nodes in the next frontier
+    while frontier:
+        # don't need to skip nodes already reached since a node never gets added to two frontiers
+        levelorder.extend(frontier)
+        next_frontier = []
+        # bind hot method to a local, to skip an attribute lookup per neighbor
+        next_frontier_append = next_frontier.append
+        for u in frontier:
+            parent = parents[u]  # the same for every neighbor, so look it up once
+            for v in get_ordered_neighbors(u):
+                if v not in parents:
+                    parents[v] = u
+                    dists[v] = dist_v
+                    next_frontier_append(v)
+                elif not undirected_contains_cycle and v != parent:
+                    # once a cycle is found, the flag can't change, so the check is skipped from then on
+                    undirected_contains_cycle = True
+        frontier = next_frontier
+        dist_v += 1
+    # every seen node gets reached (i.e., explored as part of a frontier) before the frontier empties, so rather than
+    # adding each node to reached as it's explored, add them all at once
+    cc = levelorder[cc_start:]
+    reached.update(cc)
+    return cc, undirected_contains_cycle
 
 
 def _bfs_from_approach_2(
     g: Graph,
     u: Hashable,
     neighbor_order: Order | None,
+    parents: dict[Hashable, Hashable],
+    dists: dict[Hashable, float],
+    levelorder: list[Hashable],
     reached: set,
-) -> tuple[dict[Hashable, Hashable], dict[Hashable, float], list[Hashable], bool]:
+) -> tuple[list[Hashable], bool]:
     """Same as the iterative DFS implementation without the "hack" added to get the postorder, except
-    use a queue instead of a stack (well, use a list in both cases, but do pop(0) instead of pop(-1) here),
+    use a queue instead of a stack (a deque, since popping from the front of a list is O(n)),
     AND only update parents if a node isn't already in it.
 
     In this approach (approach 2), we use "reached" to really mean more like "seen", i.e., the keys of parents.
     In fact, we don't even need reached for this traversal, but I'm just keeping it for consistency. Theoretically,
     the caller could completely remove reached and just check if a node is in parents... And it just keeps it
     more consistent with the DFS implementation.
+
+    This adds to the given parents, dists, and levelorder in place (so bfs() can pass the same ones to every call,
+    rather than merging each call's results into its own), and returns the nodes it reached (the new tail of
+    levelorder) as a connected component, along with whether it found a cycle.
     """
-    parents = {u: None}
-    dists = {u: 0}
-    to_explore = [u]
-    levelorder = []
+    cc_start = len(levelorder)
+    parents[u] = None
+    dists[u] = 0
+    to_explore = deque((u,))
     reached.add(u)
     undirected_contains_cycle = False
+    # bind hot methods to locals once, so each loop iteration does a fast local lookup instead of an attribute lookup
+    to_explore_popleft = to_explore.popleft
+    to_explore_append = to_explore.append
+    levelorder_append = levelorder.append
+    reached_add = reached.add
+    get_ordered_neighbors = get_ordered_neighbors_getter(g, neighbor_order)
     while to_explore:
-        u = to_explore.pop(0)
-        levelorder.append(u)
-        for v in get_ordered_neighbors(g, u, neighbor_order):
+        u = to_explore_popleft()
+        levelorder_append(u)
+        # these are the same for every neighbor, so look them up once
+        parent = parents[u]
+        dist_v = dists[u] + 1
+        for v in get_ordered_neighbors(u):
             if v not in reached:
                 parents[v] = u
-                dists[v] = dists[u] + 1
-                to_explore.append(v)
-                reached.add(v)
+                dists[v] = dist_v
+                to_explore_append(v)
+                reached_add(v)
+            elif not undirected_contains_cycle and v != parent:
+                # once a cycle is found, the flag can't change, so the check is skipped from then on
+                undirected_contains_cycle = True
+    return levelorder[cc_start:], undirected_contains_cycle
+
+
+# tuning constants for direction-optimizing BFS (the values from Beamer et al.'s paper): switch to bottom-up once the
+# frontier's edges outnumber 1/_BOTTOM_UP_ALPHA of the unexplored edges, and back to top-down once the frontier has
+# fewer than 1/_TOP_DOWN_BETA of the nodes
+_BOTTOM_UP_ALPHA = 14
+_TOP_DOWN_BETA = 24
+
+
+def _bfs_from_csr(
+    indptr: np.ndarray,
+    indices: np.ndarray,
+    s: int,
+    symmetric: bool = False,
+    in_csr: tuple[np.ndarray, np.ndarray] | None = None,
+) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """BFS from node index s over the CSR adjacency (indptr, indices), e.g., from Graph.get_csr().
+
+    Since nodes are indices here, parents and dists are parallel int arrays indexed by node, rather than dicts keyed
+    by node: no hashing per update, and a few bytes per node instead of a dict entry. A node that isn't reached has
+    parent and dist -1 (as does s's parent). Neighbors are explored in CSR order, i.e., by increasing index.
+
+    If symmetric (i.e., the adjacency is undirected, so every node's neighbors are also its in-neighbors), this is
+    direction-optimizing. Normally a level is expanded top-down: each frontier node checks each of its neighbors to
+    see if it's been seen yet. But in the middle levels of a small-world graph, the frontier is most of the graph, and
+    most of those checks find an already-seen node. So when the frontier is big, a level is expanded bottom-up
+    instead: each unseen node checks its neighbors for one in the frontier, and stops at the first it finds. On
+    graphs with long, thin levels (e.g., paths) it just stays top-down.
+
+    A bottom-up step gives each node the smallest-index frontier node among its (sorted) in-neighbors as its parent.
+    So that a top-down step picks the same parent, each level is kept in increasing index order: bottom-up steps
+    produce it that way, and top-down steps sort it. Then the parents don't depend on which direction each level
+    happened to be expanded in.
+
+    A directed adjacency isn't its own reverse, so for a digraph, the bottom-up steps need the in-adjacency as well:
+    pass it as in_csr (e.g., from Digraph.get_in_csr()) to make the BFS direction-optimizing. Otherwise, it's always
+    top-down.
+
+    Every value in the returned arrays is a node index or a distance, so all are less than n; they're stored as int32
+    (half the bytes of the default int64) unless n is too big for that.
+
+    Returns:
+        np.ndarray: parents array which encodes the traversal tree
+        np.ndarray: distance from s to each node
+        np.ndarray: level order of the reached nodes
+    """
+    indptr = indptr.tolist()
+    indices = indices.tolist()
+    if symmetric:
+        in_indptr, in_indices = indptr, indices
+    elif in_csr is not None:
+        in_indptr, in_indices = (a.tolist() for a in in_csr)
+    direction_optimizing = symmetric or in_csr is not None
+    n = len(indptr) - 1
+    parents = [-1] * n
+    dists = [-1] * n  # doubles as the "seen" flags
+    dists[s] = 0
+    if direction_optimizing:
+        # only the direction heuristics need degrees, so a plain top-down BFS skips computing them
+        get_degree = [indptr[i + 1] - indptr[i] for i in range(n)].__getitem__
+        num_unexplored_edges = len(indices) - get_degree(s)
+    bottom_up = False
+    frontier = [s]
+    levelorder = []
+    dist_v = 1
+    while frontier:
+        levelorder.extend(frontier)
+        if direction_optimizing:
+            num_frontier_edges = sum(map(get_degree, frontier))
+            if not bottom_up:
+                bottom_up = num_frontier_edges > num_unexplored_edges / _BOTTOM_UP_ALPHA
             else:
-                undirected_contains_cycle = undirected_contains_cycle or v != parents[u]
-    return parents, dists, levelorder, undirected_contains_cycle
+                bottom_up = len(frontier) >= n / _TOP_DOWN_BETA
+            num_unexplored_edges -= num_frontier_edges
+        next_frontier = []
+        next_frontier_append = next_frontier.append
+        if bottom_up:
+            dist_u = dist_v - 1  # distance of the nodes in the frontier
+            for v in range(n):
+                if dists[v] == -1:
+                    for u in in_indices[in_indptr[v] : in_indptr[v + 1]]:
+                        if dists[u] == dist_u:
+                            parents[v] = u
+                            dists[v] = dist_v
+                            next_frontier_append(v)
+                            break
+        else:
+            for u in frontier:
+                for v in indices[indptr[u] : indptr[u + 1]]:
+                    if dists[v] == -1:
+                        parents[v] = u
+                        dists[v] = dist_v
+                        next_frontier_append(v)
+            if direction_optimizing:
+                next_frontier.sort()
+        frontier = next_frontier
+        dist_v += 1
+    dtype = np.int32 if n < 2**31 else np.int64
+    return (
+        np.array(parents, dtype=dtype),
+        np.array(dists, dtype=dtype),
+        np.array(levelorder, dtype=dtype),
+    )
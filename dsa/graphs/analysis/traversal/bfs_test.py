@@ -1,9 +1,11 @@
 import random
 
+import numpy as np
 import pytest
 
-from dsa.graphs.analysis.traversal.bfs import bfs
+from dsa.graphs.analysis.traversal.bfs import _bfs_from_csr, bfs
 from dsa.graphs.analysis.traversal.order import Order
+from dsa.graphs.digraph import Digraph
 from dsa.graphs.graph import Graph
 from dsa.graphs.graph_factory import GraphFactory
 
@@ -833,3 +835,52 @@ def test_bfs(use_approach_1: bool) -> None:
     assert level == exp_level
     assert ccs == exp_ccs
     assert contains_cycle
+
+
+def test_bfs_from_csr() -> None:
+    # path 0 - 1 - 2, plus isolated node 3
+    g = Graph(nodes=4, edges=((0, 1), (1, 2)))
+    parents, dists, levelorder = _bfs_from_csr(*g.get_csr(), 1)
+    assert parents.tolist() == [1, -1, 1, -1]
+    assert dists.tolist() == [1, 0, 1, -1]
+    assert levelorder.tolist() == [1, 0, 2]
+    assert parents.dtype == dists.dtype == levelorder.dtype == np.int32
+
+
+def test_bfs_from_csr_direction_optimizing() -> None:
+    # dense enough for some levels to be expanded bottom-up
+    random.seed(0)
+    n = 200
+    edges = {tuple(random.sample(range(n), 2)) for _ in range(2000)}
+    g = Graph(nodes=n, edges=tuple({(min(e), max(e)) for e in edges}))
+    indptr, indices = g.get_csr()
+    _, expected_dists, _ = _bfs_from_csr(indptr, indices, 0)
+    parents, dists, levelorder = _bfs_from_csr(indptr, indices, 0, symmetric=True)
+    assert dists.tolist() == expected_dists.tolist()
+    assert sorted(levelorder.tolist()) == sorted(np.flatnonzero(dists >= 0).tolist())
+    # each parent is the smallest-index neighbor one level closer to the seed, whichever direction its level was
+    # expanded in
+    for v, u in enumerate(parents.tolist()):
+        if u != -1:
+            neighbors = indices[indptr[v] : indptr[v + 1]]
+            assert u == min(w for w in neighbors if dists[w] == dists[v] - 1)
+
+
+def test_bfs_from_csr_direction_optimizing_digraph() -> None:
+    random.seed(0)
+    n = 200
+    dg = Digraph(
+        nodes=n, edges=tuple({tuple(random.sample(range(n), 2)) for _ in range(3000)})
+    )
+    indptr, indices = dg.get_csr()
+    _, expected_dists, _ = _bfs_from_csr(indptr, indices, 0)
+    in_indptr, in_indices = dg.get_in_csr()
+    parents, dists, _ = _bfs_from_csr(
+        indptr, indices, 0, in_csr=(in_indptr, in_indices)
+    )
+    assert dists.tolist() == expected_dists.tolist()
+    # each parent is the smallest-index in-neighbor one level closer to the seed
+    for v, u in enumerate(parents.tolist()):
+        if u != -1:
+            in_neighbors = in_indices[in_indptr[v] : in_indptr[v + 1]]
+            assert u == min(w for w in in_neighbors if dists[w] == dists[v] - 1)
@@ -1,5 +1,5 @@
 from collections.abc import Callable, Hashable, Mapping, Sequence
-from typing import Any
+from typing import Any, NamedTuple
 
 from dsa.graphs.analysis.traversal.order import Order
 from dsa.graphs.analysis.traversal.utils import (
@@ -9,6 +9,19 @@ from dsa.graphs.analysis.traversal.utils import (
 from dsa.graphs.graph import Graph
 
 
+class DFSResult(NamedTuple):
+    """Return value of dfs. It's a tuple, so it can still be unpacked positionally, but whole results can also be
+    compared with a single ==."""
+
+    parents: dict[Hashable, Hashable]
+    dists: dict[Hashable, float]
+    preorder: list[Hashable]
+    postorder: list[Hashable]
+    ccs: list[list[Hashable]]
+    undirected_contains_cycle: bool
+    directed_contains_cycle: bool
+
+
 # TODO: goal neighbor
 def dfs(
     g: Graph,
@@ -17,15 +30,8 @@ def dfs(
     seed_order: Order | Hashable | Sequence[Hashable] | None = None,
     # TODO test Callable neighbor_order
     neighbor_order: Order | Callable[[Hashable], int] | None = Order.SORTED,
-) -> tuple[
-    dict[Hashable, Hashable],
-    dict[Hashable, float],
-    list[Hashable],
-    list[Hashable],
-    list[list[Hashable]],
-    bool,
-    bool,
-]:
+    get_neighbors: Callable[[Hashable], Sequence[Hashable]] | None = None,
+) -> DFSResult:
     """Depth first search (DFS) implementation.
 
     The recursive and iterative versions both have an inital overall "iterative" part, but beyond that they diverge
@@ -40,8 +46,11 @@ def dfs(
             - If Sequence[Hashable] (sequence of nodes), iterate in the order given by the sequence.
             - NOTE: If seed_order is Hashable and also Sequence[Hashable], it'll be interpreted as Hashable (node)
         neighbor_order: optional order in which to explore neighbors of a node; or comparison Callable; if None, undetermined order.
+        get_neighbors: optional Callable returning the neighbors of a node, to traverse g as if it had those edges instead
+            (e.g., dg.get_in_neighbors to traverse the reverse of digraph dg without constructing it); if None, g[u].
 
     Returns:
+        DFSResult, with fields:
         dict[Hashable, Hashable]: path parents map, a map from each node to its parent in the DFS tree,
             or to None if it has no parent in the DFS tree (i.e., if it served as a seed node)
         dict[Hashable, float]: map from node to the distance from its seed to the node
@@ -82,6 +91,7 @@ def dfs(
                 neighbor_order,
                 reached,
                 recursive=recursive,
+                get_neighbors=get_neighbors,
             )
             parents.update(parents_from_u)
             dists.update(dists_from_u)
@@ -94,7 +104,7 @@ def dfs(
             directed_contains_cycle = (
                 directed_contains_cycle or directed_contains_cycle_from_u
             )
-    return (
+    return DFSResult(
         parents,
         dists,
         preorder,
@@ -112,6 +122,7 @@ def dfs_from(
     neighbor_order: Order | Callable[[Hashable], int] | None,
     reached: set | None = None,
     recursive: bool = False,
+    get_neighbors: Callable[[Hashable], Sequence[Hashable]] | None = None,
 ) -> tuple[
     dict[Hashable, Hashable],
     dict[Hashable, float],
@@ -123,7 +134,7 @@ def dfs_from(
     _dfs_from: Callable = _dfs_from_recursive if recursive else _dfs_from_iterative
     if reached is None:
         reached = set()
-    return _dfs_from(g, u, neighbor_order, reached)
+    return _dfs_from(g, u, neighbor_order, reached, get_neighbors=get_neighbors)
 
 
 def _dfs_from_recursive(
@@ -132,6 +143,7 @@ def _dfs_from_recursive(
     neighbor_order: Order | Callable[[Hashable], int] | None,
     reached: set,
     *,
+    get_neighbors: Callable[[Hashable], Sequence[Hashable]] | None = None,
     parent: Hashable = None,  # only set to non-None when called recursively
     dists: dict | None = None,  # only set to non-None when called recursively
     double_reached: set | None = None,  # only set to non-None when called recursively
@@ -171,7 +183,7 @@ def _dfs_from_recursive(
     directed_contains_cycle = False
     if double_reached is None:
         double_reached = set()
-    for v in get_ordered_neighbors(g, u, neighbor_order):
+    for v in get_ordered_neighbors(g, u, neighbor_order, get_neighbors):
         if v not in reached:
             (
                 parents_from_v,
@@ -185,6 +197,7 @@ def _dfs_from_recursive(
                 v,
                 neighbor_order,
                 reached,
+                get_neighbors=get_neighbors,
                 parent=u,
                 dists=dists,
                 double_reached=double_reached,
@@ -222,6 +235,8 @@ def _dfs_from_iterative(
     u: Hashable,
     neighbor_order: Order | Callable[[Hashable], int] | None,
     reached: set,
+    *,
+    get_neighbors: Callable[[Hashable], Sequence[Hashable]] | None = None,
 ) -> tuple[
     dict[Hashable, Hashable],
     dict[Hashable, float],
@@ -329,30 +344,51 @@ def _dfs_from_iterative(
     postorder = []
     undirected_contains_cycle = False
     directed_contains_cycle = False
+    # bind hot methods to locals once, so each of the O(n + m) loop iterations does a fast local lookup instead of
+    # an attribute lookup
+    to_explore_pop = to_explore.pop
+    to_explore_append = to_explore.append
+    reached_add = reached.add
+    double_reached_add = double_reached.add
+    preorder_append = preorder.append
+    postorder_append = postorder.append
+    # the stack pops in reverse of push order, so when neighbor_order is an Order, directly ask g for the opposite
+    # order, which g caches, instead of copying the neighbors reversed for each node
+    use_cached_sorted_neighbors = (
+        isinstance(neighbor_order, Order) and get_neighbors is None
+    )
+    if use_cached_sorted_neighbors:
+        push_reverse_sorted = neighbor_order == Order.SORTED
     while to_explore:
-        u = to_explore.pop(-1)
+        u = to_explore_pop()
         if u in reached:
             if u not in double_reached:
                 # this if block is only used for postorder
-                double_reached.add(u)
-                postorder.append(u)
+                double_reached_add(u)
+                postorder_append(u)
             continue
-        to_explore.append(
+        to_explore_append(
             u
         )  # this is only used for postorder and directed_contains_cycle
-        reached.add(u)
-        preorder.append(u)
+        reached_add(u)
+        preorder_append(u)
+        parent = parents[u]
+        dist_v = dists[u] + 1
         # add to stack in reverse order of order of exploration
-        for v in get_ordered_neighbors(g, u, neighbor_order)[::-1]:
+        if use_cached_sorted_neighbors:
+            vs = g.get_sorted_neighbors(u, reverse=push_reverse_sorted)
+        else:
+            vs = get_ordered_neighbors(g, u, neighbor_order, get_neighbors)[::-1]
+        for v in vs:
             if v not in reached:
                 # NOTE: yes, parents can be set multiple times, but the last time will stick, as that gets
                 # popped off the stack first, and then after that we'll never reach this line again
                 # if you only add the first time, it's stlil valid, it just wont' be the DFS path
                 parents[v] = u
-                dists[v] = dists[u] + 1
-                to_explore.append(v)
+                dists[v] = dist_v
+                to_explore_append(v)
             else:
-                undirected_contains_cycle = undirected_contains_cycle or v != parents[u]
+                undirected_contains_cycle = undirected_contains_cycle or v != parent
                 directed_contains_cycle = (
                     directed_contains_cycle or v not in double_reached
                 )
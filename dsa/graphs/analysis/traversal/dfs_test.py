@@ -1,1169 +1,1032 @@
-import random
+from collections.abc import Sequence
+from itertools import accumulate, chain
 
 import pytest
 
-from dsa.graphs.analysis.traversal.dfs import dfs
+from dsa.graphs.analysis.traversal.dfs import DFSResult, dfs
 from dsa.graphs.analysis.traversal.order import Order
 from dsa.graphs.digraph import Digraph
 from dsa.graphs.digraph_factory import DigraphFactory
 from dsa.graphs.graph import Graph
 from dsa.graphs.graph_factory import GraphFactory
+from dsa.graphs.transformations.transformations import reverse
 
 # TODO why is this so slow with 2**big_number
 MAX_TEST_GRAPH_SIZE = 2**8
+# fixed sizes (rather than a random draw) so every run does the same work; the largest is only run without -m "not slow"
+TEST_GRAPH_SIZES = (
+    2,
+    3,
+    17,
+    pytest.param(MAX_TEST_GRAPH_SIZE, marks=pytest.mark.slow),
+)
 
+# Table-driven cases: each (seed_order, neighbor_order, expected preorder, expected postorder) is its own test. The
+# parents and dists only depend on which node the DFS starts from (the first node in the preorder), not the neighbor
+# order, so they're looked up by that node.
 
-@pytest.mark.parametrize("recursive", (True, False))
-def test_dfs_undirected(recursive: bool) -> None:
-    # non-comparable nodes
-    g = Graph(nodes=(12, "blah"), edges=((12, "blah"),))
-    with pytest.raises(TypeError):
-        dfs(g, recursive=recursive, seed_order=Order.SORTED)
+# simple binary tree (see create_b_ary_tree docstring for example)
+B_ARY_PARENTS_AND_DISTS = {
+    0: (
+        {0: None, 1: 0, 2: 0, 3: 1, 4: 1, 5: 2, 6: 2},
+        {0: 0, 1: 1, 2: 1, 3: 2, 4: 2, 5: 2, 6: 2},
+    ),
+    6: (
+        {6: None, 2: 6, 5: 2, 0: 2, 1: 0, 3: 1, 4: 1},
+        {6: 0, 2: 1, 5: 2, 0: 2, 1: 3, 3: 4, 4: 4},
+    ),
+    1: (
+        {1: None, 3: 1, 4: 1, 0: 1, 2: 0, 5: 2, 6: 2},
+        {1: 0, 3: 1, 4: 1, 0: 1, 2: 2, 5: 3, 6: 3},
+    ),
+}
+B_ARY_CASES = (
+    # starting from 0
+    (Order.SORTED, Order.SORTED, [0, 1, 3, 4, 2, 5, 6], [3, 4, 1, 5, 6, 2, 0]),
+    (Order.SORTED, Order.REVERSE_SORTED, [0, 2, 6, 5, 1, 4, 3], [6, 5, 2, 4, 3, 1, 0]),
+    # starting from 6
+    (Order.REVERSE_SORTED, Order.SORTED, [6, 2, 0, 1, 3, 4, 5], [3, 4, 1, 0, 5, 2, 6]),
+    (
+        Order.REVERSE_SORTED,
+        Order.REVERSE_SORTED,
+        [6, 2, 5, 0, 1, 4, 3],
+        [5, 4, 3, 1, 0, 2, 6],
+    ),
+    # starting from 1
+    (1, Order.SORTED, [1, 0, 2, 5, 6, 3, 4], [5, 6, 2, 0, 3, 4, 1]),
+    (1, Order.REVERSE_SORTED, [1, 4, 3, 0, 2, 6, 5], [4, 3, 6, 5, 2, 0, 1]),
+)
 
-    ### simple graphs
+# See 8 node binary example in create_nearly_spindly_b_ary_tree docstring
+NEARLY_SPINDLY_B_ARY_PARENTS_AND_DISTS = {
+    0: (
+        {0: None, 1: 0, 2: 0, 3: 1, 4: 1, 5: 3, 6: 3, 7: 5},
+        {0: 0, 1: 1, 2: 1, 3: 2, 4: 2, 5: 3, 6: 3, 7: 4},
+    ),
+    3: (
+        {3: None, 5: 3, 6: 3, 7: 5, 1: 3, 4: 1, 0: 1, 2: 0},
+        {3: 0, 5: 1, 6: 1, 7: 2, 1: 1, 4: 2, 0: 2, 2: 3},
+    ),
+}
+NEARLY_SPINDLY_B_ARY_CASES = (
+    (Order.SORTED, Order.SORTED, [0, 1, 3, 5, 7, 6, 4, 2], [7, 5, 6, 3, 4, 1, 2, 0]),
+    # start from node 3 (arbitrarily chosen)
+    (3, Order.SORTED, [3, 1, 0, 2, 4, 5, 7, 6], [2, 0, 4, 1, 7, 5, 6, 3]),
+    (3, Order.REVERSE_SORTED, [3, 6, 5, 7, 1, 4, 0, 2], [6, 7, 5, 4, 2, 0, 1, 3]),
+)
 
-    # empty graph
-    g = Graph()
-    (
-        parents,
-        dists,
-        pre,
-        post,
-        ccs,
-        undirected_contains_cycle,
-        directed_contains_cycle,
-    ) = dfs(g, recursive=recursive)
-    assert parents == {}
-    assert dists == {}
-    assert pre == []
-    assert post == []
-    assert not undirected_contains_cycle
-
-    # singleton graph
-    g = Graph(nodes=1)
-    (
-        parents,
-        dists,
-        pre,
-        post,
-        ccs,
-        undirected_contains_cycle,
-        directed_contains_cycle,
-    ) = dfs(g, recursive=recursive)
-    assert parents == {0: None}
-    assert dists == {0: 0}
-    assert pre == [0]
-    assert post == [0]
-    assert ccs == [[0]]
-    assert not undirected_contains_cycle
 
-    # generally: n nodes, 0 edges
-    for n in (2, 3, random.randint(4, MAX_TEST_GRAPH_SIZE)):
-        g = Graph(nodes=n)
-        # seeds in sorted order
-        (
-            parents,
-            dists,
-            pre,
-            post,
-            ccs,
-            undirected_contains_cycle,
-            directed_contains_cycle,
-        ) = dfs(g, recursive=recursive, seed_order=Order.SORTED)
-        assert parents == {u: None for u in range(n)}
-        assert dists == {u: 0 for u in range(n)}
-        assert pre == list(range(n)), n
-        assert post == pre, n
-        assert ccs == [[i] for i in range(n)]
-        assert not undirected_contains_cycle
-        # seeds in reverse sorted order
-        (
-            parents,
-            dists,
-            pre,
-            post,
-            ccs,
-            undirected_contains_cycle,
-            directed_contains_cycle,
-        ) = dfs(g, recursive=recursive, seed_order=Order.REVERSE_SORTED)
-        assert parents == {u: None for u in range(n)}
-        assert dists == {u: 0 for u in range(n)}
-        assert pre == list(range(n - 1, -1, -1)), n
-        assert post == pre, n
-        assert ccs == [[i] for i in range(n - 1, -1, -1)]
-        assert not undirected_contains_cycle
-
-    ### spindly trees
+def _as_params(cases: Sequence[tuple]) -> list:
+    """Wraps each case in a pytest.param named after its seed and neighbor orders, e.g., "seed1-sorted", so a single
+    case can be selected with -k."""
 
-    # generally: n node spindly tree
-    for n in (2, 3, random.randint(4, MAX_TEST_GRAPH_SIZE)):
-        g = GraphFactory.create_spindly_tree(n)
-        # in sorted order
-        (
-            parents,
-            dists,
-            pre,
-            post,
-            ccs,
-            undirected_contains_cycle,
-            directed_contains_cycle,
-        ) = dfs(g, recursive=recursive, seed_order=Order.SORTED)
-        assert parents == {0: None, **{u: u - 1 for u in range(1, n)}}
-        assert dists == {u: u for u in range(n)}
-        assert pre == list(range(n)), n
-        assert post == pre[::-1]
-        assert ccs == [pre]
-        assert not undirected_contains_cycle
-        # in reverse sorted order
-        (
-            parents,
-            dists,
-            pre,
-            post,
-            ccs,
-            undirected_contains_cycle,
-            directed_contains_cycle,
-        ) = dfs(g, recursive=recursive, seed_order=Order.REVERSE_SORTED)
-        assert parents == {n - 1: None, **{u: u + 1 for u in range(n - 1)}}
-        assert dists == {u: n - 1 - u for u in range(n)}
-        assert pre == list(range(n - 1, -1, -1)), n
-        assert post == pre[::-1]
-        assert ccs == [pre]
-        assert not undirected_contains_cycle
-        # branch from the middle
-        dfs_root = random.randint(1, n - 1)
-        to_left = list(range(dfs_root - 1, -1, -1))  # from middle to the left
-        to_right = list(range(dfs_root + 1, n))  # from middle to the right
-        # important that dfs_root is first; everything else is irrelevant
-        # explore left then right
-        (
-            parents,
-            dists,
-            pre,
-            post,
-            ccs,
-            undirected_contains_cycle,
-            directed_contains_cycle,
-        ) = dfs(
-            g, recursive=recursive, seed_order=dfs_root, neighbor_order=Order.SORTED
-        )
-        exp_parents = {
-            dfs_root: None,
-            **{u: u + 1 for u in range(dfs_root)},
-            **{u: u - 1 for u in range(dfs_root + 1, n)},
-        }
-        exp_dists = {
-            dfs_root: 0,
-            **{u: dfs_root - u for u in range(dfs_root)},
-            **{u: u - dfs_root for u in range(dfs_root + 1, n)},
-        }
-        assert parents == exp_parents
-        assert dists == exp_dists
-        assert pre == [dfs_root, *to_left, *to_right]
-        assert post == [*to_left[::-1], *to_right[::-1], dfs_root]
-        assert ccs == [pre]
-        assert not undirected_contains_cycle
-        # explore right then left
-        (
-            parents,
-            dists,
-            pre,
-            post,
-            ccs,
-            undirected_contains_cycle,
-            directed_contains_cycle,
-        ) = dfs(
-            g,
-            recursive=recursive,
-            seed_order=dfs_root,
-            neighbor_order=Order.REVERSE_SORTED,
-        )
-        assert parents == exp_parents
-        assert dists == exp_dists
-        assert pre == [dfs_root, *to_right, *to_left]
-        assert post == [*to_right[::-1], *to_left[::-1], dfs_root]
-        assert ccs == [pre]
-        assert not undirected_contains_cycle
+    def get_id(order: Order | int) -> str:
+        return order.name.lower() if isinstance(order, Order) else f"seed{order}"
+
+    return [
+        pytest.param(*case, id=f"{get_id(case[0])}-{get_id(case[1])}") for case in cases
+    ]
+
+
+def _get_tree_case_expected(
+    parents_and_dists: dict[int, tuple[dict, dict]], pre: list[int], post: list[int]
+) -> DFSResult:
+    """Expected DFSResult of a tree case from the tables above. A tree has edges but no cycle, and is traversed from a
+    single seed."""
+    return DFSResult(*parents_and_dists[pre[0]], pre, post, [pre], False, True)
+
+
+def test_dfs_seed_order_sequence(recursive: bool) -> None:
+    g = Graph(nodes=3)
+    parents, _, pre, _, ccs, _, _ = dfs(g, recursive=recursive, seed_order=[2, 0, 1])
+    assert parents == {2: None, 0: None, 1: None}
+    assert pre == [2, 0, 1]
+    assert ccs == [[2], [0], [1]]
+    for seed_order in ([0, 1], [0, 1, 1], [0, 1, 2, 2], [0, 1, 3]):
+        with pytest.raises(ValueError):
+            dfs(g, recursive=recursive, seed_order=seed_order)
+
+
+@pytest.fixture(params=(True, False), ids=("rec", "it"))
+def recursive(request: pytest.FixtureRequest) -> bool:
+    """Every test runs against both the recursive and iterative implementations."""
+    return request.param
 
-    ### binary trees
 
+# Graphs shared by the tests below. They're built once per module rather than once per test (and per implementation),
+# so tests must not mutate them.
+
+
+@pytest.fixture(scope="module")
+def g_b_ary() -> Graph:
     # simple binary tree (see create_b_ary_tree docstring for example)
-    g = GraphFactory.create_b_ary_tree(2, 2)
-    # starting from 0, neighbors in sorted order
-    (
-        parents,
-        dists,
-        pre,
-        post,
-        ccs,
-        undirected_contains_cycle,
-        directed_contains_cycle,
-    ) = dfs(
-        g, recursive=recursive, seed_order=Order.SORTED, neighbor_order=Order.SORTED
-    )
-    exp_parents = {0: None, 1: 0, 2: 0, 3: 1, 4: 1, 5: 2, 6: 2}
-    exp_dists = {0: 0, 1: 1, 2: 1, 3: 2, 4: 2, 5: 2, 6: 2}
-    assert parents == exp_parents
-    assert dists == exp_dists
-    assert pre == [0, 1, 3, 4, 2, 5, 6]
-    assert post == [3, 4, 1, 5, 6, 2, 0]
-    assert ccs == [pre]
-    assert not undirected_contains_cycle
-    # starting from 0, neighbors in reverse order
-    (
-        parents,
-        dists,
-        pre,
-        post,
-        ccs,
-        undirected_contains_cycle,
-        directed_contains_cycle,
-    ) = dfs(
-        g,
-        recursive=recursive,
-        seed_order=Order.SORTED,
-        neighbor_order=Order.REVERSE_SORTED,
+    return GraphFactory.create_b_ary_tree(2, 2)
+
+
+@pytest.fixture(scope="module")
+def g_nearly_spindly_b_ary() -> Graph:
+    # See 8 node binary example in create_nearly_spindly_b_ary_tree docstring
+    return GraphFactory.create_nearly_spindly_b_ary_tree(2, 8)
+
+
+@pytest.fixture(scope="module")
+def g_spindly() -> Graph:
+    return GraphFactory.create_spindly_tree(3)
+
+
+def _create_lopsided_figure_8() -> Graph:
+    # two uneven cycles with 0 at center. I.e., a lopsided figure-8
+    return Graph(
+        nodes=range(9),
+        edges=(
+            (0, 1),
+            (1, 2),
+            (2, 3),
+            (3, 0),
+            (0, 4),
+            (4, 5),
+            (5, 6),
+            (6, 7),
+            (7, 8),
+            (8, 0),
+        ),
     )
-    assert parents == exp_parents
-    assert dists == exp_dists
-    assert pre == [0, 2, 6, 5, 1, 4, 3]
-    assert post == [6, 5, 2, 4, 3, 1, 0]
-    assert ccs == [pre]
-    assert not undirected_contains_cycle
-    # starting from 6, neighbors in sorted order
-    (
-        parents,
-        dists,
-        pre,
-        post,
-        ccs,
-        undirected_contains_cycle,
-        directed_contains_cycle,
-    ) = dfs(
-        g,
-        recursive=recursive,
-        seed_order=Order.REVERSE_SORTED,
-        neighbor_order=Order.SORTED,
+
+
+def _add_tail(g: Graph) -> Graph:
+    # add node 9, add 0-9 edge
+    g.add_node(9)
+    g.add_edge((0, 9))
+    return g
+
+
+@pytest.fixture(scope="module")
+def g_lopsided_figure_8() -> Graph:
+    return _create_lopsided_figure_8()
+
+
+@pytest.fixture(scope="module")
+def g_lopsided_figure_8_with_tail() -> Graph:
+    return _add_tail(_create_lopsided_figure_8())
+
+
+@pytest.fixture(scope="module")
+def g_cycles_off_main_line() -> Graph:
+    # graph with a main line with cycles coming off of it
+    # start from the figure-8 with a tail:
+    # 9 - 0
+    # 0 has two cycles coming off it, using up nodes 1 through 8
+    # add nodes 10 and 11
+    # add a 3-cycle off of 11, using nodes 12 and 13
+    # add node 14;
+    # add 7-cycle off 14, using nodes 15, 16, 17, 18, 19, 20
+    g = _add_tail(_create_lopsided_figure_8())
+    g.add_nodes(range(10, 21))
+    g.add_edges(
+        (
+            (0, 10),
+            (10, 11),
+            (11, 12),  # start 3-cycle
+            (12, 13),
+            (13, 11),
+            (11, 14),
+            (14, 15),  # start 7-cycle
+            (15, 16),
+            (16, 17),
+            (17, 18),
+            (18, 19),
+            (19, 20),
+            (20, 14),
+        )
     )
-    exp_parents = {6: None, 2: 6, 5: 2, 0: 2, 1: 0, 3: 1, 4: 1}
-    exp_dists = {6: 0, 2: 1, 5: 2, 0: 2, 1: 3, 3: 4, 4: 4}
-    assert parents == exp_parents
-    assert dists == exp_dists
-    assert pre == [6, 2, 0, 1, 3, 4, 5]
-    assert post == [3, 4, 1, 0, 5, 2, 6]
-    assert ccs == [pre]
-    assert not undirected_contains_cycle
-    # starting from 6, neighbors in reverse order
-    (
-        parents,
-        dists,
-        pre,
-        post,
-        ccs,
-        undirected_contains_cycle,
-        directed_contains_cycle,
-    ) = dfs(
-        g,
-        recursive=recursive,
-        seed_order=Order.REVERSE_SORTED,
-        neighbor_order=Order.REVERSE_SORTED,
+    return g
+
+
+@pytest.fixture(scope="module")
+def g_nested_cycles() -> Graph:
+    # "nested" cycles
+    # 0-1-2-3-4-5-6-7-0
+    # 2-8-9-10-2
+    # 10-11-12-13-10
+    return Graph(
+        nodes=range(14),
+        edges=(
+            (0, 1),
+            (1, 2),
+            (2, 3),
+            (3, 4),
+            (4, 5),
+            (5, 6),
+            (6, 7),
+            (7, 0),
+            (2, 8),
+            (8, 9),
+            (9, 10),
+            (10, 2),
+            (10, 11),
+            (11, 12),
+            (12, 13),
+            (13, 10),
+        ),
     )
-    assert parents == exp_parents
-    assert dists == exp_dists
-    assert pre == [6, 2, 5, 0, 1, 4, 3]
-    assert post == [5, 4, 3, 1, 0, 2, 6]
-    assert ccs == [pre]
-    assert not undirected_contains_cycle
-    # starting from 1
-    (
-        parents,
-        dists,
-        pre,
-        post,
-        ccs,
-        undirected_contains_cycle,
-        directed_contains_cycle,
-    ) = dfs(
-        g,
-        recursive=recursive,
-        seed_order=1,
-        neighbor_order=Order.SORTED,
+
+
+# Expected results of DFS on the graphs above, with seeds and neighbors in sorted order. For undirected graphs,
+# directed_contains_cycle is True iff there are any edges, since every edge leads back to a node still being explored.
+# Like the graphs, these are built once per module and shared by both implementations (and by the disjoint graphs test), so don't mutate them.
+
+
+@pytest.fixture(scope="module")
+def exp_spindly() -> DFSResult:
+    pre = list(range(3))
+    return DFSResult(
+        {0: None, 1: 0, 2: 1}, {0: 0, 1: 1, 2: 2}, pre, pre[::-1], [pre], False, True
     )
-    exp_parents = {1: None, 3: 1, 4: 1, 0: 1, 2: 0, 5: 2, 6: 2}
-    exp_dists = {1: 0, 3: 1, 4: 1, 0: 1, 2: 2, 5: 3, 6: 3}
-    assert parents == exp_parents
-    assert dists == exp_dists
-    assert pre == [1, 0, 2, 5, 6, 3, 4]
-    assert post == [5, 6, 2, 0, 3, 4, 1]
-    assert ccs == [pre]
-    assert not undirected_contains_cycle
-    # now neighbors in reverse order
-    (
-        parents,
-        dists,
+
+
+@pytest.fixture(scope="module")
+def exp_b_ary() -> DFSResult:
+    _, _, pre, post = B_ARY_CASES[0]
+    return _get_tree_case_expected(B_ARY_PARENTS_AND_DISTS, pre, post)
+
+
+@pytest.fixture(scope="module")
+def exp_nearly_spindly_b_ary() -> DFSResult:
+    _, _, pre, post = NEARLY_SPINDLY_B_ARY_CASES[0]
+    return _get_tree_case_expected(NEARLY_SPINDLY_B_ARY_PARENTS_AND_DISTS, pre, post)
+
+
+@pytest.fixture(scope="module")
+def exp_nested_cycles() -> DFSResult:
+    pre = [0, 1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11, 12, 13]
+    return DFSResult(
+        {
+            0: None,
+            **{i: i - 1 for i in range(1, 8)},
+            8: 2,
+            **{i: i - 1 for i in range(9, 14)},
+        },
+        {
+            0: 0,
+            **{i: i for i in range(1, 8)},
+            8: 3,
+            **{i: i - 5 for i in range(9, 14)},
+        },
         pre,
-        post,
-        ccs,
-        undirected_contains_cycle,
-        directed_contains_cycle,
-    ) = dfs(
-        g,
-        recursive=recursive,
-        seed_order=1,
-        neighbor_order=Order.REVERSE_SORTED,
+        [7, 6, 5, 4, 3, 13, 12, 11, 10, 9, 8, 2, 1, 0],
+        [pre],
+        True,
+        True,
     )
-    assert parents == exp_parents
-    assert dists == exp_dists
-    assert pre == [1, 4, 3, 0, 2, 6, 5]
-    assert post == [4, 3, 6, 5, 2, 0, 1]
-    assert ccs == [pre]
-    assert not undirected_contains_cycle
 
-    ### nearly spindly trees
 
-    # See 8 node binary example in create_nearly_spindly_b_ary_tree docstring
-    g = GraphFactory.create_nearly_spindly_b_ary_tree(2, 8)
-    (
-        parents,
-        dists,
-        pre,
-        post,
-        ccs,
-        undirected_contains_cycle,
-        directed_contains_cycle,
-    ) = dfs(
-        g, recursive=recursive, seed_order=Order.SORTED, neighbor_order=Order.SORTED
+def test_dfs_non_comparable_nodes(recursive: bool) -> None:
+    # non-comparable nodes
+    g = Graph(nodes=(12, "blah"), edges=((12, "blah"),))
+    with pytest.raises(TypeError):
+        dfs(g, recursive=recursive, seed_order=Order.SORTED)
+
+
+def test_dfs_empty_graph(recursive: bool) -> None:
+    # empty graph
+    g = Graph()
+    assert dfs(g, recursive=recursive) == DFSResult({}, {}, [], [], [], False, False)
+
+
+def test_dfs_singleton_graph(recursive: bool) -> None:
+    g = Graph(nodes=1)
+    assert dfs(g, recursive=recursive) == DFSResult(
+        {0: None}, {0: 0}, [0], [0], [[0]], False, False
     )
-    assert parents == {0: None, 1: 0, 2: 0, 3: 1, 4: 1, 5: 3, 6: 3, 7: 5}
-    assert dists == {0: 0, 1: 1, 2: 1, 3: 2, 4: 2, 5: 3, 6: 3, 7: 4}
-    assert pre == [0, 1, 3, 5, 7, 6, 4, 2]
-    assert post == [7, 5, 6, 3, 4, 1, 2, 0]
-    assert ccs == [pre]
-    assert not undirected_contains_cycle
-    # start from node 3 (arbitrarily chosen), neighbors in sorted order
-    (
-        parents,
-        dists,
-        pre,
-        post,
-        ccs,
-        undirected_contains_cycle,
-        directed_contains_cycle,
-    ) = dfs(
-        g,
+
+
+@pytest.mark.parametrize(
+    "seed_order, neighbor_order, exp_pre, exp_post", _as_params(B_ARY_CASES)
+)
+def test_dfs_b_ary_tree(
+    recursive: bool,
+    g_b_ary: Graph,
+    seed_order: Order | int,
+    neighbor_order: Order,
+    exp_pre: list[int],
+    exp_post: list[int],
+) -> None:
+    assert dfs(
+        g_b_ary,
         recursive=recursive,
-        seed_order=3,
-        neighbor_order=Order.SORTED,
-    )
-    exp_parents = {3: None, 5: 3, 6: 3, 7: 5, 1: 3, 4: 1, 0: 1, 2: 0}
-    exp_dists = {3: 0, 5: 1, 6: 1, 7: 2, 1: 1, 4: 2, 0: 2, 2: 3}
-    assert parents == exp_parents
-    assert dists == exp_dists
-    assert pre == [3, 1, 0, 2, 4, 5, 7, 6]
-    assert post == [2, 0, 4, 1, 7, 5, 6, 3]
-    assert ccs == [pre]
-    assert not undirected_contains_cycle
-    # now with neighbors in reverse order
-    (
-        parents,
-        dists,
-        pre,
-        post,
-        ccs,
-        undirected_contains_cycle,
-        directed_contains_cycle,
-    ) = dfs(
-        g,
+        seed_order=seed_order,
+        neighbor_order=neighbor_order,
+    ) == _get_tree_case_expected(B_ARY_PARENTS_AND_DISTS, exp_pre, exp_post)
+
+
+@pytest.mark.parametrize(
+    "seed_order, neighbor_order, exp_pre, exp_post",
+    _as_params(NEARLY_SPINDLY_B_ARY_CASES),
+)
+def test_dfs_nearly_spindly_b_ary_tree(
+    recursive: bool,
+    g_nearly_spindly_b_ary: Graph,
+    seed_order: Order | int,
+    neighbor_order: Order,
+    exp_pre: list[int],
+    exp_post: list[int],
+) -> None:
+    assert dfs(
+        g_nearly_spindly_b_ary,
         recursive=recursive,
-        seed_order=3,
-        neighbor_order=Order.REVERSE_SORTED,
+        seed_order=seed_order,
+        neighbor_order=neighbor_order,
+    ) == _get_tree_case_expected(
+        NEARLY_SPINDLY_B_ARY_PARENTS_AND_DISTS, exp_pre, exp_post
     )
-    assert parents == exp_parents
-    assert dists == exp_dists
-    assert pre == [3, 6, 5, 7, 1, 4, 0, 2]
-    assert post == [6, 7, 5, 4, 2, 0, 1, 3]
-    assert ccs == [pre]
-    assert not undirected_contains_cycle
 
+
+def test_dfs_nearly_spindly_b_ary_tree_9_nodes(recursive: bool) -> None:
     # Another nearly spindly binary tree but with 9 nodes
     g = GraphFactory.create_nearly_spindly_b_ary_tree(2, 9)
-    (
-        parents,
-        dists,
-        pre,
-        post,
-        ccs,
-        undirected_contains_cycle,
-        directed_contains_cycle,
-    ) = dfs(
+    pre = [0, 1, 3, 5, 7, 8, 6, 4, 2]
+    assert dfs(
         g, recursive=recursive, seed_order=Order.SORTED, neighbor_order=Order.SORTED
+    ) == DFSResult(
+        {0: None, 1: 0, 2: 0, 3: 1, 4: 1, 5: 3, 6: 3, 7: 5, 8: 5},
+        {0: 0, 1: 1, 2: 1, 3: 2, 4: 2, 5: 3, 6: 3, 7: 4, 8: 4},
+        pre,
+        [7, 8, 5, 6, 3, 4, 1, 2, 0],
+        [pre],
+        False,
+        True,
     )
-    assert parents == {0: None, 1: 0, 2: 0, 3: 1, 4: 1, 5: 3, 6: 3, 7: 5, 8: 5}
-    assert dists == {0: 0, 1: 1, 2: 1, 3: 2, 4: 2, 5: 3, 6: 3, 7: 4, 8: 4}
-    assert pre == [0, 1, 3, 5, 7, 8, 6, 4, 2]
-    assert post == [7, 8, 5, 6, 3, 4, 1, 2, 0]
-    assert ccs == [pre]
-    assert not undirected_contains_cycle
     # start from node 8, neighbors in sorted order
-    (
-        parents,
-        dists,
-        pre,
-        post,
-        ccs,
-        undirected_contains_cycle,
-        directed_contains_cycle,
-    ) = dfs(
+    pre = [8, 5, 3, 1, 0, 2, 4, 6, 7]
+    assert dfs(
         g,
         recursive=recursive,
         seed_order=8,
         neighbor_order=Order.SORTED,
+    ) == DFSResult(
+        {8: None, 5: 8, 7: 5, 3: 5, 6: 3, 1: 3, 4: 1, 0: 1, 2: 0},
+        {8: 0, 5: 1, 7: 2, 3: 2, 6: 3, 1: 3, 4: 4, 0: 4, 2: 5},
+        pre,
+        [2, 0, 4, 1, 6, 3, 7, 5, 8],
+        [pre],
+        False,
+        True,
     )
-    assert parents == {8: None, 5: 8, 7: 5, 3: 5, 6: 3, 1: 3, 4: 1, 0: 1, 2: 0}
-    assert dists == {8: 0, 5: 1, 7: 2, 3: 2, 6: 3, 1: 3, 4: 4, 0: 4, 2: 5}
-    assert pre == [8, 5, 3, 1, 0, 2, 4, 6, 7]
-    assert post == [2, 0, 4, 1, 6, 3, 7, 5, 8]
-    assert ccs == [pre]
-    assert not undirected_contains_cycle
 
+
+def test_dfs_nearly_spindly_3_ary_tree(recursive: bool) -> None:
     # See 10 node 3-ary example in create_nearly_spindly_b_ary_tree docstring
     g = GraphFactory.create_nearly_spindly_b_ary_tree(3, 10)
-    (
-        parents,
-        dists,
-        pre,
-        post,
-        ccs,
-        undirected_contains_cycle,
-        directed_contains_cycle,
-    ) = dfs(
-        g, recursive=recursive, seed_order=Order.SORTED, neighbor_order=Order.SORTED
-    )
     exp_parents = {0: None, 1: 0, 2: 0, 3: 0, 4: 1, 5: 1, 6: 1, 7: 4, 8: 4, 9: 4}
     exp_dists = {0: 0, 1: 1, 2: 1, 3: 1, 4: 2, 5: 2, 6: 2, 7: 3, 8: 3, 9: 3}
-    assert parents == exp_parents
-    assert dists == exp_dists
-    assert pre == [0, 1, 4, 7, 8, 9, 5, 6, 2, 3]
-    assert post == [7, 8, 9, 4, 5, 6, 1, 2, 3, 0]
-    assert ccs == [pre]
-    assert not undirected_contains_cycle
+    pre = [0, 1, 4, 7, 8, 9, 5, 6, 2, 3]
+    assert dfs(
+        g, recursive=recursive, seed_order=Order.SORTED, neighbor_order=Order.SORTED
+    ) == DFSResult(
+        exp_parents,
+        exp_dists,
+        pre,
+        [7, 8, 9, 4, 5, 6, 1, 2, 3, 0],
+        [pre],
+        False,
+        True,
+    )
 
     # Same with 11 nodes
     g = GraphFactory.create_nearly_spindly_b_ary_tree(3, 11)
-    (
-        parents,
-        dists,
-        pre,
-        post,
-        ccs,
-        undirected_contains_cycle,
-        directed_contains_cycle,
-    ) = dfs(
-        g, recursive=recursive, seed_order=Order.SORTED, neighbor_order=Order.SORTED
-    )
     exp_parents[10] = 7
     exp_dists[10] = 4
-    assert parents == exp_parents
-    assert dists == exp_dists
-    assert pre == [0, 1, 4, 7, 10, 8, 9, 5, 6, 2, 3]
-    assert post == [10, 7, 8, 9, 4, 5, 6, 1, 2, 3, 0]
-    assert ccs == [pre]
-    assert not undirected_contains_cycle
+    pre = [0, 1, 4, 7, 10, 8, 9, 5, 6, 2, 3]
+    assert dfs(
+        g, recursive=recursive, seed_order=Order.SORTED, neighbor_order=Order.SORTED
+    ) == DFSResult(
+        exp_parents,
+        exp_dists,
+        pre,
+        [10, 7, 8, 9, 4, 5, 6, 1, 2, 3, 0],
+        [pre],
+        False,
+        True,
+    )
 
     # Same with 12 nodes
     g = GraphFactory.create_nearly_spindly_b_ary_tree(3, 12)
-    (
-        parents,
-        dists,
-        pre,
-        post,
-        ccs,
-        undirected_contains_cycle,
-        directed_contains_cycle,
-    ) = dfs(
-        g, recursive=recursive, seed_order=Order.SORTED, neighbor_order=Order.SORTED
-    )
     exp_parents[11] = 7
     exp_dists[11] = 4
-    assert parents == exp_parents
-    assert dists == exp_dists
-    assert pre == [0, 1, 4, 7, 10, 11, 8, 9, 5, 6, 2, 3]
-    assert post == [10, 11, 7, 8, 9, 4, 5, 6, 1, 2, 3, 0]
-    assert ccs == [pre]
-    assert not undirected_contains_cycle
-
-    ### arbitrary custom tree
+    pre = [0, 1, 4, 7, 10, 11, 8, 9, 5, 6, 2, 3]
+    assert dfs(
+        g, recursive=recursive, seed_order=Order.SORTED, neighbor_order=Order.SORTED
+    ) == DFSResult(
+        exp_parents,
+        exp_dists,
+        pre,
+        [10, 11, 7, 8, 9, 4, 5, 6, 1, 2, 3, 0],
+        [pre],
+        False,
+        True,
+    )
+
+
+def test_dfs_custom_tree(recursive: bool) -> None:
+    # arbitrary custom tree
     g = Graph(
         nodes=range(10),
         edges=((0, 1), (1, 2), (2, 3), (3, 4), (0, 5), (5, 6), (6, 7), (0, 8), (8, 9)),
     )
-    (
-        parents,
-        dists,
-        pre,
-        post,
-        ccs,
-        undirected_contains_cycle,
-        directed_contains_cycle,
-    ) = dfs(
+    pre = [0, 1, 2, 3, 4, 5, 6, 7, 8, 9]
+    assert dfs(
         g, recursive=recursive, seed_order=Order.SORTED, neighbor_order=Order.SORTED
-    )
-    assert parents == {0: None, 1: 0, 5: 0, 8: 0, 2: 1, 3: 2, 4: 3, 6: 5, 7: 6, 9: 8}
-    assert dists == {0: 0, 1: 1, 5: 1, 8: 1, 2: 2, 3: 3, 4: 4, 6: 2, 7: 3, 9: 2}
-    assert pre == [0, 1, 2, 3, 4, 5, 6, 7, 8, 9]
-    assert post == [4, 3, 2, 1, 7, 6, 5, 9, 8, 0]
-    assert ccs == [pre]
-    assert not undirected_contains_cycle
-
-    # complete graphs (fully connected, so node 0 should just recurse fully in one pass)
-    k = random.randint(4, 10)
-    g = GraphFactory.create_complete_graph(k)
-    (
-        parents,
-        dists,
+    ) == DFSResult(
+        {0: None, 1: 0, 5: 0, 8: 0, 2: 1, 3: 2, 4: 3, 6: 5, 7: 6, 9: 8},
+        {0: 0, 1: 1, 5: 1, 8: 1, 2: 2, 3: 3, 4: 4, 6: 2, 7: 3, 9: 2},
         pre,
-        post,
-        ccs,
-        undirected_contains_cycle,
-        directed_contains_cycle,
-    ) = dfs(
-        g, recursive=recursive, seed_order=Order.SORTED, neighbor_order=Order.SORTED
+        [4, 3, 2, 1, 7, 6, 5, 9, 8, 0],
+        [pre],
+        False,
+        True,
     )
-    exp_path = list(range(k))
-    assert parents == {0: None, **{i: i - 1 for i in range(1, k)}}
-    assert dists == {0: 0, **{i: i for i in range(1, k)}}
-    assert pre == exp_path
-    assert post == exp_path[::-1]
-    assert ccs == [pre]
-    assert undirected_contains_cycle
 
+
+def test_dfs_look_ahead_graph(recursive: bool) -> None:
     # look ahead graph (see example in create_look_ahead_graph docstring)
     g = GraphFactory.create_look_ahead_graph(5, 2)
-    (
-        parents,
-        dists,
-        pre,
-        post,
-        ccs,
-        undirected_contains_cycle,
-        directed_contains_cycle,
-    ) = dfs(
+    pre = [0, 1, 2, 3, 4]
+    assert dfs(
         g, recursive=recursive, seed_order=Order.SORTED, neighbor_order=Order.SORTED
+    ) == DFSResult(
+        {0: None, 1: 0, 2: 1, 3: 2, 4: 3},
+        {0: 0, 1: 1, 2: 2, 3: 3, 4: 4},
+        pre,
+        pre[::-1],
+        [pre],
+        True,
+        True,
     )
-    assert parents == {0: None, 1: 0, 2: 1, 3: 2, 4: 3}
-    assert dists == {0: 0, 1: 1, 2: 2, 3: 3, 4: 4}
-    assert pre == [0, 1, 2, 3, 4]
-    assert post == pre[::-1]
-    assert ccs == [pre]
-    assert undirected_contains_cycle
     # now start from 2
-    (
-        parents,
-        dists,
+    pre = [2, 0, 1, 3, 4]
+    assert dfs(
+        g, recursive=recursive, seed_order=2, neighbor_order=Order.SORTED
+    ) == DFSResult(
+        {2: None, 0: 2, 1: 0, 3: 1, 4: 3},
+        {2: 0, 0: 1, 1: 2, 3: 3, 4: 4},
         pre,
-        post,
-        ccs,
-        undirected_contains_cycle,
-        directed_contains_cycle,
-    ) = dfs(g, recursive=recursive, seed_order=2, neighbor_order=Order.SORTED)
-    assert parents == {2: None, 0: 2, 1: 0, 3: 1, 4: 3}
-    assert dists == {2: 0, 0: 1, 1: 2, 3: 3, 4: 4}
-    assert pre == [2, 0, 1, 3, 4]
-    assert post == pre[::-1]
-    assert ccs == [pre]
-    assert undirected_contains_cycle
+        pre[::-1],
+        [pre],
+        True,
+        True,
+    )
     # now start from 3
-    (
-        parents,
-        dists,
+    pre = [3, 1, 0, 2, 4]
+    assert dfs(
+        g, recursive=recursive, seed_order=3, neighbor_order=Order.SORTED
+    ) == DFSResult(
+        {3: None, 1: 3, 0: 1, 2: 0, 4: 2},
+        {3: 0, 1: 1, 0: 2, 2: 3, 4: 4},
         pre,
-        post,
-        ccs,
-        undirected_contains_cycle,
-        directed_contains_cycle,
-    ) = dfs(g, recursive=recursive, seed_order=3, neighbor_order=Order.SORTED)
-    assert parents == {3: None, 1: 3, 0: 1, 2: 0, 4: 2}
-    assert dists == {3: 0, 1: 1, 0: 2, 2: 3, 4: 4}
-    assert pre == [3, 1, 0, 2, 4]
-    assert post == pre[::-1]
-    assert ccs == [pre]
-    assert undirected_contains_cycle
-
-    # cycles
+        pre[::-1],
+        [pre],
+        True,
+        True,
+    )
+
+
+def test_dfs_cycle(recursive: bool) -> None:
     g = GraphFactory.create_cycle(4)
     # start at 0, neighbors in sorted order
-    (
-        parents,
-        dists,
-        pre,
-        post,
-        ccs,
-        undirected_contains_cycle,
-        directed_contains_cycle,
-    ) = dfs(
+    pre = [0, 1, 2, 3]
+    assert dfs(
         g, recursive=recursive, seed_order=Order.SORTED, neighbor_order=Order.SORTED
+    ) == DFSResult(
+        {0: None, **{i: i - 1 for i in range(1, 4)}},
+        {0: 0, **{i: i for i in range(1, 4)}},
+        pre,
+        pre[::-1],
+        [pre],
+        True,
+        True,
     )
-    assert parents == {0: None, **{i: i - 1 for i in range(1, 4)}}
-    assert dists == {0: 0, **{i: i for i in range(1, 4)}}
-    assert pre == [0, 1, 2, 3]
-    assert post == pre[::-1]
-    assert ccs == [pre]
-    assert undirected_contains_cycle
     # start at 1, neighbors in sorted order
-    (
-        parents,
-        dists,
+    pre = [1, 0, 3, 2]
+    assert dfs(
+        g, recursive=recursive, seed_order=1, neighbor_order=Order.SORTED
+    ) == DFSResult(
+        {1: None, 0: 1, 3: 0, 2: 3},
+        {1: 0, 0: 1, 3: 2, 2: 3},
         pre,
-        post,
-        ccs,
-        undirected_contains_cycle,
-        directed_contains_cycle,
-    ) = dfs(g, recursive=recursive, seed_order=1, neighbor_order=Order.SORTED)
-    assert parents == {1: None, 0: 1, 3: 0, 2: 3}
-    assert dists == {1: 0, 0: 1, 3: 2, 2: 3}
-    assert pre == [1, 0, 3, 2]
-    assert post == pre[::-1]
-    assert ccs == [pre]
-    assert undirected_contains_cycle
+        pre[::-1],
+        [pre],
+        True,
+        True,
+    )
     # start at 3, neighbors in sorted order
-    (
-        parents,
-        dists,
+    pre = [3, 0, 1, 2]
+    assert dfs(
+        g, recursive=recursive, seed_order=3, neighbor_order=Order.SORTED
+    ) == DFSResult(
+        {3: None, 0: 3, 1: 0, 2: 1},
+        {3: 0, 0: 1, 1: 2, 2: 3},
         pre,
-        post,
-        ccs,
-        undirected_contains_cycle,
-        directed_contains_cycle,
-    ) = dfs(g, recursive=recursive, seed_order=3, neighbor_order=Order.SORTED)
-    assert parents == {3: None, 0: 3, 1: 0, 2: 1}
-    assert dists == {3: 0, 0: 1, 1: 2, 2: 3}
-    assert pre == [3, 0, 1, 2]
-    assert post == pre[::-1]
-    assert ccs == [pre]
-    assert undirected_contains_cycle
-
-    ### custom cylic graphs
-    # two uneven cycles with 0 at center. I.e., a lopsided figure-8
-    g = Graph(
-        nodes=range(9),
-        edges=(
-            (0, 1),
-            (1, 2),
-            (2, 3),
-            (3, 0),
-            (0, 4),
-            (4, 5),
-            (5, 6),
-            (6, 7),
-            (7, 8),
-            (8, 0),
-        ),
+        pre[::-1],
+        [pre],
+        True,
+        True,
     )
+
+
+def test_dfs_lopsided_figure_8(recursive: bool, g_lopsided_figure_8: Graph) -> None:
+    g = g_lopsided_figure_8
     # neighbors in order, so shorter cycle first
-    (
-        parents,
-        dists,
-        pre,
-        post,
-        ccs,
-        undirected_contains_cycle,
-        directed_contains_cycle,
-    ) = dfs(
+    pre = [0, 1, 2, 3, 4, 5, 6, 7, 8]
+    assert dfs(
         g, recursive=recursive, seed_order=Order.SORTED, neighbor_order=Order.SORTED
+    ) == DFSResult(
+        {0: None, 1: 0, 2: 1, 3: 2, 4: 0, 5: 4, 6: 5, 7: 6, 8: 7},
+        {0: 0, 1: 1, 2: 2, 3: 3, 4: 1, 5: 2, 6: 3, 7: 4, 8: 5},
+        pre,
+        [3, 2, 1, 8, 7, 6, 5, 4, 0],
+        [pre],
+        True,
+        True,
     )
-    assert parents == {0: None, 1: 0, 2: 1, 3: 2, 4: 0, 5: 4, 6: 5, 7: 6, 8: 7}
-    assert dists == {0: 0, 1: 1, 2: 2, 3: 3, 4: 1, 5: 2, 6: 3, 7: 4, 8: 5}
-    assert pre == [0, 1, 2, 3, 4, 5, 6, 7, 8]
-    assert post == [3, 2, 1, 8, 7, 6, 5, 4, 0]
-    assert ccs == [pre]
-    assert undirected_contains_cycle
     # neighbors in reverse order, so larger cycle first, and in the opposite direction
-    (
-        parents,
-        dists,
-        pre,
-        post,
-        ccs,
-        undirected_contains_cycle,
-        directed_contains_cycle,
-    ) = dfs(
+    pre = [0, 8, 7, 6, 5, 4, 3, 2, 1]
+    assert dfs(
         g,
         recursive=recursive,
         seed_order=Order.SORTED,
         neighbor_order=Order.REVERSE_SORTED,
+    ) == DFSResult(
+        {0: None, 8: 0, 7: 8, 6: 7, 5: 6, 4: 5, 3: 0, 2: 3, 1: 2},
+        {0: 0, 8: 1, 7: 2, 6: 3, 5: 4, 4: 5, 3: 1, 2: 2, 1: 3},
+        pre,
+        [4, 5, 6, 7, 8, 1, 2, 3, 0],
+        [pre],
+        True,
+        True,
     )
-    assert parents == {0: None, 8: 0, 7: 8, 6: 7, 5: 6, 4: 5, 3: 0, 2: 3, 1: 2}
-    assert dists == {0: 0, 8: 1, 7: 2, 6: 3, 5: 4, 4: 5, 3: 1, 2: 2, 1: 3}
-    assert pre == [0, 8, 7, 6, 5, 4, 3, 2, 1]
-    assert post == [4, 5, 6, 7, 8, 1, 2, 3, 0]
-    assert ccs == [pre]
-    assert undirected_contains_cycle
     # now start at 8
-    (
-        parents,
-        dists,
-        pre,
-        post,
-        ccs,
-        undirected_contains_cycle,
-        directed_contains_cycle,
-    ) = dfs(
+    pre = [8, 7, 6, 5, 4, 0, 3, 2, 1]
+    assert dfs(
         g,
         recursive=recursive,
         seed_order=8,
         neighbor_order=Order.REVERSE_SORTED,
-    )
-    assert parents == {8: None, 7: 8, 6: 7, 5: 6, 4: 5, 0: 4, 3: 0, 2: 3, 1: 2}
-    assert dists == {8: 0, 7: 1, 6: 2, 5: 3, 4: 4, 0: 5, 3: 6, 2: 7, 1: 8}
-    assert pre == [8, 7, 6, 5, 4, 0, 3, 2, 1]
-    assert post == [1, 2, 3, 0, 4, 5, 6, 7, 8]
-    assert ccs == [pre]
-    assert undirected_contains_cycle
-
-    # add node 9, add 0-9 edge, start at 9
-    g.add_node(9)
-    g.add_edge((0, 9))
-    (
-        parents,
-        dists,
+    ) == DFSResult(
+        {8: None, 7: 8, 6: 7, 5: 6, 4: 5, 0: 4, 3: 0, 2: 3, 1: 2},
+        {8: 0, 7: 1, 6: 2, 5: 3, 4: 4, 0: 5, 3: 6, 2: 7, 1: 8},
         pre,
-        post,
-        ccs,
-        undirected_contains_cycle,
-        directed_contains_cycle,
-    ) = dfs(
+        [1, 2, 3, 0, 4, 5, 6, 7, 8],
+        [pre],
+        True,
+        True,
+    )
+
+
+def test_dfs_lopsided_figure_8_with_tail(
+    recursive: bool, g_lopsided_figure_8_with_tail: Graph
+) -> None:
+    # start at 9
+    g = g_lopsided_figure_8_with_tail
+    pre = [9, 0, 1, 2, 3, 4, 5, 6, 7, 8]
+    assert dfs(
         g,
         recursive=recursive,
         seed_order=Order.REVERSE_SORTED,
         neighbor_order=Order.SORTED,
+    ) == DFSResult(
+        {9: None, 0: 9, 1: 0, 2: 1, 3: 2, 4: 0, 5: 4, 6: 5, 7: 6, 8: 7},
+        {9: 0, 0: 1, 1: 2, 2: 3, 3: 4, 4: 2, 5: 3, 6: 4, 7: 5, 8: 6},
+        pre,
+        [3, 2, 1, 8, 7, 6, 5, 4, 0, 9],
+        [pre],
+        True,
+        True,
     )
-    assert parents == {9: None, 0: 9, 1: 0, 2: 1, 3: 2, 4: 0, 5: 4, 6: 5, 7: 6, 8: 7}
-    assert dists == {9: 0, 0: 1, 1: 2, 2: 3, 3: 4, 4: 2, 5: 3, 6: 4, 7: 5, 8: 6}
-    assert pre == [9, 0, 1, 2, 3, 4, 5, 6, 7, 8]
-    assert post == [3, 2, 1, 8, 7, 6, 5, 4, 0, 9]
-    assert ccs == [pre]
-    assert undirected_contains_cycle
 
-    # graph with a main line with cycles coming off of it
-    # we already have the current example, we can just add to that
-    # 9 - 0
-    # 0 has two cycles coming off it, using up nodes 1 through 8
-    # add nodes 10 and 11
-    # add a 3-cycle off of 11, using nodes 12 and 13
-    # add node 14;
-    # add 7-cycle off 14, using nodes 15, 16, 17, 18, 19, 20
-    g.add_nodes(range(10, 21))
-    g.add_edges(
-        (
-            (0, 10),
-            (10, 11),
-            (11, 12),  # start 3-cycle
-            (12, 13),
-            (13, 11),
-            (11, 14),
-            (14, 15),  # start 7-cycle
-            (15, 16),
-            (16, 17),
-            (17, 18),
-            (18, 19),
-            (19, 20),
-            (20, 14),
-        )
-    )
-    (
-        parents,
-        dists,
-        pre,
-        post,
-        ccs,
-        undirected_contains_cycle,
-        directed_contains_cycle,
-    ) = dfs(
+
+def test_dfs_cycles_off_main_line(
+    recursive: bool, g_cycles_off_main_line: Graph
+) -> None:
+    g = g_cycles_off_main_line
+    pre = [9, 0, 1, 2, 3, 4, 5, 6, 7, 8, 10, 11, 12, 13, 14, 15, 16, 17, 18, 19, 20]
+    assert dfs(
         g,
         recursive=recursive,
         seed_order=9,
         neighbor_order=Order.SORTED,
+    ) == DFSResult(
+        {
+            9: None,
+            0: 9,
+            1: 0,
+            2: 1,
+            3: 2,
+            4: 0,
+            5: 4,
+            6: 5,
+            7: 6,
+            8: 7,
+            10: 0,
+            11: 10,
+            12: 11,
+            13: 12,
+            14: 11,
+            15: 14,
+            16: 15,
+            17: 16,
+            18: 17,
+            19: 18,
+            20: 19,
+        },
+        {
+            9: 0,
+            0: 1,
+            1: 2,
+            2: 3,
+            3: 4,
+            4: 2,
+            5: 3,
+            6: 4,
+            7: 5,
+            8: 6,
+            10: 2,
+            11: 3,
+            12: 4,
+            13: 5,
+            14: 4,
+            15: 5,
+            16: 6,
+            17: 7,
+            18: 8,
+            19: 9,
+            20: 10,
+        },
+        pre,
+        [3, 2, 1, 8, 7, 6, 5, 4, 13, 12, 20, 19, 18, 17, 16, 15, 14, 11, 10, 0, 9],
+        [pre],
+        True,
+        True,
     )
-    assert parents == {
-        9: None,
-        0: 9,
-        1: 0,
-        2: 1,
-        3: 2,
-        4: 0,
-        5: 4,
-        6: 5,
-        7: 6,
-        8: 7,
-        10: 0,
-        11: 10,
-        12: 11,
-        13: 12,
-        14: 11,
-        15: 14,
-        16: 15,
-        17: 16,
-        18: 17,
-        19: 18,
-        20: 19,
-    }
-    assert dists == {
-        9: 0,
-        0: 1,
-        1: 2,
-        2: 3,
-        3: 4,
-        4: 2,
-        5: 3,
-        6: 4,
-        7: 5,
-        8: 6,
-        10: 2,
-        11: 3,
-        12: 4,
-        13: 5,
-        14: 4,
-        15: 5,
-        16: 6,
-        17: 7,
-        18: 8,
-        19: 9,
-        20: 10,
-    }
-    assert pre == [
-        9,
-        0,
-        1,
-        2,
-        3,
-        4,
-        5,
-        6,
-        7,
-        8,
-        10,
-        11,
-        12,
-        13,
-        14,
-        15,
-        16,
-        17,
-        18,
-        19,
-        20,
-    ]
-    assert post == [
-        3,
-        2,
-        1,
-        8,
-        7,
-        6,
-        5,
-        4,
-        13,
-        12,
-        20,
-        19,
-        18,
-        17,
-        16,
-        15,
-        14,
-        11,
-        10,
-        0,
-        9,
-    ]
-    assert ccs == [pre]
-    assert undirected_contains_cycle
 
-    # "nested" cycles
-    # 0-1-2-3-4-5-6-7-0
-    # 2-8-9-10-2
-    # 10-11-12-13-10
-    g = Graph(
-        nodes=range(14),
-        edges=(
-            (0, 1),
-            (1, 2),
-            (2, 3),
-            (3, 4),
-            (4, 5),
-            (5, 6),
-            (6, 7),
-            (7, 0),
-            (2, 8),
-            (8, 9),
-            (9, 10),
-            (10, 2),
-            (10, 11),
-            (11, 12),
-            (12, 13),
-            (13, 10),
-        ),
-    )
-    (
-        parents,
-        dists,
-        pre,
-        post,
-        ccs,
-        undirected_contains_cycle,
-        directed_contains_cycle,
-    ) = dfs(
-        g, recursive=recursive, seed_order=Order.SORTED, neighbor_order=Order.SORTED
+
+def test_dfs_nested_cycles(
+    recursive: bool, g_nested_cycles: Graph, exp_nested_cycles: DFSResult
+) -> None:
+    g = g_nested_cycles
+    assert (
+        dfs(
+            g, recursive=recursive, seed_order=Order.SORTED, neighbor_order=Order.SORTED
+        )
+        == exp_nested_cycles
     )
-    assert parents == {
-        0: None,
-        **{i: i - 1 for i in range(1, 8)},
-        8: 2,
-        **{i: i - 1 for i in range(9, 14)},
-    }
-    assert dists == {
-        0: 0,
-        **{i: i for i in range(1, 8)},
-        8: 3,
-        **{i: i - 5 for i in range(9, 14)},
-    }
-    assert pre == [0, 1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11, 12, 13]
-    assert post == [7, 6, 5, 4, 3, 13, 12, 11, 10, 9, 8, 2, 1, 0]
-    assert ccs == [pre]
-    assert undirected_contains_cycle
-    (
-        parents,
-        dists,
-        pre,
-        post,
-        ccs,
-        undirected_contains_cycle,
-        directed_contains_cycle,
-    ) = dfs(
+    pre = [0, 7, 6, 5, 4, 3, 2, 10, 13, 12, 11, 9, 8, 1]
+    assert dfs(
         g,
         recursive=recursive,
         seed_order=Order.SORTED,
         neighbor_order=Order.REVERSE_SORTED,
+    ) == DFSResult(
+        {
+            0: None,
+            7: 0,
+            6: 7,
+            5: 6,
+            4: 5,
+            3: 4,
+            2: 3,
+            10: 2,  # to go 13
+            13: 10,
+            12: 13,
+            11: 12,
+            9: 10,
+            8: 9,
+            1: 2,
+        },
+        {
+            0: 0,
+            7: 1,
+            6: 2,
+            5: 3,
+            4: 4,
+            3: 5,
+            2: 6,
+            10: 7,  # to go 13
+            13: 8,
+            12: 9,
+            11: 10,
+            9: 8,
+            8: 9,
+            1: 7,
+        },
+        pre,
+        [11, 12, 13, 8, 9, 10, 1, 2, 3, 4, 5, 6, 7, 0],
+        [pre],
+        True,
+        True,
     )
-    assert parents == {
-        0: None,
-        7: 0,
-        6: 7,
-        5: 6,
-        4: 5,
-        3: 4,
-        2: 3,
-        10: 2,  # to go 13
-        13: 10,
-        12: 13,
-        11: 12,
-        9: 10,
-        8: 9,
-        1: 2,
-    }
-    assert dists == {
-        0: 0,
-        7: 1,
-        6: 2,
-        5: 3,
-        4: 4,
-        3: 5,
-        2: 6,
-        10: 7,  # to go 13
-        13: 8,
-        12: 9,
-        11: 10,
-        9: 8,
-        8: 9,
-        1: 7,
-    }
-    assert pre == [0, 7, 6, 5, 4, 3, 2, 10, 13, 12, 11, 9, 8, 1]
-    assert post == [11, 12, 13, 8, 9, 10, 1, 2, 3, 4, 5, 6, 7, 0]
-    assert ccs == [pre]
-    assert undirected_contains_cycle
-
-    # test disjoint graphs (disconnected components)
-    g_spindly = GraphFactory.create_spindly_tree(3)
-    exp_parents_spindly = {0: None, 1: 0, 2: 1}
-    exp_dists_spindly = {0: 0, 1: 1, 2: 2}
-    exp_pre_spindly = list(range(3))
-    exp_post_spindly = exp_pre_spindly[::-1]
-    g_b_ary = GraphFactory.create_b_ary_tree(2, 2)
-    exp_parents_b_ary = {0: None, 1: 0, 2: 0, 3: 1, 4: 1, 5: 2, 6: 2}
-    exp_dists_b_ary = {0: 0, 1: 1, 2: 1, 3: 2, 4: 2, 5: 2, 6: 2}
-    exp_pre_b_ary = [0, 1, 3, 4, 2, 5, 6]
-    exp_post_b_ary = [3, 4, 1, 5, 6, 2, 0]
-    # See 8 node binary example in create_nearly_spindly_b_ary_tree docstring
-    g_nearly_spindly_b_ary = GraphFactory.create_nearly_spindly_b_ary_tree(2, 8)
-    exp_parents_nearly_spindly_b_ary = {
-        0: None,
-        1: 0,
-        2: 0,
-        3: 1,
-        4: 1,
-        5: 3,
-        6: 3,
-        7: 5,
-    }
-    exp_dists_nearly_spindly_b_ary = {
-        0: 0,
-        1: 1,
-        2: 1,
-        3: 2,
-        4: 2,
-        5: 3,
-        6: 3,
-        7: 4,
-    }
-    exp_pre_nearly_spindly_b_ary = [0, 1, 3, 5, 7, 6, 4, 2]
-    exp_post_nearly_spindly_b_ary = [7, 5, 6, 3, 4, 1, 2, 0]
-    g_custom = g  # above custom example
-    exp_parents_custom = {
-        0: None,
-        **{i: i - 1 for i in range(1, 8)},
-        8: 2,
-        **{i: i - 1 for i in range(9, 14)},
-    }
-    exp_dists_custom = {
-        0: 0,
-        **{i: i for i in range(1, 8)},
-        8: 3,
-        **{i: i - 5 for i in range(9, 14)},
-    }
-    exp_pre_custom = [0, 1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11, 12, 13]
-    exp_post_custom = [7, 6, 5, 4, 3, 13, 12, 11, 10, 9, 8, 2, 1, 0]
-    gs = (g_spindly, g_b_ary, g_nearly_spindly_b_ary, g_custom)
-    g_combined = GraphFactory.concat_int_graphs(gs)
-    exp_parents_seq = (
-        exp_parents_spindly,
-        exp_parents_b_ary,
-        exp_parents_nearly_spindly_b_ary,
-        exp_parents_custom,
+
+
+@pytest.fixture(scope="module")
+def g_disjoint(
+    g_spindly: Graph,
+    g_b_ary: Graph,
+    g_nearly_spindly_b_ary: Graph,
+    g_nested_cycles: Graph,
+) -> Graph:
+    # disjoint graphs (disconnected components)
+    return GraphFactory.concat_int_graphs(
+        (g_spindly, g_b_ary, g_nearly_spindly_b_ary, g_nested_cycles)
+    )
+
+
+@pytest.fixture(scope="module")
+def exp_disjoint(
+    exp_spindly: DFSResult,
+    exp_b_ary: DFSResult,
+    exp_nearly_spindly_b_ary: DFSResult,
+    exp_nested_cycles: DFSResult,
+) -> DFSResult:
+    # each component is traversed just like the graph on its own, with its nodes shifted
+    exps = (exp_spindly, exp_b_ary, exp_nearly_spindly_b_ary, exp_nested_cycles)
+    # node offset of each graph in g_disjoint
+    offsets = list(accumulate((len(exp.preorder) for exp in exps[:-1]), initial=0))
+    exp_ccs = [
+        [offset + node for node in exp.preorder] for exp, offset in zip(exps, offsets)
+    ]
+    # flatten the per-component results with chain, rather than updating/extending them one component at a time
+    exp_pre = list(chain.from_iterable(exp_ccs))
+    exp_post = list(
+        chain.from_iterable(
+            (offset + node for node in exp.postorder)
+            for exp, offset in zip(exps, offsets)
+        )
     )
-    exp_dists_seq = (
-        exp_dists_spindly,
-        exp_dists_b_ary,
-        exp_dists_nearly_spindly_b_ary,
-        exp_dists_custom,
+    exp_parents = dict(
+        chain.from_iterable(
+            (
+                (offset + node, offset + parent if parent is not None else None)
+                for node, parent in exp.parents.items()
+            )
+            for exp, offset in zip(exps, offsets)
+        )
     )
-    exp_pres = (
-        exp_pre_spindly,
-        exp_pre_b_ary,
-        exp_pre_nearly_spindly_b_ary,
-        exp_pre_custom,
+    exp_dists = dict(
+        chain.from_iterable(
+            ((offset + node, dist) for node, dist in exp.dists.items())
+            for exp, offset in zip(exps, offsets)
+        )
     )
-    exp_posts = (
-        exp_post_spindly,
-        exp_post_b_ary,
-        exp_post_nearly_spindly_b_ary,
-        exp_post_custom,
+    return DFSResult(
+        exp_parents,
+        exp_dists,
+        exp_pre,
+        exp_post,
+        exp_ccs,
+        any(exp.undirected_contains_cycle for exp in exps),
+        any(exp.directed_contains_cycle for exp in exps),
     )
-    lengths = [len(g) for g in gs]
-    exp_parents = {}
-    exp_dists = {}
-    exp_pre = []
-    exp_post = []
-    exp_ccs = []
-    for i, (pre, post, parents, dists) in enumerate(
-        zip(exp_pres, exp_posts, exp_parents_seq, exp_dists_seq)
-    ):
-        offset = sum(lengths[:i])
-        exp_parents.update(
-            {
-                offset + node: offset + parent if parent is not None else None
-                for node, parent in parents.items()
-            }
+
+
+def test_dfs_disjoint_graphs(
+    recursive: bool, g_disjoint: Graph, exp_disjoint: DFSResult
+) -> None:
+    assert (
+        dfs(
+            g_disjoint,
+            recursive=recursive,
+            seed_order=Order.SORTED,
+            neighbor_order=Order.SORTED,
         )
-        exp_dists.update({offset + node: dist for node, dist in dists.items()})
-        exp_pre.extend([offset + node for node in pre])
-        exp_post.extend([offset + node for node in post])
-        exp_ccs.append([offset + node for node in pre])
-    (
-        parents,
-        dists,
-        pre,
-        post,
-        ccs,
-        undirected_contains_cycle,
-        directed_contains_cycle,
-    ) = dfs(
-        g_combined,
-        recursive=recursive,
-        seed_order=Order.SORTED,
-        neighbor_order=Order.SORTED,
+        == exp_disjoint
     )
-    assert parents == exp_parents
-    assert dists == exp_dists
-    assert pre == exp_pre
-    assert post == exp_post
-    assert ccs == exp_ccs
-    assert undirected_contains_cycle
 
 
-@pytest.mark.parametrize("recursive", (True, False))
-def test_dfs_undirected(recursive: bool) -> None:
+@pytest.fixture(scope="module", params=TEST_GRAPH_SIZES)
+def n(request: pytest.FixtureRequest) -> int:
+    return request.param
+
+
+@pytest.fixture(scope="module")
+def nodes_sorted_and_reversed(n: int) -> tuple[list[int], list[int]]:
+    """range(n) as a list, in sorted then reverse sorted order. Shared by the expected-result fixtures below."""
+    return list(range(n)), list(range(n - 1, -1, -1))
+
+
+@pytest.fixture(scope="module")
+def exp_no_edges(
+    n: int, nodes_sorted_and_reversed: tuple[list[int], list[int]]
+) -> tuple[DFSResult, DFSResult]:
+    """Expected results on n nodes and 0 edges, with seeds in sorted, then reverse sorted, order."""
+    pre, pre_reversed = nodes_sorted_and_reversed
+    # every node is its own seed; dict.fromkeys builds these without a Python-level loop. They're the same for both
+    # seed orders (dicts compare equal regardless of insertion order)
+    parents = dict.fromkeys(range(n))
+    dists = dict.fromkeys(range(n), 0)
+    return (
+        DFSResult(
+            parents,
+            dists,
+            pre,
+            pre,
+            [[i] for i in pre],
+            False,
+            False,
+        ),
+        DFSResult(
+            parents,
+            dists,
+            pre_reversed,
+            pre_reversed,
+            [[i] for i in pre_reversed],
+            False,
+            False,
+        ),
+    )
+
+
+@pytest.fixture(scope="module")
+def exp_spindly_tree(
+    n: int, nodes_sorted_and_reversed: tuple[list[int], list[int]]
+) -> tuple[DFSResult, DFSResult]:
+    """Expected results on an n node spindly tree, with seeds in sorted, then reverse sorted, order."""
+    pre, pre_reversed = nodes_sorted_and_reversed
+    return (
+        DFSResult(
+            {0: None, **dict(zip(range(1, n), range(n - 1)))},
+            dict(zip(range(n), range(n))),
+            pre,
+            pre_reversed,  # on a path, the postorder is the reversed preorder
+            [pre],
+            False,
+            True,
+        ),
+        DFSResult(
+            {n - 1: None, **dict(zip(range(n - 1), range(1, n)))},
+            dict(zip(range(n), range(n - 1, -1, -1))),
+            pre_reversed,
+            pre,
+            [pre_reversed],
+            False,
+            True,
+        ),
+    )
+
+
+def test_dfs_no_edges(
+    recursive: bool, n: int, exp_no_edges: tuple[DFSResult, DFSResult]
+) -> None:
+    # generally: n nodes, 0 edges
+    g = Graph(nodes=n)
+    exp_sorted, exp_reverse_sorted = exp_no_edges
+    # seeds in sorted order
+    assert dfs(g, recursive=recursive, seed_order=Order.SORTED) == exp_sorted
+    # seeds in reverse sorted order
+    assert (
+        dfs(g, recursive=recursive, seed_order=Order.REVERSE_SORTED)
+        == exp_reverse_sorted
+    )
+
+
+def test_dfs_spindly_tree(
+    recursive: bool, n: int, exp_spindly_tree: tuple[DFSResult, DFSResult]
+) -> None:
+    # generally: n node spindly tree
+    g = GraphFactory.create_spindly_tree(n)
+    exp_sorted, exp_reverse_sorted = exp_spindly_tree
+    # in sorted order
+    assert dfs(g, recursive=recursive, seed_order=Order.SORTED) == exp_sorted
+    # in reverse sorted order
+    assert (
+        dfs(g, recursive=recursive, seed_order=Order.REVERSE_SORTED)
+        == exp_reverse_sorted
+    )
+    # branch from the middle
+    for dfs_root in sorted({1, n // 2, n - 1}):
+        to_left = list(range(dfs_root - 1, -1, -1))  # from middle to the left
+        to_right = list(range(dfs_root + 1, n))  # from middle to the right
+        # each is finished in the reverse of the order it's explored; both explore orders use these
+        to_left_reversed = list(range(dfs_root))
+        to_right_reversed = list(range(n - 1, dfs_root, -1))
+        # important that dfs_root is first; everything else is irrelevant
+        # built with zip over ranges, so dict() does the loop in C
+        exp_parents = {
+            dfs_root: None,
+            **dict(zip(range(dfs_root), range(1, dfs_root + 1))),
+            **dict(zip(range(dfs_root + 1, n), range(dfs_root, n - 1))),
+        }
+        exp_dists = {
+            dfs_root: 0,
+            **dict(zip(range(dfs_root), range(dfs_root, 0, -1))),
+            **dict(zip(range(dfs_root + 1, n), range(1, n - dfs_root))),
+        }
+        # explore left then right
+        pre = [dfs_root, *to_left, *to_right]
+        assert dfs(
+            g, recursive=recursive, seed_order=dfs_root, neighbor_order=Order.SORTED
+        ) == DFSResult(
+            exp_parents,
+            exp_dists,
+            pre,
+            [*to_left_reversed, *to_right_reversed, dfs_root],
+            [pre],
+            False,
+            True,
+        )
+        # explore right then left
+        pre = [dfs_root, *to_right, *to_left]
+        assert dfs(
+            g,
+            recursive=recursive,
+            seed_order=dfs_root,
+            neighbor_order=Order.REVERSE_SORTED,
+        ) == DFSResult(
+            exp_parents,
+            exp_dists,
+            pre,
+            [*to_right_reversed, *to_left_reversed, dfs_root],
+            [pre],
+            False,
+            True,
+        )
+
+
+@pytest.mark.parametrize("k", (4, 7, 10))
+def test_dfs_complete_graph(recursive: bool, k: int) -> None:
+    # complete graphs (fully connected, so node 0 should just recurse fully in one pass)
+    g = GraphFactory.create_complete_graph(k)
+    exp_path = list(range(k))
+    assert dfs(
+        g, recursive=recursive, seed_order=Order.SORTED, neighbor_order=Order.SORTED
+    ) == DFSResult(
+        {0: None, **dict(zip(range(1, k), range(k - 1)))},
+        dict(zip(range(k), range(k))),
+        exp_path,
+        exp_path[::-1],
+        [exp_path],
+        True,
+        True,
+    )
+
+
+def test_dfs_directed(recursive: bool) -> None:
+    # undirected_contains_cycle is meaningless for digraphs (and can differ between the implementations), so it's
+    # blanked out before comparing
     dg = Digraph(nodes=3, edges=((0, 1), (0, 2), (1, 2)))
-    (
-        parents,
-        dists,
-        pre,
-        post,
-        ccs,
-        undirected_contains_cycle,
-        directed_contains_cycle,
-    ) = dfs(
+    assert dfs(
         dg,
         recursive=recursive,
         seed_order=Order.SORTED,
         neighbor_order=Order.SORTED,
+    )._replace(undirected_contains_cycle=None) == DFSResult(
+        {0: None, 1: 0, 2: 1},
+        {0: 0, 1: 1, 2: 2},
+        [0, 1, 2],
+        [2, 1, 0],
+        [[0, 1, 2]],
+        None,
+        False,
     )
-    assert parents == {0: None, 1: 0, 2: 1}
-    assert dists == {0: 0, 1: 1, 2: 2}
-    assert pre == [0, 1, 2]
-    assert post == [2, 1, 0]
-    assert ccs == [[0, 1, 2]]
-    assert not directed_contains_cycle
 
     dg = Digraph(nodes=3, edges=((0, 1), (1, 2), (2, 0)))
-    (
-        parents,
-        dists,
-        pre,
-        post,
-        ccs,
-        undirected_contains_cycle,
-        directed_contains_cycle,
-    ) = dfs(
+    assert dfs(
         dg,
         recursive=recursive,
         seed_order=Order.SORTED,
         neighbor_order=Order.SORTED,
+    )._replace(undirected_contains_cycle=None) == DFSResult(
+        {0: None, 1: 0, 2: 1},
+        {0: 0, 1: 1, 2: 2},
+        [0, 1, 2],
+        [2, 1, 0],
+        [[0, 1, 2]],
+        None,
+        True,
     )
-    assert parents == {0: None, 1: 0, 2: 1}
-    assert dists == {0: 0, 1: 1, 2: 2}
-    assert pre == [0, 1, 2]
-    assert post == [2, 1, 0]
-    assert ccs == [[0, 1, 2]]
-    assert directed_contains_cycle
 
     dg = DigraphFactory.create_complete_digraph(4)
-    (
-        parents,
-        dists,
-        pre,
-        post,
-        ccs,
-        undirected_contains_cycle,
-        directed_contains_cycle,
-    ) = dfs(
+    assert dfs(
         dg,
         recursive=recursive,
         seed_order=Order.REVERSE_SORTED,
         neighbor_order=Order.REVERSE_SORTED,
+    )._replace(undirected_contains_cycle=None) == DFSResult(
+        {3: None, 2: 3, 1: 2, 0: 1},
+        {3: 0, 2: 1, 1: 2, 0: 3},
+        [3, 2, 1, 0],
+        [0, 1, 2, 3],
+        [[3, 2, 1, 0]],
+        None,
+        True,
     )
-    assert parents == {3: None, 2: 3, 1: 2, 0: 1}
-    assert dists == {3: 0, 2: 1, 1: 2, 0: 3}
-    assert pre == [3, 2, 1, 0]
-    assert post == [0, 1, 2, 3]
-    assert ccs == [[3, 2, 1, 0]]
-    assert directed_contains_cycle
+
+
+def test_dfs_get_neighbors(recursive: bool) -> None:
+    # traversing via in-neighbors is the same as traversing the reverse digraph
+    dg = Digraph(nodes=6, edges=((0, 1), (1, 2), (2, 0), (3, 1), (3, 4), (5, 4)))
+    for neighbor_order in (Order.SORTED, Order.REVERSE_SORTED):
+        assert dfs(
+            dg,
+            recursive=recursive,
+            neighbor_order=neighbor_order,
+            get_neighbors=dg.get_in_neighbors,
+        ) == dfs(reverse(dg), recursive=recursive, neighbor_order=neighbor_order)
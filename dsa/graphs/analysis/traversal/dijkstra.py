@@ -1,12 +1,16 @@
 import heapq
+import math
 from collections.abc import Hashable, Sequence
 
+import numpy as np
+
 from dsa.graphs.analysis.traversal.order import Order
 from dsa.graphs.analysis.traversal.utils import (
-    get_ordered_neighbors,
+    get_ordered_neighbors_getter,
     get_ordered_seed_nodes,
 )
 from dsa.graphs.graph import Graph
+from dsa.heaps.indexed_heap import IndexedHeap
 
 
 def dijkstra(
@@ -43,11 +47,11 @@ def dijkstra(
             as the distance order of the Dijkstra traversal.
         bool: if graph is undirected, True if graph contains cycle; False otherwise
     """
-    for edge in g.get_edges():
-        if g.get_weight(edge) < 0:
-            raise ValueError(
-                "Dijkstra should only be run on graphs with all non-negative edge weights."
-            )
+    # one C-level min over the stored weights, rather than a Python loop looking up (and canonicalizing) each edge
+    if g.get_min_edge_weight() < 0:
+        raise ValueError(
+            "Dijkstra should only be run on graphs with all non-negative edge weights."
+        )
     seed_nodes = get_ordered_seed_nodes(g, seed_order)
 
     parents = {}
@@ -115,31 +119,44 @@ def _dijkstra_from_approach_1(
     """
     parents = {u: None}
     dists = {u: 0}
-    # pq_entry_count is used so (1) PQ is stable (for testing) and (2) so nodes don't have to be comparable
+    # pq_entry_count is part of the key so the PQ is stable (for testing): ties are broken by when the node's dist was
+    # last updated
     pq_entry_count = 0
-    to_explore = [(0, pq_entry_count, u)]
-    heapq.heapify(to_explore)
+    to_explore = IndexedHeap()
+    to_explore.push(u, (0, pq_entry_count))
     pq_entry_count += 1
     distorder = []
     undirected_contains_cycle = False
+    # bind hot methods to locals once, so each of the O(n + m) loop iterations does a fast local lookup instead of
+    # an attribute lookup
+    to_explore_pop = to_explore.pop
+    to_explore_push_or_decrease_key = to_explore.push_or_decrease_key
+    reached_add = reached.add
+    distorder_append = distorder.append
+    get_weight = g.get_weight
+    get_ordered_neighbors = get_ordered_neighbors_getter(g, neighbor_order)
     while to_explore:
-        _, _, u = heapq.heappop(to_explore)
-        # if I used a update_priority on the priority queue, I wouldn't need to do this, since nodes would never get
-        # added twice to the priority queue. But since I just add with a lower priority instead of updating priority,
-        # I need this "continue if u in reached"
-        if u in reached:
-            continue
-        reached.add(u)
-        distorder.append(u)
-        for v in get_ordered_neighbors(g, u, neighbor_order):
-            w = g.get_weight((u, v))
+        # since the PQ supports decrease_key, a node is never in it twice, so there are no stale entries to skip. And
+        # once a node is popped, its dist is final (weights are non-negative), so it's never pushed again. Nodes
+        # reached from an earlier seed aren't in parents but are already settled, so they're skipped too.
+        _, u = to_explore_pop()
+        reached_add(u)
+        distorder_append(u)
+        # the same for every neighbor, so look them up once
+        parent = parents[u]
+        dist_u = dists[u]
+        for v in get_ordered_neighbors(u):
+            dist_v = dist_u + get_weight((u, v))
             if v in parents:
-                undirected_contains_cycle = undirected_contains_cycle or v != parents[u]
-            if v not in parents or dists[v] > dists[u] + w:
-                parents[v] = u
-                dists[v] = dists[u] + w
-                heapq.heappush(to_explore, (dists[v], pq_entry_count, v))
-                pq_entry_count += 1
+                undirected_contains_cycle = undirected_contains_cycle or v != parent
+                if dists[v] <= dist_v:
+                    continue
+            elif v in reached:
+                continue
+            parents[v] = u
+            dists[v] = dist_v
+            to_explore_push_or_decrease_key(v, (dist_v, pq_entry_count))
+            pq_entry_count += 1
     return parents, dists, distorder, undirected_contains_cycle
 
 
@@ -160,33 +177,95 @@ def _dijkstra_from_approach_2(
     """
     parents = {u: None}
     dists = {u: 0}
-    # pq_entry_count is used so (1) PQ is stable (for testing) and (2) so nodes don't have to be comparable
+    # pq_entry_count is part of the key so the PQ is stable (for testing): ties are broken by when the node's dist was
+    # last updated
     pq_entry_count = 0
-    to_explore = [(0, pq_entry_count, u)]
+    to_explore = IndexedHeap()
+    to_explore.push(u, (0, pq_entry_count))
     pq_entry_count += 1
     distorder = []
     reached.add(u)
     undirected_contains_cycle = False
-    actually_reached = (
-        set()
-    )  # only needed b/c priority queue doesn't have update priority feature
+    # bind hot methods to locals once, so each of the O(n + m) loop iterations does a fast local lookup instead of
+    # an attribute lookup
+    to_explore_pop = to_explore.pop
+    to_explore_push_or_decrease_key = to_explore.push_or_decrease_key
+    reached_add = reached.add
+    distorder_append = distorder.append
+    get_weight = g.get_weight
+    get_ordered_neighbors = get_ordered_neighbors_getter(g, neighbor_order)
     while to_explore:
-        _, _, u = heapq.heappop(to_explore)
-        # if I used a update_priority on the priority queue, I wouldn't need to do this, since nodes would never get
-        # added twice to the priority queue. But since I just add with a lower priority instead of updating priority,
-        # I need this "continue if u in actually_reached"
-        if u in actually_reached:
+        # since the PQ supports decrease_key, a node is never in it twice, so (unlike with a plain heapq heap) there's
+        # no need for a separate set of popped nodes to skip stale entries
+        _, u = to_explore_pop()
+        distorder_append(u)
+        # the same for every neighbor, so look them up once
+        parent = parents[u]
+        dist_u = dists[u]
+        for v in get_ordered_neighbors(u):
+            dist_v = dist_u + get_weight((u, v))
+            if v in parents:
+                undirected_contains_cycle = undirected_contains_cycle or v != parent
+                if dists[v] <= dist_v:
+                    continue
+            elif v in reached:
+                # reached from an earlier seed
+                continue
+            parents[v] = u
+            dists[v] = dist_v
+            to_explore_push_or_decrease_key(v, (dist_v, pq_entry_count))
+            pq_entry_count += 1
+            reached_add(v)
+    return parents, dists, distorder, undirected_contains_cycle
+
+
+def _dijkstra_from_csr(
+    indptr: np.ndarray, indices: np.ndarray, weights: np.ndarray, s: int
+) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Dijkstra from node index s over the CSR adjacency (indptr, indices), e.g., from Graph.get_csr(), where
+    weights[k] is the (non-negative) weight of the edge to indices[k].
+
+    Like _bfs_from_csr, nodes are indices here, so parents and dists are arrays indexed by node, rather than dicts
+    keyed by node. A node that isn't reached has parent -1 (as does s) and dist inf.
+
+    The PQ is a plain heapq heap of (dist, node) entries, with stale entries skipped when popped, rather than an
+    IndexedHeap: nodes are ints, so entries compare without a tie-breaking counter (ties go to the smaller index),
+    and heapq sifts in C, which beats keeping the heap small with decrease_key in Python.
+
+    Returns:
+        np.ndarray: parents array which encodes the traversal tree
+        np.ndarray: distance from s to each node
+        np.ndarray: distance order of the reached nodes
+    """
+    indptr = indptr.tolist()
+    indices = indices.tolist()
+    weights = weights.tolist()
+    n = len(indptr) - 1
+    parents = [-1] * n
+    dists = [math.inf] * n
+    dists[s] = 0
+    done = [False] * n
+    to_explore = [(0, s)]
+    distorder = []
+    heappush = heapq.heappush
+    heappop = heapq.heappop
+    distorder_append = distorder.append
+    while to_explore:
+        dist_u, u = heappop(to_explore)
+        if done[u]:
             continue
-        actually_reached.add(u)
-        distorder.append(u)
-        for v in get_ordered_neighbors(g, u, neighbor_order):
-            w = g.get_weight((u, v))
-            if v in reached:
-                undirected_contains_cycle = undirected_contains_cycle or v != parents[u]
-            if v not in reached or dists[v] > dists[u] + w:
+        done[u] = True
+        distorder_append(u)
+        for k in range(indptr[u], indptr[u + 1]):
+            v = indices[k]
+            dist_v = dist_u + weights[k]
+            if dist_v < dists[v]:
                 parents[v] = u
-                dists[v] = dists[u] + w
-                heapq.heappush(to_explore, (dists[v], pq_entry_count, v))
-                pq_entry_count += 1
-                reached.add(v)
-    return parents, dists, distorder, undirected_contains_cycle
+                dists[v] = dist_v
+                heappush(to_explore, (dist_v, v))
+    dtype = np.int32 if n < 2**31 else np.int64
+    return (
+        np.array(parents, dtype=dtype),
+        np.array(dists, dtype=np.float64),
+        np.array(distorder, dtype=dtype),
+    )
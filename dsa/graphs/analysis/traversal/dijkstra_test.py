@@ -1,9 +1,11 @@
+import math
 import random
 
 import pytest
 
-from dsa.graphs.analysis.traversal.dijkstra import dijkstra
+from dsa.graphs.analysis.traversal.dijkstra import _dijkstra_from_csr, dijkstra
 from dsa.graphs.analysis.traversal.order import Order
+from dsa.graphs.digraph import Digraph
 from dsa.graphs.graph import Graph
 from dsa.graphs.graph_factory import GraphFactory
 
@@ -948,3 +950,45 @@ def test_dijkstra(use_approach_1: bool) -> None:
     assert distorder == [0, 2, 1, 4, 3, 6, 5]
     assert ccs == [distorder]
     assert contains_cycle
+
+
+@pytest.mark.parametrize("use_approach_1", (True, False))
+def test_dijkstra_multi_seed_digraph(use_approach_1: bool) -> None:
+    # nodes reached from an earlier seed must not be re-explored from a later seed
+    g = Digraph(nodes=3, edges=((0, 1), (1, 2)))
+    parents, dists, distorder, ccs, _ = dijkstra(
+        g, seed_order=[1, 0, 2], use_approach_1=use_approach_1
+    )
+    assert parents == {1: None, 2: 1, 0: None}
+    assert dists == {1: 0, 2: 1, 0: 0}
+    assert distorder == [1, 2, 0]
+    assert ccs == [[1, 2], [0]]
+
+
+def test_dijkstra_negative_weights() -> None:
+    # even an edge that isn't on any shortest path makes the graph invalid
+    g = Graph(nodes=4, edges={(0, 1): 1, (2, 3): -1})
+    with pytest.raises(ValueError):
+        dijkstra(g)
+    g.set_weight((2, 3), 0)
+    parents, dists, *_ = dijkstra(g, seed_order=Order.SORTED)
+    assert parents == {0: None, 1: 0, 2: None, 3: 2}
+    assert dists == {0: 0, 1: 1, 2: 0, 3: 0}
+
+
+def test_dijkstra_from_csr() -> None:
+    # path 0 - 1 - 2 with a shortcut 0 - 2, plus isolated node 3
+    g = Graph(nodes=4, edges={(0, 1): 1, (1, 2): 2, (0, 2): 4})
+    parents, dists, distorder = _dijkstra_from_csr(*g.get_csr(), g.get_csr_weights(), 2)
+    assert parents.tolist() == [1, 2, -1, -1]
+    assert dists.tolist() == [3, 2, 0, math.inf]
+    assert distorder.tolist() == [2, 1, 0]
+
+    # same dists as dijkstra on a random graph
+    random.seed(0)
+    n = 100
+    edges = {tuple(sorted(random.sample(range(n), 2))) for _ in range(500)}
+    g = Graph(nodes=n, edges={edge: random.randint(0, 10) for edge in edges})
+    _, exp_dists, *_ = dijkstra(g, seed_order=0)
+    _, dists, distorder = _dijkstra_from_csr(*g.get_csr(), g.get_csr_weights(), 0)
+    assert {u: dists[u] for u in distorder.tolist()} == exp_dists
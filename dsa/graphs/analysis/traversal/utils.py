@@ -5,39 +5,71 @@ from dsa.graphs.graph import Graph
 
 
 def get_ordered_neighbors(
-    g: Graph, u: Hashable, neighbor_order: Order | Callable[[Hashable], int] | None
-) -> list[Hashable]:
-    vs = [v for v in g[u]]
-    if isinstance(neighbor_order, Order):
-        vs.sort(reverse=(neighbor_order == Order.REVERSE_SORTED))
-    elif isinstance(neighbor_order, Callable):
+    g: Graph,
+    u: Hashable,
+    neighbor_order: Order | Callable[[Hashable], int] | None,
+    get_neighbors: Callable[[Hashable], Sequence[Hashable]] | None = None,
+) -> Sequence[Hashable]:
+    """Returns the neighbors of u in neighbor_order; the neighbors are g[u], or get_neighbors(u) if given."""
+    if get_neighbors is None:
+        if isinstance(neighbor_order, Order):
+            # g caches sorted neighbors, so this doesn't re-sort on every traversal
+            return g.get_sorted_neighbors(
+                u, reverse=(neighbor_order == Order.REVERSE_SORTED)
+            )
+        vs = list(g[u])
+    else:
+        vs = list(get_neighbors(u))
+        if isinstance(neighbor_order, Order):
+            vs.sort(reverse=(neighbor_order == Order.REVERSE_SORTED))
+    if isinstance(neighbor_order, Callable):
         vs.sort(key=neighbor_order)
     return vs
 
 
+def get_ordered_neighbors_getter(
+    g: Graph, neighbor_order: Order | Callable[[Hashable], int] | None
+) -> Callable[[Hashable], Sequence[Hashable]]:
+    """Returns a Callable mapping a node u to get_ordered_neighbors(g, u, neighbor_order).
+
+    This resolves which kind of neighbor_order was given once, up front, so a traversal calling it for every node
+    doesn't redo the isinstance checks each time; the hot loop then only makes one plain call per node.
+    """
+    if neighbor_order == Order.SORTED:
+        return g.get_sorted_neighbors
+    if neighbor_order == Order.REVERSE_SORTED:
+        return lambda u: g.get_sorted_neighbors(u, reverse=True)
+    if isinstance(neighbor_order, Callable):
+        return lambda u: sorted(g[u], key=neighbor_order)
+    return g.__getitem__
+
+
 def get_ordered_seed_nodes(
     g: Graph, seed_order: Order | Hashable | Sequence[Hashable] | None
 ) -> list[Hashable]:
-    if isinstance(seed_order, Sequence) and (
-        len(seed_order) != len(g) or set(seed_order) != set(g.get_nodes())
-    ):
-        raise ValueError(
-            f"When providing seed_order as sequence, it must include every node in g exactly once. Received {seed_order=}. Expected {g.get_nodes()=}"
-        )
-    seed_nodes = list(g.get_nodes())
+    nodes = g.get_nodes()
+    if isinstance(seed_order, Order):
+        # g caches its sorted nodes, so repeated traversals of an unchanged graph don't re-sort them
+        return list(g.get_sorted_nodes(reverse=(seed_order == Order.REVERSE_SORTED)))
+    seed_nodes = list(nodes)
     if seed_order is None:
         return seed_nodes
-    if isinstance(seed_order, Order):
-        seed_nodes.sort(reverse=(seed_order == Order.REVERSE_SORTED))
-    elif isinstance(seed_order, Hashable):
+    if isinstance(seed_order, Hashable):
         seed_nodes = [
             seed_order,
-            *[node for node in g.get_nodes() if node != seed_order],
+            *[node for node in nodes if node != seed_order],
         ]
     elif isinstance(seed_order, Sequence):
-        if len(seed_order) != len(g) or set(seed_order) != set(g.get_nodes()):
+        # only hash seed_order once: it's a permutation of the nodes iff it has no duplicates, the right length, and
+        # only contains nodes of g (which g can check without building another set)
+        seed_set = set(seed_order)
+        if (
+            len(seed_order) != len(nodes)
+            or len(seed_set) != len(nodes)
+            or not all(node in g for node in seed_set)
+        ):
             raise ValueError(
-                f"When providing seed_order as sequence, it must include every node in g exactly once. Received {seed_order=}. Expected {g.get_nodes()=}"
+                f"When providing seed_order as sequence, it must include every node in g exactly once. Received {seed_order=}. Expected {nodes=}"
             )
         seed_nodes = seed_order
     return seed_nodes
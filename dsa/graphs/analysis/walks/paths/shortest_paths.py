@@ -1,8 +1,11 @@
 from collections.abc import Hashable
 
-from dsa.graphs.analysis.traversal.bfs import bfs
-from dsa.graphs.analysis.traversal.dijkstra import dijkstra
+import numpy as np
+
+from dsa.graphs.analysis.traversal.bfs import _bfs_from_csr
+from dsa.graphs.analysis.traversal.dijkstra import _dijkstra_from_csr
 from dsa.graphs.analysis.traversal_type import TraversalType
+from dsa.graphs.digraph import Digraph
 from dsa.graphs.graph import Graph
 
 
@@ -13,43 +16,136 @@ def get_shortest_paths(
     weighted: bool = True,
 ) -> dict[Hashable, Hashable]:
     """Returns paths from s to all reachable nodes via a parents dict"""
-    if all(g.get_weight(edge) >= 0 for edge in g.get_edges()):
+    g._validate_node(s)
+    if g.get_min_edge_weight() >= 0:
         if weighted:
-            parents, *_ = dijkstra(g)
+            parents = _dijkstra_shortest_paths(g, s)
         else:
-            parents, *_ = bfs(g)
+            parents = _bfs_shortest_paths(g, s)
     else:
         parents = _bellman_ford(g, s)
     return parents
 
 
+def _bfs_shortest_paths(g: Graph, s: Hashable) -> dict[Hashable, Hashable]:
+    """Unweighted shortest paths from s. This runs the array-based BFS on g's CSR adjacency, and only maps the parents
+    of the reached nodes back to nodes at the end."""
+    nodes = g.get_nodes()
+    indptr, indices = g.get_csr()
+    # the bottom-up steps need the reverse adjacency, which only an undirected graph's adjacency is on its own
+    if isinstance(g, Digraph):
+        parents, _, levelorder = _bfs_from_csr(
+            indptr, indices, g.get_node_to_index()[s], in_csr=g.get_in_csr()
+        )
+    else:
+        parents, _, levelorder = _bfs_from_csr(
+            indptr, indices, g.get_node_to_index()[s], symmetric=True
+        )
+    parents = parents.tolist()
+    return {
+        nodes[i]: nodes[parents[i]] if parents[i] != -1 else None
+        for i in levelorder.tolist()
+    }
+
+
+def _dijkstra_shortest_paths(g: Graph, s: Hashable) -> dict[Hashable, Hashable]:
+    """Weighted shortest paths from s, for non-negative weights. Like _bfs_shortest_paths, this runs the array-based
+    Dijkstra on g's CSR adjacency, and only maps the parents of the reached nodes back to nodes at the end.
+    """
+    nodes = g.get_nodes()
+    indptr, indices = g.get_csr()
+    weights = g.get_csr_weights()
+    parents, _, distorder = _dijkstra_from_csr(
+        indptr, indices, weights, g.get_node_to_index()[s]
+    )
+    parents = parents.tolist()
+    return {
+        nodes[i]: nodes[parents[i]] if parents[i] != -1 else None
+        for i in distorder.tolist()
+    }
+
+
 def _bellman_ford(g: Graph, s: Hashable) -> dict[Hashable, Hashable]:
-    eps = 10e-6
-    parents = {s: None}
-    dists = {s: 0}
-    for _ in range(len(g) - 1):
-        updated = _relax_all_edges(g, parents, dists, eps)
-        if not updated:
-            break
-    if not updated:
-        return parents
-    updated = _relax_all_edges(g, parents, dists, eps)
-    if updated:
+    """Bellman-Ford. This just converts g to int-indexed edge arrays, runs _bellman_ford_kernel on them, and maps the
+    resulting parents back to nodes.
+
+    Each edge (u, v) (both directions for an undirected graph) is stored once in the parallel arrays src, dst, and
+    weights, where src and dst come straight from g's CSR adjacency.
+    """
+    nodes = g.get_nodes()
+    indptr, dst = g.get_csr()
+    src = np.repeat(np.arange(len(nodes)), np.diff(indptr))
+    weights = g.get_csr_weights()
+    dists, parents = _bellman_ford_kernel(
+        src, dst, weights, len(nodes), g.get_node_to_index()[s]
+    )
+    return {
+        nodes[i]: nodes[parent] if parent != -1 else None
+        for i, parent in enumerate(parents.tolist())
+        if dists[i] < np.inf
+    }
+
+
+def _bellman_ford_kernel(
+    src: np.ndarray,
+    dst: np.ndarray,
+    weights: np.ndarray,
+    n: int,
+    s: int,
+    eps: float = 10e-6,
+) -> tuple[np.ndarray, np.ndarray]:
+    """Bellman-Ford over int-indexed edge arrays, from node s among nodes 0, ..., n-1; returns (dists, parents), where
+    unreached nodes have a dist of inf and, like s, a parent of -1.
+
+    Each round relaxes edges all at once via numpy, rather than in a Python loop over edges. A round only uses the
+    distances from the end of the previous round, which still finds all shortest paths within n - 1 rounds. If some
+    edge can still be relaxed after that, the reachable part of the graph contains a negative cycle.
+
+    An edge (u, v) can only relax v if dists[u] decreased in the previous round (otherwise, it was already tried with
+    the same dists[u], and dists[v] has only decreased since), so each round only considers edges out of nodes
+    updated in the previous round.
+    """
+    dists = np.full(n, np.inf)
+    dists[s] = 0
+    parents = np.full(n, -1, dtype=np.int64)
+    updated = np.zeros(n, dtype=bool)
+    updated[s] = True
+    for _ in range(n - 1):
+        updated = _relax_edges(src, dst, weights, dists, parents, updated, eps)
+        if not updated.any():
+            return dists, parents
+    if _relax_edges(src, dst, weights, dists, parents, updated, eps).any():
         raise ValueError(
             "Reachable part of the graph contains negative cycles; shortest paths are ill-defined"
         )
-    return parents
+    return dists, parents
 
 
-def _relax_all_edges(g: Graph, parents: dict, dists: dict, eps: float) -> bool:
-    updated = False
-    for u in g:
-        for v in g[u]:
-            w = g.get_weight((u, v))
-            curr_dist = dists[u] if u in dists else float("inf")
-            alt_dist = dists[v] + w if v in dists else float("inf")
-            if alt_dist < curr_dist - eps:
-                dists[u] = alt_dist
-                parents[u] = v
-                updated = True
+def _relax_edges(
+    src: np.ndarray,
+    dst: np.ndarray,
+    weights: np.ndarray,
+    dists: np.ndarray,
+    parents: np.ndarray,
+    updated: np.ndarray,
+    eps: float,
+) -> np.ndarray:
+    """Relaxes the edges out of updated nodes (updated is a boolean mask over nodes); returns the mask of nodes whose
+    dists (and parents) were updated."""
+    active = updated[src]
+    src, dst, weights = src[active], dst[active], weights[active]
+    alt_dists = dists[src] + weights
+    improved = alt_dists < dists[dst] - eps
+    src, dst, alt_dists = src[improved], dst[improved], alt_dists[improved]
+    # several edges can improve the same node; only keep the best one for each. Sort by node, then distance, and
+    # take the first edge of each run of the same node.
+    order = np.lexsort((alt_dists, dst))
+    dst = dst[order]
+    is_best = np.ones(len(dst), dtype=bool)
+    is_best[1:] = dst[1:] != dst[:-1]
+    best = order[is_best]
+    dists[dst[is_best]] = alt_dists[best]
+    parents[dst[is_best]] = src[best]
+    updated = np.zeros(len(updated), dtype=bool)
+    updated[dst] = True
     return updated
@@ -1,6 +1,7 @@
 import pytest
 
 from dsa.graphs.analysis.walks.paths.shortest_paths import get_shortest_paths
+from dsa.graphs.digraph import Digraph
 from dsa.graphs.graph import Graph
 
 
@@ -34,6 +35,18 @@ def test_get_shortest_paths() -> None:
         6: 3,
     }
 
+    # paths from a node other than the first
+    parents = get_shortest_paths(g, 6)
+    assert parents == {
+        6: None,
+        3: 6,
+        4: 3,
+        2: 4,
+        1: 4,
+        0: 2,
+        5: 4,
+    }
+
     parents = get_shortest_paths(g, 0, weighted=False)
     assert parents == {
         0: None,
@@ -45,7 +58,54 @@ def test_get_shortest_paths() -> None:
         6: 3,
     }
 
+    # paths from a node other than the first
+    parents = get_shortest_paths(g, 6, weighted=False)
+    assert parents == {
+        6: None,
+        3: 6,
+        4: 6,
+        1: 3,
+        2: 4,
+        5: 4,
+        0: 1,
+    }
+
+    # unknown source, for both the weighted and unweighted paths
+    for weighted in (True, False):
+        with pytest.raises(ValueError):
+            get_shortest_paths(g, 7, weighted=weighted)
+
+    # ties are broken the same way every run, even though neighbor sets iterate in hash order
+    for graph_type in (Graph, Digraph):
+        g2 = graph_type(
+            nodes="sabct",
+            edges=(
+                ("s", "a"),
+                ("s", "b"),
+                ("s", "c"),
+                ("a", "t"),
+                ("b", "t"),
+                ("c", "t"),
+            ),
+        )
+        assert get_shortest_paths(g2, "s", weighted=False)["t"] == "a"
+
     # negative edge causes negative cycle (since it's undirected), so it should fail
     g.set_weight((3, 6), -1)
     with pytest.raises(ValueError):
         get_shortest_paths(g, 0)
+
+
+def test_get_shortest_paths_negative_weights() -> None:
+    dg = Digraph(nodes=5, edges={(0, 1): 4, (0, 2): 1, (2, 1): -2, (1, 3): 1})
+    parents = get_shortest_paths(dg, 0)
+    # 4 is unreachable, so it has no parent entry
+    assert parents == {0: None, 1: 2, 2: 0, 3: 1}
+    with pytest.raises(ValueError):
+        get_shortest_paths(dg, "blah")
+
+    # negative cycle 1 -> 3 -> 1
+    dg.add_edge((3, 1))
+    dg.set_weight((3, 1), -2)
+    with pytest.raises(ValueError):
+        get_shortest_paths(dg, 0)
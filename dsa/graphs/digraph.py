@@ -1,5 +1,7 @@
 from collections.abc import Hashable, Iterable, Mapping, Sequence
 
+import numpy as np
+
 from dsa.graphs.graph import Graph
 
 
@@ -15,8 +17,11 @@ class Digraph(Graph):
         _nodes (Mapping[Hashable, Mapping]): see Graph
         _edges (Mapping[tuple[Hashable, Hashable], tuple[float, Mapping]]): see Graph
         _incident_edges (Mapping[Hashable, set]): see Graph
-        _out_edges (Mapping[Hashable, set]): Map from node to the out edges
-        _in_edges (Mapping[Hashable, set]): Map from node to the in edges
+        _out_neighbors (Mapping[Hashable, set]): Map from node u to its out-neighbors, i.e., each v with an edge u->v
+            - only v is stored, not the edge (u, v), since u is already the key
+        _in_neighbors (Mapping[Hashable, set]): Map from node v to its in-neighbors, i.e., each u with an edge u->v
+        _in_csr_cache (tuple[np.ndarray, np.ndarray] | None): Snapshot of the in-adjacency returned by get_in_csr, or
+            None if it needs to be rebuilt (i.e., a node or edge was added or removed since it was last built)
     """
 
     def __init__(
@@ -35,12 +40,17 @@ class Digraph(Graph):
     ) -> None:
         # parent sets up _nodes, _edges, and _incident_edges
         super().__init__(nodes, edges, name, skip_duplicate_edges)
-        # now we need to set up _out_edges and _in_edges
-        self._out_edges: Mapping[Hashable, set] = {node: set() for node in self._nodes}
-        self._in_edges: Mapping[Hashable, set] = {node: set() for node in self._nodes}
+        # now we need to set up _out_neighbors and _in_neighbors
+        self._out_neighbors: Mapping[Hashable, set] = {
+            node: set() for node in self._nodes
+        }
+        self._in_neighbors: Mapping[Hashable, set] = {
+            node: set() for node in self._nodes
+        }
         for u, v in self._edges:
-            self._out_edges[u].add((u, v))
-            self._in_edges[v].add((u, v))
+            self._out_neighbors[u].add(v)
+            self._in_neighbors[v].add(u)
+        self._in_csr_cache = None
 
     @classmethod
     def _deduplicate_undirected_edges(
@@ -56,8 +66,26 @@ class Digraph(Graph):
 
     def __getitem__(self, node: Hashable) -> Sequence[Hashable]:
         """Override __getitem__ since we want only out-neighbors, not in-neighbors."""
-        # KeyError desired if node not in self._out_edges
-        return [v for (u, v) in self._out_edges[node]]
+        # KeyError desired if node not in self._out_neighbors
+        return list(self._out_neighbors[node])
+
+    def get_in_neighbors(self, node: Hashable) -> Sequence[Hashable]:
+        """Like __getitem__, but for in-neighbors; i.e., the neighbors of node in the reverse of this digraph."""
+        # KeyError desired if node not in self._in_neighbors
+        return list(self._in_neighbors[node])
+
+    def get_in_csr(self) -> tuple[np.ndarray, np.ndarray]:
+        """Like get_csr, but for in-neighbors; i.e., the CSR adjacency of the reverse of this digraph, with nodes
+        indexed the same way as in get_csr.
+
+        get_csr (the out-adjacency) and this are the forward and reverse views that index-based algorithms need to
+        walk edges in either direction, e.g., the bottom-up steps of _bfs_from_csr.
+        """
+        if self._in_csr_cache is None:
+            self._in_csr_cache = self._construct_csr(
+                [self.get_in_neighbors(v) for v in self.get_nodes()]
+            )
+        return self._in_csr_cache
 
     def _get_canonical_edge(
         self, edge: tuple[Hashable, Hashable]
@@ -72,56 +100,29 @@ class Digraph(Graph):
 
     def add_node(self, node: Hashable) -> None:
         super().add_node(node)
-        self._out_edges[node] = set()
-        self._in_edges[node] = set()
+        self._out_neighbors[node] = set()
+        self._in_neighbors[node] = set()
+        self._in_csr_cache = None
 
     def add_edge(self, edge: tuple[Hashable, Hashable]) -> None:
         super().add_edge(edge)
         u, v = edge
-        self._out_edges[u].add((u, v))
-        self._in_edges[v].add((u, v))
+        self._out_neighbors[u].add(v)
+        self._in_neighbors[v].add(u)
+        self._in_csr_cache = None
 
     def remove_edge(self, edge: tuple[Hashable, Hashable]) -> None:
         """Removes edge if present; errors if not present"""
         super().remove_edge(edge)
         u, v = edge
-        self._out_edges[u].remove((u, v))
-        self._in_edges[v].remove((u, v))
+        self._out_neighbors[u].remove(v)
+        self._in_neighbors[v].remove(u)
+        self._in_csr_cache = None
 
     def get_out_degree(self, u: Hashable) -> int:
         self._validate_node(u)
-        return len(self._out_edges[u])
+        return len(self._out_neighbors[u])
 
     def get_in_degree(self, u: Hashable) -> int:
         self._validate_node(u)
-        return len(self._in_edges[u])
-
-    @property
-    def A(self, node_order: list[Hashable] | None = None) -> list[list[int]]:
-        # TODO cache for efficiency, but invalidate when graph is modified?
-        if node_order is not None and len(node_order) != len(self):
-            raise ValueError(
-                f"If specifying node_order, it must include every node exactly once"
-            )
-        if node_order is None:
-            try:
-                nodes = sorted(self._nodes)
-            except TypeError:
-                raise ValueError(
-                    "Must provide node_order since nodes are not sortable."
-                )
-        else:
-            if len(node_order) != len(self):
-                raise ValueError(
-                    f"If specifying node_order, it must include every node exactly once"
-                )
-            nodes = node_order
-        n = len(nodes)
-        A = [[0 for _ in range(n)] for _ in range(n)]
-        node_to_index = {}
-        for index, node in enumerate(nodes):
-            node_to_index[node] = index
-        for u, v in self.get_edges():
-            i, j = node_to_index[u], node_to_index[v]
-            A[j][i] = 1
-        return A
+        return len(self._in_neighbors[u])
@@ -379,6 +379,54 @@ class TestGraph:
                 else:
                     assert not g.is_edge((u, v))
 
+    def test_get_sorted_neighbors(self) -> None:
+        g = Digraph(nodes=4, edges=((0, 2), (0, 3), (0, 1)))
+        assert g.get_sorted_neighbors(0) == (1, 2, 3)
+        assert g.get_sorted_neighbors(0, reverse=True) == (1, 2, 3)[::-1]
+        assert g.get_sorted_neighbors(3) == ()
+        with pytest.raises(KeyError):
+            g.get_sorted_neighbors(4)
+        # cached sorted neighbors must be updated when edges change
+        g.remove_edge((0, 2))
+        assert g.get_sorted_neighbors(0) == (1, 3)
+        g.add_edge((0, 2))
+        assert g.get_sorted_neighbors(0) == (1, 2, 3)
+
+    def test_get_in_neighbors(self) -> None:
+        g = Digraph(nodes=4, edges=((0, 2), (1, 2), (2, 3)))
+        assert sorted(g.get_in_neighbors(2)) == [0, 1]
+        assert g.get_in_neighbors(3) == [2]
+        assert g.get_in_neighbors(0) == []
+        with pytest.raises(KeyError):
+            g.get_in_neighbors(4)
+
+    def test_get_in_csr(self) -> None:
+        g = Digraph(nodes=3, edges=((0, 2), (1, 2), (2, 0)))
+        indptr, indices = g.get_in_csr()
+        assert indptr.tolist() == [0, 1, 1, 3]
+        assert indices.tolist() == [2, 0, 1]
+        # cached until the graph changes
+        assert g.get_in_csr() is g.get_in_csr()
+        g.add_edge((0, 1))
+        assert g.get_in_csr()[0].tolist() == [0, 1, 2, 4]
+        g.remove_edge((1, 2))
+        assert g.get_in_csr()[0].tolist() == [0, 1, 2, 3]
+        g.add_node(3)
+        assert g.get_in_csr()[0].tolist() == [0, 1, 2, 3, 3]
+
+    def test_get_csr_weights(self) -> None:
+        # A->B and B->A are different edges, with their own weights
+        g = Digraph(nodes=3, edges={(0, 1): 2, (1, 0): 3, (1, 2): 4})
+        indptr, indices = g.get_csr()
+        weights = g.get_csr_weights()
+        assert indptr.tolist() == [0, 1, 3, 3]
+        assert indices[0] == 1 and weights[0] == 2
+        assert dict(zip(indices[1:3].tolist(), weights[1:3].tolist())) == {0: 3, 2: 4}
+        g.set_weight((1, 0), 5)
+        assert sorted(g.get_csr_weights().tolist()) == [2, 4, 5]
+        g.remove_edge((0, 1))
+        assert sorted(g.get_csr_weights().tolist()) == [4, 5]
+
     def test_A(self) -> None:
         # TODO test node_order
         g = Digraph(3)
@@ -2,6 +2,10 @@ import math
 from collections.abc import Collection, Hashable, Iterable, Iterator, Mapping, Sequence
 from typing import Any
 
+import numpy as np
+
+from dsa.utils import get_key_to_index
+
 
 class Graph:
     """Represents an undirected graph.
@@ -10,7 +14,7 @@ class Graph:
     becomes annoying. I could create a node class, but I'm going to follow networkx library's approach of just having a node be
     any hashable object (except that None is not allowed).
 
-    NOTE: for now, there is some "leakage" where mutable data can be exposed, e.g., via __iter__ and get_nodes.
+    NOTE: for now, there is some "leakage" where mutable data can be exposed, e.g., via get_edges.
 
     Restrictions:
         - No multple/parallel edges
@@ -26,6 +30,19 @@ class Graph:
             - _incident_edges will have the exact same nodes as _nodes, even nodes with no neighbors
             - NOTE: this does contain redundant information that is already present, but this adjacency set is useful for fast
                 lookup of neighbors. Note that an edge (u,v) will manifest as v being a neighbor u and u being a neighbor of v
+        _nodes_cache (tuple[Hashable, ...] | None): Snapshot of the nodes returned by get_nodes, or None if it needs to
+            be rebuilt (i.e., a node was added since it was last built)
+        _node_to_index_cache (dict[Hashable, int] | None): Map from each node to its index in get_nodes(), or None if
+            it needs to be rebuilt (i.e., a node was added since it was last built)
+        _sorted_nodes_cache (tuple[tuple, tuple] | None): The nodes in sorted and in reverse sorted order, or None if
+            they need to be re-sorted (i.e., a node was added since they were last sorted)
+        _sorted_neighbors_cache (dict[Hashable, tuple[tuple, tuple]]): Map from node to its neighbors in sorted and in
+            reverse sorted order; only present for nodes whose sorted neighbors have been requested since an edge
+            incident on them was last added or removed
+        _csr_cache (tuple[np.ndarray, np.ndarray] | None): Snapshot of the adjacency returned by get_csr, or None if it
+            needs to be rebuilt (i.e., a node or edge was added or removed since it was last built)
+        _csr_weights_cache (np.ndarray | None): Snapshot of the edge weights returned by get_csr_weights, or None if it
+            needs to be rebuilt (i.e., get_csr's snapshot was invalidated or a weight was set since it was last built)
     """
 
     DEFAULT_EDGE_WEIGHT: float = 1
@@ -45,6 +62,12 @@ class Graph:
         skip_duplicate_edges: bool = False,
     ) -> None:
         self.name = name or ""
+        self._nodes_cache = None
+        self._node_to_index_cache = None
+        self._sorted_nodes_cache = None
+        self._sorted_neighbors_cache = {}
+        self._csr_cache = None
+        self._csr_weights_cache = None
         self._set_and_validate_nodes(nodes)
         self._set_and_validate_edges(edges, skip_duplicate_edges)
         self._incident_edges = Graph._construct_incident_edges(self._nodes, self._edges)
@@ -56,14 +79,16 @@ class Graph:
         # handle None case
         if nodes is None:
             nodes = {}
-        # handle int case: convert to iterable from 0...n-1
+        # handle int case: nodes 0...n-1
         if isinstance(nodes, int):
             if nodes < 0:
                 raise ValueError("Graph must have a non-negative number of nodes.")
-            nodes = range(nodes)
+            # fast path: 0...n-1 can't contain duplicates or None, so skip the per-node validation below
+            self._nodes = {node: {} for node in range(nodes)}
+            return
         # handle Iterable[Hashable] case: convert to mapping (Mapping is also Iterable, so instead of checking
         # isinstance of Iterable, check not isinstance of Mapping)
-        if nodes and not isinstance(nodes, Mapping):
+        if not isinstance(nodes, Mapping):
             # nodes is Iterable[Hashable]; convert to Mapping format
             # use temp nodes_map name to not override 'nodes' name
             nodes_map: Mapping[Hashable, Mapping] = {}
@@ -224,8 +249,108 @@ class Graph:
             neighbors.append(v if u == node else u)
         return neighbors
 
-    def get_nodes(self) -> Collection[Hashable]:
-        return self._nodes
+    def get_sorted_neighbors(
+        self, node: Hashable, reverse: bool = False
+    ) -> Sequence[Hashable]:
+        """Returns the neighbors of node in sorted (or reverse sorted) order.
+
+        The sorted neighbors are cached until an edge incident on node is added or removed, so repeated traversals
+        of an unchanged graph only pay for the sort once.
+        """
+        # KeyError desired if node not in self (via __getitem__)
+        if node not in self._sorted_neighbors_cache:
+            neighbors = tuple(sorted(self[node]))
+            # cache both orders so neither has to be copied per call
+            self._sorted_neighbors_cache[node] = (neighbors, neighbors[::-1])
+        return self._sorted_neighbors_cache[node][reverse]
+
+    def get_nodes(self) -> tuple[Hashable, ...]:
+        """Returns a (cached) snapshot of the nodes; the snapshot is only rebuilt after nodes are added."""
+        if self._nodes_cache is None:
+            self._nodes_cache = tuple(self._nodes)
+        return self._nodes_cache
+
+    def get_node_to_index(self) -> dict[Hashable, int]:
+        """Returns a (cached) map from each node to its index in get_nodes(), which is also how get_csr identifies
+        nodes; like get_nodes, it's only rebuilt after nodes are added. Don't modify it.
+        """
+        if self._node_to_index_cache is None:
+            self._node_to_index_cache = get_key_to_index(self.get_nodes())
+        return self._node_to_index_cache
+
+    def get_sorted_nodes(self, reverse: bool = False) -> tuple[Hashable, ...]:
+        """Returns the nodes in sorted (or reverse sorted) order.
+
+        Like get_sorted_neighbors, the sorted nodes are cached (until a node is added), so repeated traversals of an
+        unchanged graph with sorted seeds only pay for the sort once.
+        """
+        if self._sorted_nodes_cache is None:
+            nodes = tuple(sorted(self._nodes))
+            self._sorted_nodes_cache = (nodes, nodes[::-1])
+        return self._sorted_nodes_cache[reverse]
+
+    def get_csr(self) -> tuple[np.ndarray, np.ndarray]:
+        """Returns a (cached) snapshot of the adjacency in CSR format (indptr, indices), where each node is identified
+        by its index in get_nodes().
+
+        The neighbors of the node with index i are indices[indptr[i]:indptr[i+1]], in increasing order. Unlike
+        the neighbor lists from __getitem__, these are contiguous int arrays, so index-based algorithms can scan them
+        without hashing nodes. The arrays are read-only, since they're shared by every caller until the graph changes.
+        """
+        if self._csr_cache is None:
+            self._csr_cache = self._construct_csr([self[u] for u in self.get_nodes()])
+        return self._csr_cache
+
+    def _construct_csr(
+        self, neighbor_lists: Sequence[Sequence[Hashable]]
+    ) -> tuple[np.ndarray, np.ndarray]:
+        """Returns the (read-only) CSR adjacency (indptr, indices) where neighbor_lists[i] holds the neighbors of the
+        node with index i in get_nodes().
+
+        The neighbor lists come from sets, so their order depends on hashing and can change from run to run. Each
+        row is sorted by index so that index-based algorithms break ties the same way every time.
+        """
+        n = len(neighbor_lists)
+        node_to_index = self.get_node_to_index()
+        indptr = np.zeros(n + 1, dtype=np.int64)
+        np.cumsum([len(vs) for vs in neighbor_lists], out=indptr[1:])
+        indices = np.fromiter(
+            (node_to_index[v] for vs in neighbor_lists for v in vs),
+            dtype=np.int64,
+            count=indptr[-1],
+        )
+        # sort by index within each row, in one call instead of one per row
+        rows = np.repeat(np.arange(n), np.diff(indptr))
+        indices = indices[np.lexsort((indices, rows))]
+        indptr.flags.writeable = False
+        indices.flags.writeable = False
+        return indptr, indices
+
+    def get_csr_weights(self) -> np.ndarray:
+        """Returns a (cached) float array of edge weights parallel to get_csr()'s indices, i.e., weights[k] is the
+        weight of the edge from the node with index i to the node with index indices[k], where
+        indptr[i] <= k < indptr[i+1].
+
+        Like get_csr, this is read-only and shared by every caller until the graph (or a weight) changes, so weighted
+        index-based algorithms don't have to look up (and canonicalize) every edge themselves.
+        """
+        if self._csr_weights_cache is None:
+            nodes = self.get_nodes()
+            indptr, indices = self.get_csr()
+            edges = self._edges
+            # an undirected edge is stored as (u, v) or (v, u), so check both; a directed edge is always (u, v)
+            weights = np.fromiter(
+                (
+                    (edges.get((nodes[i], nodes[j])) or edges[(nodes[j], nodes[i])])[0]
+                    for i in range(len(nodes))
+                    for j in indices[indptr[i] : indptr[i + 1]].tolist()
+                ),
+                dtype=np.float64,
+                count=len(indices),
+            )
+            weights.flags.writeable = False
+            self._csr_weights_cache = weights
+        return self._csr_weights_cache
 
     def get_edges(self, node: Hashable = None) -> Collection[tuple[Hashable, Hashable]]:
         """If node is not None, gets all edges incident on node; otherwise, gets all edges in graph.
@@ -264,6 +389,10 @@ class Graph:
             raise ValueError(f"Unknown edge {edge}")
         return self._edges[edge][0]
 
+    def get_min_edge_weight(self) -> float:
+        """Returns the smallest weight of any edge in the graph, or inf if there are no edges."""
+        return min((weight for weight, _ in self._edges.values()), default=math.inf)
+
     def add_node(self, node: Hashable, attributes: Mapping | None = None) -> None:
         """Adds node if not present and not None; errors if already present"""
         if node is None:
@@ -271,6 +400,11 @@ class Graph:
         if node in self._nodes:
             raise ValueError(f"Node {node=} already present in graph")
         self._nodes[node] = attributes
+        self._nodes_cache = None
+        self._node_to_index_cache = None
+        self._sorted_nodes_cache = None
+        self._csr_cache = None
+        self._csr_weights_cache = None
         self._incident_edges[node] = set()
 
     def add_nodes(self, nodes: Iterable[Hashable]) -> None:
@@ -289,6 +423,10 @@ class Graph:
         self._edges[edge] = (Graph.DEFAULT_EDGE_WEIGHT, attributes)
         self._incident_edges[u].add(edge)
         self._incident_edges[v].add(edge)
+        self._sorted_neighbors_cache.pop(u, None)
+        self._sorted_neighbors_cache.pop(v, None)
+        self._csr_cache = None
+        self._csr_weights_cache = None
 
     def add_edges(self, edges: Iterable[tuple[Hashable, Hashable]]) -> None:
         for edge in edges:
@@ -305,6 +443,10 @@ class Graph:
         del self._edges[edge]
         self._incident_edges[u].remove(edge)
         self._incident_edges[v].remove(edge)
+        self._sorted_neighbors_cache.pop(u, None)
+        self._sorted_neighbors_cache.pop(v, None)
+        self._csr_cache = None
+        self._csr_weights_cache = None
 
     # TODO test
     def remove_edges(self, edges: Iterable[tuple[Hashable, Hashable]]) -> None:
@@ -320,6 +462,7 @@ class Graph:
         # can't update tuple, need to reassign
         _, attrs = self._edges[edge]
         self._edges[edge] = (weight, attrs)
+        self._csr_weights_cache = None
 
     def get_degree(self, u: Hashable) -> int:
         self._validate_node(u)
@@ -334,7 +477,7 @@ class Graph:
             )
         if node_order is None:
             try:
-                nodes = sorted(self._nodes)
+                nodes = self.get_sorted_nodes()
             except TypeError:
                 raise ValueError(
                     "Must provide node_order since nodes are not sortable."
@@ -346,14 +489,20 @@ class Graph:
                 )
             nodes = node_order
         n = len(nodes)
-        A = [[0 for _ in range(n)] for _ in range(n)]
-        node_to_index = {}
-        for index, node in enumerate(nodes):
-            node_to_index[node] = index
-        for u, v in self.get_edges():
-            i, j = node_to_index[u], node_to_index[v]
-            A[j][i] = A[i][j] = 1
-        return A
+        node_to_index = {node: index for index, node in enumerate(nodes)}
+        # the (cached) CSR adjacency already has every edge as int index pairs, just in get_nodes() order, so remap
+        # those to this order, and set every edge's entry with one numpy scatter instead of a Python loop. Since CSR
+        # lists each neighbor of each node, A[j][i] = 1 for each (i, j) in it covers both directions of an undirected
+        # edge, and only u -> v (as A[v][u]) for a directed one, so this also works as is for Digraph.
+        to_index = np.fromiter(
+            (node_to_index[node] for node in self.get_nodes()), dtype=np.int64, count=n
+        )
+        indptr, indices = self.get_csr()
+        i = to_index[np.repeat(np.arange(n), np.diff(indptr))]
+        j = to_index[indices]
+        A = np.zeros((n, n), dtype=np.uint8)
+        A[j, i] = 1
+        return A.tolist()
 
     def get_default_index_in_A(self, u: Hashable) -> int:
         self._validate_node(u)
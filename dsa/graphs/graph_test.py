@@ -1,3 +1,4 @@
+import math
 import random
 from collections.abc import Callable, Iterable, Mapping
 
@@ -300,13 +301,21 @@ class TestGraph:
         g.add_node(0)
         assert len(g) == 1
         assert 0 in g
+        assert g.get_nodes() == (0,)
         with pytest.raises(ValueError):
             g.add_node(0)
         g.add_node(1)
         assert len(g) == 2
         assert 0 in g
         assert 1 in g
+        # cached nodes snapshot must be rebuilt after adding a node
+        assert g.get_nodes() == (0, 1)
         self._test_iter(g, 2)
+        # graphs constructed with no nodes must also support adding nodes
+        for nodes in (0, [], range(0)):
+            g = Graph(nodes=nodes)
+            g.add_node(0)
+            assert g.get_nodes() == (0,)
 
     def test_add_edge(self) -> None:
         # invalid edges
@@ -374,6 +383,92 @@ class TestGraph:
                 else:
                     assert not g.is_edge((u, v))
 
+    def test_get_sorted_neighbors(self) -> None:
+        g = Graph(nodes=4, edges=((0, 2), (0, 3), (0, 1)))
+        assert g.get_sorted_neighbors(0) == (1, 2, 3)
+        assert g.get_sorted_neighbors(0, reverse=True) == (1, 2, 3)[::-1]
+        assert g.get_sorted_neighbors(3) == (0,)
+        with pytest.raises(KeyError):
+            g.get_sorted_neighbors(4)
+        # cached sorted neighbors must be updated when edges change
+        g.remove_edge((0, 2))
+        assert g.get_sorted_neighbors(0) == (1, 3)
+        g.add_edge((0, 2))
+        assert g.get_sorted_neighbors(0) == (1, 2, 3)
+
+    def test_get_sorted_nodes(self) -> None:
+        g = Graph(nodes=(2, 0, 1))
+        assert g.get_sorted_nodes() == (0, 1, 2)
+        assert g.get_sorted_nodes(reverse=True) == (2, 1, 0)
+        # cached until a node is added
+        assert g.get_sorted_nodes() is g.get_sorted_nodes()
+        g.add_node(-1)
+        assert g.get_sorted_nodes() == (-1, 0, 1, 2)
+        g.add_node("blah")
+        with pytest.raises(TypeError):
+            g.get_sorted_nodes()
+
+    def test_get_node_to_index(self) -> None:
+        g = Graph(nodes="abc")
+        assert g.get_node_to_index() == {"a": 0, "b": 1, "c": 2}
+        # cached until a node is added
+        assert g.get_node_to_index() is g.get_node_to_index()
+        g.add_node("d")
+        node_to_index = g.get_node_to_index()
+        assert node_to_index == {"a": 0, "b": 1, "c": 2, "d": 3}
+        assert all(g.get_nodes()[i] == node for node, i in node_to_index.items())
+
+    def test_get_csr(self) -> None:
+        g = Graph(nodes="abcd", edges=(("a", "b"), ("a", "c")))
+        indptr, indices = g.get_csr()
+        assert indptr.tolist() == [0, 2, 3, 4, 4]
+        # each row is sorted by index, whatever order the neighbor sets iterate in
+        assert indices.tolist() == [1, 2, 0, 0]
+        # cached until the graph changes
+        assert g.get_csr() is g.get_csr()
+        with pytest.raises(ValueError):
+            indices[0] = 3
+        g.add_edge(("c", "d"))
+        indptr, indices = g.get_csr()
+        assert indptr.tolist() == [0, 2, 3, 5, 6]
+        g.add_node("e")
+        indptr, indices = g.get_csr()
+        assert indptr.tolist() == [0, 2, 3, 5, 6, 6]
+        g.remove_edge(("a", "b"))
+        indptr, indices = g.get_csr()
+        assert indptr.tolist() == [0, 1, 1, 3, 4, 4]
+
+    def test_get_csr_weights(self) -> None:
+        g = Graph(nodes="abc", edges={("a", "b"): 2, ("c", "a"): 3})
+        indptr, indices = g.get_csr()
+        weights = g.get_csr_weights()
+        # each undirected edge's weight shows up in both directions
+        nodes = g.get_nodes()
+        assert {
+            (nodes[i], nodes[j]): weight
+            for i in range(len(nodes))
+            for j, weight in zip(
+                indices[indptr[i] : indptr[i + 1]].tolist(),
+                weights[indptr[i] : indptr[i + 1]].tolist(),
+            )
+        } == {("a", "b"): 2, ("b", "a"): 2, ("a", "c"): 3, ("c", "a"): 3}
+        # cached until the graph or a weight changes
+        assert g.get_csr_weights() is weights
+        with pytest.raises(ValueError):
+            weights[0] = 1
+        g.set_weight(("a", "c"), 4)
+        assert sorted(g.get_csr_weights().tolist()) == [2, 2, 4, 4]
+        g.add_edge(("b", "c"))
+        assert sorted(g.get_csr_weights().tolist()) == [1, 1, 2, 2, 4, 4]
+
+    def test_get_min_edge_weight(self) -> None:
+        g = Graph(nodes=3)
+        assert g.get_min_edge_weight() == math.inf
+        g = Graph(nodes=3, edges={(0, 1): 2, (1, 2): 5})
+        assert g.get_min_edge_weight() == 2
+        g.set_weight((2, 1), -1)
+        assert g.get_min_edge_weight() == -1
+
     def test_A(self) -> None:
         # TODO test node_order
         g = Graph(3)
@@ -4,6 +4,6 @@ from dsa.graphs.digraph import Digraph
 def reverse(dg: Digraph) -> Digraph:
     """Returns a new digraph which is the same as the input but with all edge directions reversed."""
     return Digraph(
-        nodes=dg.get_nodes(),
+        nodes={node: dg.get_node_attrs(node) for node in dg},
         edges={(v, u): tup for (u, v), tup in dg.get_edges().items()},
     )
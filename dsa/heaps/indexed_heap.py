@@ -0,0 +1,120 @@
+from collections.abc import Hashable
+from typing import Any
+
+
+class IndexedHeap:
+    """Binary min heap of items keyed by priority, holding at most one entry per item, with decrease_key.
+
+    A plain heapq heap can't find an item to lower its priority, so the usual workaround is to push a duplicate entry
+    with the lower priority and skip the stale entry when it's eventually popped. That lets the heap grow to one entry
+    per push instead of one per item. Here, positions tracks where each item is in the heap, so decrease_key can update
+    the item's entry in place and sift it up.
+
+    The keys and items are stored in two parallel lists (rather than one list of (key, item) pairs), so sifting only
+    ever compares keys, and items don't have to be comparable.
+
+    Attributes:
+        keys (list[Any]): The heap of keys; keys[i] is the key of items[i]. Keys must be mutually comparable
+        items (list[Hashable]): Item at each heap slot
+        positions (dict[Hashable, int]): Map from item to its index in keys and items
+    """
+
+    def __init__(self) -> None:
+        self.keys = []
+        self.items = []
+        self.positions = {}
+
+    def __len__(self) -> int:
+        return len(self.items)
+
+    def __contains__(self, item: Hashable) -> bool:
+        return item in self.positions
+
+    def push(self, item: Hashable, key: Any) -> None:
+        if item in self.positions:
+            raise ValueError(f"Item is already in the heap: {item=}")
+        self.keys.append(key)
+        self.items.append(item)
+        self.positions[item] = len(self.items) - 1
+        self._sift_up(len(self.items) - 1)
+
+    def decrease_key(self, item: Hashable, key: Any) -> None:
+        if item not in self.positions:
+            raise ValueError(f"Item is not in the heap: {item=}")
+        i = self.positions[item]
+        if self.keys[i] < key:
+            raise ValueError(
+                f"New key {key=} is larger than the current key {self.keys[i]}"
+            )
+        self.keys[i] = key
+        self._sift_up(i)
+
+    def push_or_decrease_key(self, item: Hashable, key: Any) -> None:
+        """Pushes item if it isn't in the heap; otherwise, decreases its key."""
+        if item in self.positions:
+            self.decrease_key(item, key)
+        else:
+            self.push(item, key)
+
+    def pop(self) -> tuple[Any, Hashable]:
+        """Removes and returns the (key, item) pair with the smallest key."""
+        if not self.items:
+            raise ValueError("Cannot pop from an empty heap.")
+        keys = self.keys
+        items = self.items
+        min_key = keys[0]
+        min_item = items[0]
+        del self.positions[min_item]
+        # move the last entry to the root, then sift it down to where it belongs
+        last_key = keys.pop()
+        last_item = items.pop()
+        if items:
+            keys[0] = last_key
+            items[0] = last_item
+            self.positions[last_item] = 0
+            self._sift_down(0)
+        return min_key, min_item
+
+    def _sift_up(self, i: int) -> None:
+        """Moves the entry at index i up until its parent's key is no larger than its key."""
+        keys = self.keys
+        items = self.items
+        positions = self.positions
+        key = keys[i]
+        item = items[i]
+        # instead of swapping at each level, shift parents down into the hole and write the entry once at the end
+        while i > 0:
+            parent = (i - 1) >> 1
+            if not key < keys[parent]:
+                break
+            keys[i] = keys[parent]
+            items[i] = items[parent]
+            positions[items[i]] = i
+            i = parent
+        keys[i] = key
+        items[i] = item
+        positions[item] = i
+
+    def _sift_down(self, i: int) -> None:
+        """Moves the entry at index i down until neither child's key is smaller than its key."""
+        keys = self.keys
+        items = self.items
+        positions = self.positions
+        n = len(keys)
+        key = keys[i]
+        item = items[i]
+        child = 2 * i + 1
+        while child < n:
+            # pick the smaller child
+            if child + 1 < n and keys[child + 1] < keys[child]:
+                child += 1
+            if not keys[child] < key:
+                break
+            keys[i] = keys[child]
+            items[i] = items[child]
+            positions[items[i]] = i
+            i = child
+            child = 2 * i + 1
+        keys[i] = key
+        items[i] = item
+        positions[item] = i
@@ -0,0 +1,70 @@
+import random
+
+import pytest
+
+from dsa.heaps.indexed_heap import IndexedHeap
+
+
+class TestIndexedHeap:
+    def test_push_and_pop(self) -> None:
+        heap = IndexedHeap()
+        assert len(heap) == 0
+        with pytest.raises(ValueError):
+            heap.pop()
+
+        heap.push("c", 3)
+        heap.push("a", 1)
+        heap.push("b", 2)
+        assert len(heap) == 3
+        assert "a" in heap
+        assert "d" not in heap
+        with pytest.raises(ValueError):
+            heap.push("a", 0)  # duplicate item
+
+        assert heap.pop() == (1, "a")
+        assert "a" not in heap
+        assert heap.pop() == (2, "b")
+        assert heap.pop() == (3, "c")
+        assert len(heap) == 0
+
+        # items don't have to be comparable, only keys do
+        heap.push(12, 1)
+        heap.push("blah", 0)
+        assert heap.pop() == (0, "blah")
+        assert heap.pop() == (1, 12)
+
+    def test_decrease_key(self) -> None:
+        heap = IndexedHeap()
+        with pytest.raises(ValueError):
+            heap.decrease_key("a", 0)  # not in heap
+        for item, key in (("a", 1), ("b", 2), ("c", 3), ("d", 4)):
+            heap.push(item, key)
+        with pytest.raises(ValueError):
+            heap.decrease_key("b", 5)  # larger key
+        heap.decrease_key("d", 0)
+        heap.decrease_key("c", 3)  # same key is fine
+        heap.push_or_decrease_key("b", -1)
+        heap.push_or_decrease_key("e", 2)
+        assert len(heap) == 5
+        assert [heap.pop() for _ in range(5)] == [
+            (-1, "b"),
+            (0, "d"),
+            (1, "a"),
+            (2, "e"),
+            (3, "c"),
+        ]
+
+    def test_random(self) -> None:
+        # compare against sorting: each item ends up with its smallest key
+        random.seed(0)
+        heap = IndexedHeap()
+        exp_keys = {}
+        for _ in range(1000):
+            item = random.randrange(100)
+            key = random.random()
+            if item not in exp_keys or key < exp_keys[item]:
+                heap.push_or_decrease_key(item, key)
+                exp_keys[item] = key
+        assert len(heap) == len(exp_keys)
+        popped = [heap.pop() for _ in range(len(exp_keys))]
+        assert popped == sorted((key, item) for item, key in exp_keys.items())